@@ -4,96 +4,105 @@ Document Sorter MVP
 Webapp für automatische Dokumentensortierung mit DeepSeek R3
 """
 
+import importlib.util
+import logging
 import os
-import time
-from flask import Flask, render_template, request
-from app.pdf import PDFProcessor, PDFPreviewGenerator
-from app.ai import DocumentClassifier, PromptManager
-from app.directory import DirectoryManager, CategoryManager
-from app.api import documents_bp, directories_bp, monitoring_bp
-# Math learning removed as requested
-from app.api.batch import batch_bp
-from app.api.templates import templates_bp
-from app.api.workflows import workflows_bp
-from app.monitoring import get_logger, ErrorReporter, LogAggregator
+import random
+import sys
+from functools import cache
+from flask import Response, render_template, request
+from app.directory import CategoryManager
+from app.factory import create_app
+from app.monitoring import get_logger, ErrorReporter
 from app.monitoring.performance_tracker import get_performance_tracker
-from app.error_handlers import register_error_handlers
 from app.production_config import config_manager
-from app.middleware import register_middleware
+from app.middleware import get_client_ip
 
 # Import centralized configuration
 from app.settings import config, CONFIG
 
 
-app = Flask(__name__, static_folder='static')
-
-# Initialize production configuration
-config_manager.initialize_app(app)
-
-# Register global error handlers
-register_error_handlers(app)
-
-# Register performance and security middleware
-register_middleware(app)
-
-# Register blueprints
-app.register_blueprint(documents_bp)
-app.register_blueprint(directories_bp)
-app.register_blueprint(monitoring_bp)
-# Math blueprint removed
-app.register_blueprint(batch_bp)
-app.register_blueprint(templates_bp)
-app.register_blueprint(workflows_bp)
-
 # Monitoring Services initialisieren
 logger = get_logger('document_sorter')
 error_reporter = ErrorReporter()
-log_aggregator = LogAggregator()
 performance_tracker = get_performance_tracker()
 
 # Request Logging und Performance Tracking Middleware
-request_start_times = {}
+# Erfolgreiche Antworten werden nur stichprobenartig geloggt, Fehler immer
+RESPONSE_LOG_SAMPLE_RATE = 0.1
 
-@app.before_request
+# Werden von der Middleware in deren einzigem before/after_request-Hook aufgerufen,
+# die auch Startzeit (g.start_ns) und Dauer misst
 def log_request_info():
-    request_start_times[request.path] = time.time()
-    logger.info("HTTP Request received",
-               method=request.method,
-               path=request.path,
-               remote_addr=request.remote_addr,
-               user_agent=request.headers.get('User-Agent'))
-
-@app.after_request
-def log_response_info(response):
+    if logger.is_enabled_for(logging.INFO):
+        # Direkt aus dem WSGI-Environ lesen statt über Request-Proxy und EnvironHeaders
+        environ = request.environ
+        logger.info("HTTP Request received",
+                   method=environ.get('REQUEST_METHOD'),
+                   path=request.path,
+                   remote_addr=get_client_ip(),
+                   user_agent=environ.get('HTTP_USER_AGENT'))
+
+def log_response_info(response, duration):
+    path = request.path
+    status_code = response.status_code
+
     # Performance Tracking
-    if request.path in request_start_times:
-        duration = time.time() - request_start_times[request.path]
-        performance_tracker.record_response_time(request.path, duration)
-        performance_tracker.record_error_rate(request.path, response.status_code >= 400)
-        del request_start_times[request.path]
-
-    logger.info("HTTP Response sent",
-               status_code=response.status_code,
-               path=request.path,
-               duration=duration if 'duration' in locals() else None)
+    performance_tracker.record_request(path, duration, status_code >= 400)
+
+    if (status_code >= 400 or random.random() < RESPONSE_LOG_SAMPLE_RATE) \
+            and logger.is_enabled_for(logging.INFO):
+        logger.info("HTTP Response sent",
+                   status_code=status_code,
+                   path=path,
+                   duration=duration)
     return response
 
+app = create_app(__name__, on_request=log_request_info, on_response=log_response_info)
+
 # API routes now handled by blueprints
 
 # Configuration is now imported from app.settings
 # PDF processing is now handled by app.pdf module
 
-# Initialize PDF processing instances
-pdf_processor = PDFProcessor(max_pages=3)
-preview_generator = PDFPreviewGenerator(dpi=1.5)
+# PDF-, KI- und Verzeichnis-Instanzen werden erst bei der ersten Verwendung erzeugt
+@cache
+def get_pdf_processor():
+    """Gemeinsamer PDFProcessor (lazy)"""
+    from app.pdf import PDFProcessor
+    return PDFProcessor(max_pages=3)
+
+
+@cache
+def get_preview_generator():
+    """Gemeinsamer PDFPreviewGenerator (lazy)"""
+    from app.pdf import PDFPreviewGenerator
+    return PDFPreviewGenerator()
+
+
+@cache
+def get_document_classifier():
+    """Gemeinsamer DocumentClassifier (lazy)"""
+    from app.ai import DocumentClassifier
+    return DocumentClassifier()
+
+
+@cache
+def get_prompt_manager():
+    """Gemeinsamer PromptManager (lazy)"""
+    from app.ai import PromptManager
+    return PromptManager()
+
 
-# Initialize AI classification instances
-document_classifier = DocumentClassifier()
-prompt_manager = PromptManager()
+@cache
+def get_directory_manager():
+    """Gemeinsamer DirectoryManager (lazy)"""
+    from app.directory import DirectoryManager
+    return DirectoryManager()
 
-# Initialize directory management instances
-directory_manager = DirectoryManager()
-category_manager = CategoryManager()
+
+# Kategorien und KI-Kontext höchstens alle 5 s gegen die Verzeichnis-mtimes prüfen
+category_manager = CategoryManager(cache_ttl=5.0)
 
 # Directory management functions now use the directory module
 
@@ -107,52 +116,115 @@ def classify_document(text, filename=None):
     category_info = category_manager.build_category_context_for_ai()
 
     # Verwende das AI-Modul für die Klassifizierung
-    result = document_classifier.classify_with_analysis(
+    result = get_document_classifier().classify_with_analysis(
         text, filename or 'unknown', categories, category_info
     )
 
+    classification = result['category']
+    category = classification['category']
+
     # Logging für Kompatibilität
     logger.info("AI classification response",
-               parsed_category=result['category']['category'],
-               parsed_subdirectory=result['category'].get('subdirectory', ''),
+               parsed_category=category,
+               parsed_subdirectory=classification.get('subdirectory', ''),
                context_hints=result['context_hints'],
                available_categories=categories[:5],  # Log first 5 for brevity
                filename=filename,
                confidence=result['confidence'])
 
-    if result['category']['category'] in categories:
-        logger.info("AI category match found", selected_category=result['category']['category'])
-    elif result['fallback_used']:
-        logger.warning("AI returned invalid category, using fallback",
-                      parsed_category=result['category']['category'],
-                      available_categories=categories[:5],
-                      fallback=result['category']['category'])
+    # Häufiger Fall: _build_analysis hat die Kategorie bestätigt
+    if not result['fallback_used']:
+        logger.info("AI category match found", selected_category=category)
+        return category
+
+    logger.warning("AI returned invalid category, using fallback",
+                  parsed_category=category,
+                  available_categories=categories[:5],
+                  fallback=category)
+    return category
+
+# Gerenderte Seiten als Bytes, Schlüssel (Template, Script-Root, Kontext)
+_page_cache = {}
+
+
+def render_cached_page(template_name, cache_key=(), **context):
+    """
+    Rendert eine Seite einmal und liefert danach die gecachten Bytes
+
+    Im Debug-Modus wird immer neu gerendert, damit Template-Änderungen sichtbar sind.
+
+    Args:
+        template_name: Name des Templates
+        cache_key: Zusätzlicher Schlüssel für kontextabhängige Seiten
+        **context: Template-Kontext
+
+    Returns:
+        HTML-Response
+    """
+    if app.debug:
+        return render_template(template_name, **context)
+
+    key = (template_name, request.script_root, cache_key)
+    html = _page_cache.get(key)
+    if html is None:
+        html = render_template(template_name, **context).encode('utf-8')
+        if len(_page_cache) >= 32:
+            # Veraltete Kategorie-Varianten der Startseite verwerfen
+            _page_cache.clear()
+        _page_cache[key] = html
+    return Response(html, mimetype='text/html')
 
-    return result['category']['category']
 
 @app.route('/')
 def index():
     """Hauptseite der Webapp"""
     categories = category_manager.get_smart_categories()
-    return render_template('index.html', categories=categories)
+    return render_cached_page('index.html', tuple(categories), categories=categories)
 
 @app.route('/batch')
 def batch():
     """Batch Processing Interface"""
-    return render_template('batch.html')
+    return render_cached_page('batch.html')
 
 @app.route('/templates')
 def templates():
     """Document Templates Interface"""
-    return render_template('templates.html')
+    return render_cached_page('templates.html')
 
 @app.route('/workflows')
 def workflows():
     """Workflow Management Interface"""
-    return render_template('workflows.html')
+    return render_cached_page('workflows.html')
 
 # All API endpoints now handled by blueprints
 
+
+def run_production_server():
+    """
+    Startet Gunicorn (gthread) mit gunicorn.conf.py statt des Werkzeug-Dev-Servers
+
+    Gunicorn ersetzt per exec diesen Prozess, der app.py samt Monitoring-Thread
+    bereits geladen hat. Master und Worker importieren die App über wsgi:app
+    neu, sodass Hintergrund-Threads (Monitoring, Batching) in jedem Worker
+    laufen. Ohne Gunicorn (z.B. unter Windows) wird auf app.run zurückgefallen.
+    """
+    if importlib.util.find_spec('gunicorn') is None:
+        logger.warning("Gunicorn not available, falling back to development server")
+        app.run(debug=False, host=config.host, port=config.port, threaded=True)
+        return
+
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    os.chdir(base_dir)
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.execv(sys.executable, [
+        sys.executable, '-m', 'gunicorn',
+        '--config', os.path.join(base_dir, 'gunicorn.conf.py'),
+        '--bind', f"{config.host}:{config.port}",
+        'wsgi:app',
+    ])
+
+
 if __name__ == '__main__':
     # Überprüfe ob Verzeichnisse existieren
     for dir_path in [CONFIG['SCAN_DIR'], CONFIG['SORTED_DIR']]:
@@ -170,16 +242,22 @@ if __name__ == '__main__':
                lm_studio_url=CONFIG['LM_STUDIO_URL'],
                debug_mode=config.debug_mode)
 
-    print("Starting Document Sorter with comprehensive logging...")
-    print(f"📁 Scan directory: {CONFIG['SCAN_DIR']}")
-    print(f"📂 Sorted directory: {CONFIG['SORTED_DIR']}")
-    print(f"🤖 LM Studio URL: {CONFIG['LM_STUDIO_URL']}")
-    print(f"📊 Monitoring: /api/monitoring/status")
-    print(f"📝 Logs: /api/monitoring/logs")
-    print(f"🏥 Health Check: /api/monitoring/health")
+    sys.stdout.write(
+        "Starting Document Sorter with comprehensive logging...\n"
+        f"📁 Scan directory: {CONFIG['SCAN_DIR']}\n"
+        f"📂 Sorted directory: {CONFIG['SORTED_DIR']}\n"
+        f"🤖 LM Studio URL: {CONFIG['LM_STUDIO_URL']}\n"
+        "📊 Monitoring: /api/monitoring/status\n"
+        "📝 Logs: /api/monitoring/logs\n"
+        "🏥 Health Check: /api/monitoring/health\n"
+    )
+    sys.stdout.flush()
 
     try:
-        app.run(debug=config.debug_mode, host=config.host, port=config.port)
+        if '--dev' in sys.argv[1:]:
+            app.run(debug=config.debug_mode, host=config.host, port=config.port)
+        else:
+            run_production_server()
     except Exception as e:
         logger.critical("Application startup failed", exception=e)
         error_reporter.report_error("application_startup_error", str(e), {
@@ -0,0 +1,113 @@
+"""
+Request Batching Module
+Coalesces LM Studio requests that arrive within a short window into one call
+"""
+
+import time
+from concurrent.futures import Future
+from queue import Queue, Empty
+from threading import Thread, Lock
+from typing import Any, Callable, List, Optional
+
+
+class MicroBatcher:
+    """
+    Collects items submitted by concurrent request threads and processes them
+    in batches on a background thread
+
+    A batch is flushed when max_batch_size items are queued or max_wait
+    seconds after its first item arrived, whichever comes first.
+    """
+
+    def __init__(self, process_batch: Callable[[List[Any]], List[Any]],
+                 max_batch_size: int = 8, max_wait: float = 0.05):
+        """
+        Initialize micro-batcher
+
+        Args:
+            process_batch: Callable mapping a list of items to a list of results (same order)
+            max_batch_size: Maximum number of items per batch
+            max_wait: Maximum time in seconds the first item of a batch waits for more items
+        """
+        self.process_batch = process_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue: Queue = Queue()
+        self._thread: Optional[Thread] = None
+        self._lock = Lock()
+        self.batches_sent = 0
+        self.items_processed = 0
+
+    def submit(self, item: Any) -> Future:
+        """
+        Queue item for the next batch
+
+        Args:
+            item: Item passed to process_batch
+
+        Returns:
+            Future resolved with the item's result
+        """
+        self._ensure_worker()
+        future: Future = Future()
+        self._queue.put((item, future))
+        return future
+
+    def _ensure_worker(self) -> None:
+        """Start background worker thread on first use"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = Thread(target=self._worker, name="micro-batcher", daemon=True)
+                self._thread.start()
+
+    def _collect_batch(self) -> list:
+        """Block for the first item, then gather more until size or time limit"""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except Empty:
+                break
+
+        return batch
+
+    def _worker(self) -> None:
+        """Background loop processing queued batches"""
+        while True:
+            batch = self._collect_batch()
+            items = [item for item, _ in batch]
+
+            try:
+                results = self.process_batch(items)
+                if len(results) != len(items):
+                    raise RuntimeError(f"Batch returned {len(results)} results for {len(items)} items")
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            self.batches_sent += 1
+            self.items_processed += len(batch)
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
+
+    def get_stats(self) -> dict:
+        """
+        Get batching statistics
+
+        Returns:
+            Dictionary with batch counters and average batch size
+        """
+        return {
+            'batches_sent': self.batches_sent,
+            'items_processed': self.items_processed,
+            'average_batch_size': round(self.items_processed / self.batches_sent, 2) if self.batches_sent else 0.0,
+            'queued': self._queue.qsize()
+        }
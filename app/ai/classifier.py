@@ -3,11 +3,366 @@ AI Document Classification Module
 Handles document classification using AI models via LM Studio
 """
 
+import asyncio
+import hashlib
+import json
+import logging
+import re
 import requests
-from typing import List, Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from threading import Lock
+from types import MappingProxyType
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, FrozenSet, Iterable, List, Optional, Pattern, Sequence, Set, Any, Tuple
 from .prompts import PromptManager
 from .document_templates import document_template_engine, DocumentTypeResult
+from .semantic_cache import SemanticCache
+from .batching import MicroBatcher
 from ..settings import config
+from ..cache import LRUCache
+from ..monitoring import get_logger
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Verbindungsaufbau zu LM Studio scheitert schnell, die Inferenz darf länger dauern
+LM_CONNECT_TIMEOUT = 3
+
+logger = get_logger('document_classifier')
+
+
+def _log_api_error(message: str, response: requests.Response) -> None:
+    """Loggt eine fehlgeschlagene LM-Studio-Antwort; der Body wird nur bei aktivem Level dekodiert"""
+    if logger.is_enabled_for(logging.WARNING):
+        logger.warning(message, status_code=response.status_code, response=response.text)
+
+
+def _create_lm_session(pool_size: int = 32) -> requests.Session:
+    """Create HTTP session with keep-alive connection pool for LM Studio"""
+    session = requests.Session()
+    session.headers['Content-Type'] = 'application/json'
+    # Kurze Wiederholung bei Verbindungsfehlern und überlastetem Server; Lese-Timeouts
+    # nicht wiederholen, sonst startet LM Studio dieselbe Generierung mehrfach
+    retries = Retry(
+        total=2,
+        read=False,
+        backoff_factor=0.2,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=frozenset({'GET', 'POST'}),
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+# Shared session: connections to LM Studio are reused across requests
+lm_session = _create_lm_session()
+
+
+def _encode_json(payload: Dict[str, Any]) -> bytes:
+    """Serialisiert den Request-Body (orjson wenn installiert)"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode('utf-8')
+
+
+# Dokumente je LM-Studio-Anfrage (MicroBatcher und Stapelverarbeitung)
+CLASSIFICATION_BATCH_SIZE = 8
+# Gleichzeitige LM-Studio-Anfragen bei großen Stapeln
+CLASSIFICATION_CONCURRENCY = 4
+# Bis zu so vielen Chunks nacheinander über die Keep-Alive-Verbindung, ohne Thread-Pool
+CLASSIFICATION_SEQUENTIAL_CHUNKS = 2
+
+# Eindeutige Schlüsselbegriffe je Kategorie-Stichwort (Teilstring des
+# Kategorienamens). Ein eindeutiger Treffer spart den LLM-Aufruf.
+CATEGORY_KEYWORD_RULES = {
+    'steuer': re.compile(r'\b(?:finanzamt|steuerbescheid|steuererklärung|einkommensteuer|steuer-id|steuernummer)\b', re.IGNORECASE),
+    'bank': re.compile(r'\b(?:kontoauszug|iban|sparkasse|volksbank|girokonto|depotauszug)\b', re.IGNORECASE),
+    'versicherung': re.compile(r'\b(?:versicherungsschein|versicherungsnummer|versicherungsnehmer|schadensnummer)\b', re.IGNORECASE),
+    'medizin': re.compile(r'\b(?:arztbrief|befundbericht|diagnose|krankenkasse|patientin|patient)\b', re.IGNORECASE),
+    'rechnung': re.compile(r'\b(?:rechnungsnummer|rechnungsbetrag|rechnungsdatum)\b', re.IGNORECASE),
+    'vertr': re.compile(r'\b(?:vertragsnummer|vertragspartner|vertragsbeginn|vertragslaufzeit)\b', re.IGNORECASE),
+}
+
+# Zeilen mit diesen Anfängen sind Reasoning-Text, keine Antwort des Modells
+REASONING_LINE_PREFIXES = ('<', 'Okay', 'Ich')
+
+# Bevorzugte Kategorien (Teilstring, kleingeschrieben) je erkanntem Dokumenttyp
+DOCUMENT_TYPE_CATEGORIES = {
+    'invoice': ('steuern', 'finanzen', 'rechnungen'),
+    'contract': ('verträge', 'legal'),
+    'bank_statement': ('banken', 'finanzen'),
+    'insurance': ('versicherungen',),
+    'employment_contract': ('arbeit', 'personal', 'hr'),
+    'rental_contract': ('wohnen', 'immobilien', 'miete')
+}
+
+# Dateinamen-Regel: Treffer als ganzes Wort im Dateinamen gilt als sicher (1.0),
+# als Wortteil nicht (0.6); nur ab FILENAME_RULE_MIN_CONFIDENCE entfällt der LLM-Aufruf
+FILENAME_RULE_MIN_CONFIDENCE = 0.9
+FILENAME_TOKEN_PATTERN = re.compile(r'[^\W\d_]+')
+
+# Nur der Dokumentanfang wird für die Schlüsselbegriffe untersucht
+KEYWORD_RULE_TEXT_LENGTH = 500
+
+# Stichwort -> Schlüsselbegriffe für die Fallback-Klassifizierung ohne LM Studio
+# (schreibgeschützt, wird von den gecachten Tabellen und dem Matcher geteilt)
+FALLBACK_KEYWORD_MAPPINGS = MappingProxyType({
+    'arbeit': ('arbeit', 'gehalt', 'lohn', 'arbeitsvertrag', 'job', 'deutsche bahn', 'evg', 'evoik'),
+    'rechnung': ('rechnung', 'invoice', 'betrag', 'euro', 'umsatzsteuer', 'rechnungen', 'faktura'),
+    'finanzen': ('bank', 'steuer', 'finanz', 'geld', 'kapital', 'investment'),
+    'versicherung': ('versicherung', 'police', 'schadensfall'),
+    'wohnen': ('miete', 'wohnung', 'hausverwaltung', 'mietvertrag'),
+    'fahrzeug': ('auto', 'kfz', 'fahrzeug', 'tüv', 'motorrad'),
+    'medizin': ('arzt', 'behandlung', 'patient', 'medizin', 'gesundheit'),
+    'kita': ('kita', 'kindergarten', 'betreuung'),
+    'schöffe': ('schöffe', 'schöffin', 'schöffendienst', 'laienrichter', 'gericht', 'landgericht', 'amtsgericht'),
+    'gericht': ('gericht', 'richter', 'urteil', 'verhandlung', 'justiz', 'landgericht', 'amtsgericht'),
+    'politik': ('politik', 'politiker', 'partei', 'wahl', 'bundestag', 'landtag'),
+    'verein': ('verein', 'vereinigung', 'club', 'mitgliedschaft', 'beitrag'),
+    'immobilien': ('immobilie', 'haus', 'wohnung', 'grundstück', 'makler'),
+    'bildung': ('schule', 'universität', 'studium', 'kurs', 'ausbildung'),
+    'sport': ('sport', 'fitness', 'verein', 'training', 'wettkampf')
+})
+
+# Flache (Stichwort, Schlüsselbegriff)-Paare in Mapping-Reihenfolge
+FALLBACK_KEYWORD_PAIRS = tuple(
+    (pattern, keyword) for pattern, keywords in FALLBACK_KEYWORD_MAPPINGS.items() for keyword in keywords
+)
+
+
+def _build_keyword_matcher(keywords: Iterable[str]) -> Tuple[Pattern, Dict[str, FrozenSet[str]]]:
+    """
+    Build a single-pass matcher finding every occurrence of the given keywords
+
+    The lookahead alternation tries the longest keyword first at each text
+    position, so overlapping keywords (e.g. "gericht" in "landgericht") are
+    found as well. Shorter keywords starting at the same position are
+    prefixes of the match and are resolved through the prefix table.
+
+    Args:
+        keywords: Keywords to search for (lowercase)
+
+    Returns:
+        Tuple of (compiled pattern, keyword -> keywords that are its prefixes)
+    """
+    ordered = sorted(set(keywords), key=len, reverse=True)
+    pattern = re.compile('(?=(' + '|'.join(re.escape(keyword) for keyword in ordered) + '))')
+    prefixes = {
+        keyword: frozenset(other for other in ordered if keyword.startswith(other))
+        for keyword in ordered
+    }
+    return pattern, prefixes
+
+
+FALLBACK_KEYWORD_PATTERN, FALLBACK_KEYWORD_PREFIXES = _build_keyword_matcher(
+    keyword for _, keyword in FALLBACK_KEYWORD_PAIRS
+)
+
+
+@lru_cache(maxsize=8)
+def lowercase_categories(categories: Tuple[str, ...]) -> Tuple[Tuple[str, str], ...]:
+    """
+    Pair each category with its lowercase form (cached per category list)
+
+    Args:
+        categories: Available categories as tuple
+
+    Returns:
+        Tuple of (category, lowercase category) pairs in the same order
+    """
+    return tuple((category, category.lower()) for category in categories)
+
+
+@lru_cache(maxsize=8)
+def exact_answer_categories(categories: Tuple[str, ...]) -> Dict[str, str]:
+    """
+    Map each category name to the category an answer of exactly that name resolves to
+
+    parse_ai_response takes the first category (in list order) contained in
+    the answer, so an answer "Steuern" resolves to an earlier "Steuer" if
+    present. Precomputing this per category list turns the common case of
+    an exact answer into one dict lookup.
+
+    Args:
+        categories: Available categories as tuple
+
+    Returns:
+        Dictionary answer -> resolved category
+    """
+    return {
+        answer: next(category for category in categories if category in answer)
+        for answer in categories
+    }
+
+
+@lru_cache(maxsize=64)
+def document_type_category(document_type: str, categories: Tuple[str, ...]) -> Optional[str]:
+    """
+    Find the preferred category for a recognized document type (cached per type and category list)
+
+    Args:
+        document_type: Document type from template recognition
+        categories: Available categories as tuple
+
+    Returns:
+        First available category containing a preferred name of the type, or None
+    """
+    preferred_categories = DOCUMENT_TYPE_CATEGORIES.get(document_type)
+    if preferred_categories is None:
+        return None
+
+    lowered_categories = lowercase_categories(categories)
+    for preferred_category in preferred_categories:
+        for category, category_lower in lowered_categories:
+            if preferred_category in category_lower:
+                return category
+    return None
+
+
+@lru_cache(maxsize=8)
+def category_match_words(categories: Tuple[str, ...]) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+    """
+    Pair each category with its longer lowercase words (cached per category list)
+
+    Args:
+        categories: Available categories as tuple
+
+    Returns:
+        Tuple of (category, words longer than 4 characters) pairs in the same order
+    """
+    return tuple(
+        (category, tuple(word for word in category_lower.split() if len(word) > 4))
+        for category, category_lower in lowercase_categories(categories)
+    )
+
+
+# Aufwertung von Stichwort-Treffern: (Begriffe im gefundenen Schlüsselbegriff,
+# Begriffe im Kategorienamen, Punktzahl)
+FALLBACK_SCORE_BOOSTS = (
+    (('schöff', 'gericht'), ('schöff', 'gericht'), 12),
+    (('rechnung', 'invoice'), ('rechnung',), 12),
+)
+
+
+def fallback_score(pattern: str, keywords: Sequence[str], keyword: str, category_lower: str) -> int:
+    """
+    Score a category for a fallback keyword hit
+
+    Args:
+        pattern: Mapping name from FALLBACK_KEYWORD_MAPPINGS
+        keywords: Keywords of the mapping
+        keyword: Keyword found in the document
+        category_lower: Lowercase category name
+
+    Returns:
+        Score (0 if the category does not match the mapping)
+    """
+    # Exact match gets highest score, court/legal categories even more
+    if pattern in category_lower:
+        return 15 if pattern in ('schöffe', 'gericht') else 10
+
+    # Keyword match gets medium score, boosted if the found keyword and the category share a topic
+    if any(k in category_lower for k in keywords):
+        for keyword_terms, category_terms, boost in FALLBACK_SCORE_BOOSTS:
+            if any(term in keyword for term in keyword_terms) and \
+               any(term in category_lower for term in category_terms):
+                return boost
+        return 5
+
+    # Partial match (important for cases like "schöffe" -> "schöffendienst")
+    if any(category_part in k or k in category_part
+           for category_part in category_lower.split()
+           for k in keywords if len(k) > 3):
+        return 11 if 'schöff' in keyword and 'schöff' in category_lower else 3
+
+    return 0
+
+
+@lru_cache(maxsize=8)
+def fallback_score_table(lowered_categories: Tuple[Tuple[str, str], ...]) -> Tuple[
+        Tuple[Tuple[str, ...], Tuple[Tuple[str, Tuple[int, ...]], ...]], ...]:
+    """
+    Precompute fallback scores per keyword and category (cached per category list)
+
+    Args:
+        lowered_categories: (category, lowercase category) pairs from lowercase_categories
+
+    Returns:
+        Tuple of (keywords, ((category, score per keyword), ...)) in
+        FALLBACK_KEYWORD_MAPPINGS order; categories without any match are left out
+    """
+    table = []
+    for pattern, keywords in FALLBACK_KEYWORD_MAPPINGS.items():
+        scored_categories = []
+        for category, category_lower in lowered_categories:
+            scores = tuple(fallback_score(pattern, keywords, keyword, category_lower) for keyword in keywords)
+            if any(scores):
+                scored_categories.append((category, scores))
+        if scored_categories:
+            table.append((keywords, tuple(scored_categories)))
+    return tuple(table)
+
+
+def find_fallback_keywords(*texts: str) -> Set[str]:
+    """
+    Find all fallback keywords contained in the given texts in one pass each
+
+    Args:
+        texts: Lowercase texts to scan
+
+    Returns:
+        Set of keywords occurring in any of the texts
+    """
+    hits: Set[str] = set()
+    for text in texts:
+        for match in FALLBACK_KEYWORD_PATTERN.finditer(text):
+            hits |= FALLBACK_KEYWORD_PREFIXES[match.group(1)]
+    return hits
+
+
+# LLM-Antworten je (Dateiname, Textanfang, Kategorien); der Prompt nutzt nur text[:2000]
+CLASSIFICATION_CACHE_TEXT_LENGTH = 2000
+# Kürzere Texte (z.B. Scans ohne Textebene) werden nicht gecacht, sie unterscheiden sich nur im Dateinamen
+CLASSIFICATION_CACHE_MIN_TEXT_LENGTH = 20
+classification_cache = LRUCache(maxsize=4096)
+
+# Ähnliche Dokumente (gleiche Vorlage, andere Daten) teilen sich die Klassifizierung
+semantic_classification_cache = SemanticCache(threshold=config.sem_cache_threshold)
+
+
+def get_classification_cache_key(text: str, available_categories: List[str],
+                                 filename: Optional[str] = None, method: str = '') -> str:
+    """
+    Build cache key for a classification request
+
+    Args:
+        text: Document text content
+        available_categories: List of valid categories
+        filename: Document filename, for prompts that include it
+        method: Classification path ('document', 'enhanced'); their prompts differ
+
+    Returns:
+        BLAKE2b hex digest of the method, prompt text sample, categories and filename
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(method.encode('utf-8'))
+    digest.update(b'\x02')
+    if filename is not None:
+        digest.update(filename.encode('utf-8'))
+        digest.update(b'\x01')
+    digest.update(text[:CLASSIFICATION_CACHE_TEXT_LENGTH].encode('utf-8'))
+    for category in available_categories:
+        digest.update(b'\x00')
+        digest.update(category.encode('utf-8'))
+    return digest.hexdigest()
 
 
 class DocumentClassifier:
@@ -19,12 +374,37 @@ class DocumentClassifier:
 
         Args:
             lm_studio_url: LM Studio API URL (uses config if not provided)
-            timeout: Request timeout in seconds
+            timeout: Read timeout in seconds (connect timeout is LM_CONNECT_TIMEOUT)
         """
         self.lm_studio_url = lm_studio_url or config.lm_studio_url
+        self.completions_url = self._get_completions_url(self.lm_studio_url)
         self.timeout = timeout
+        self.session = lm_session
         self.prompt_manager = PromptManager()
 
+        # Statische Teile der Chat-Anfragen einmalig aufbauen
+        self._request_config = self.prompt_manager.get_request_config()
+        self._system_message = self.prompt_manager.get_system_message()
+        self._enhanced_system_message = self._get_enhanced_system_message()
+
+        # Concurrent classification requests share one LM Studio call
+        self.batcher = MicroBatcher(
+            self._request_chat_batch, max_batch_size=CLASSIFICATION_BATCH_SIZE, max_wait=0.05
+        )
+
+        # Trefferquote der Dateinamen-Regel (zum Abstimmen der Schlüsselbegriffe)
+        # (Request-Threads und Batch-Pool zählen gleichzeitig, daher unter Lock)
+        self.filename_rule_hits = 0
+        self.filename_rule_misses = 0
+        self._filename_rule_lock = Lock()
+
+    @staticmethod
+    def _get_completions_url(chat_url: str) -> str:
+        """Derive the OpenAI-compatible /v1/completions URL from the chat URL"""
+        if chat_url.endswith('/chat/completions'):
+            return chat_url[:-len('/chat/completions')] + '/completions'
+        return chat_url
+
     def parse_ai_response(self, raw_response: str, available_categories: List[str]) -> Dict[str, str]:
         """
         Parse AI response and extract category and subdirectory
@@ -39,40 +419,49 @@ class DocumentClassifier:
         # Default response structure
         result = {'category': '', 'subdirectory': ''}
 
-        # Handle DeepSeek reasoning tokens - extract content after </think>
-        response_text = raw_response
-        if '</think>' in raw_response:
-            parts = raw_response.split('</think>')
-            if len(parts) > 1:
-                response_text = parts[-1].strip()
+        # Handle DeepSeek reasoning tokens - only the content after the last </think> counts
+        # (rsplit statt split: keine Liste aller Reasoning-Abschnitte)
+        response_text = raw_response.rsplit('</think>', 1)[-1].replace('<think>', '').strip()
 
-        # Clean the response
-        response_text = response_text.replace('<think>', '').replace('</think>', '').strip()
+        # Antwortzeilen einmal bestimmen: leere Zeilen und Reasoning-Reste überspringen
+        answer_lines = [
+            line for line in (raw_line.strip() for raw_line in response_text.split('\n'))
+            if line and not line.startswith(REASONING_LINE_PREFIXES)
+        ]
 
         # Look for the new format: CATEGORY|SUBDIRECTORY
         if '|' in response_text:
-            lines = response_text.split('\n')
-            for line in lines:
-                line = line.strip()
-                if '|' in line and not line.startswith('<') and not line.startswith('Okay') and not line.startswith('Ich'):
-                    parts = line.split('|', 1)  # Split only on first |
-                    if len(parts) == 2:
-                        category_part = parts[0].strip()
-                        subdirectory_part = parts[1].strip()
-
-                        # Validate category
-                        for category in available_categories:
-                            if category == category_part or category in category_part:
-                                result['category'] = category
-                                result['subdirectory'] = subdirectory_part
-                                return result
-
-                        # If no exact match, try partial match
-                        for category in available_categories:
-                            if category.lower() in category_part.lower():
-                                result['category'] = category
-                                result['subdirectory'] = subdirectory_part
-                                return result
+            lowered_categories = None
+            exact_categories = exact_answer_categories(tuple(available_categories))
+            for line in answer_lines:
+                if '|' in line:
+                    category_part, subdirectory_part = line.split('|', 1)  # Split only on first |
+                    category_part = category_part.strip()
+                    subdirectory_part = subdirectory_part.strip()
+
+                    # Exakter Kategoriename (häufigster Fall): direkt nachschlagen
+                    category = exact_categories.get(category_part)
+                    if category is not None:
+                        result['category'] = category
+                        result['subdirectory'] = subdirectory_part
+                        return result
+
+                    # Validate category
+                    for category in available_categories:
+                        if category in category_part:
+                            result['category'] = category
+                            result['subdirectory'] = subdirectory_part
+                            return result
+
+                    # If no exact match, try partial match
+                    if lowered_categories is None:
+                        lowered_categories = lowercase_categories(tuple(available_categories))
+                    category_part_lower = category_part.lower()
+                    for category, category_lower in lowered_categories:
+                        if category_lower in category_part_lower:
+                            result['category'] = category
+                            result['subdirectory'] = subdirectory_part
+                            return result
 
         # Fallback: try to find just the category (legacy format)
         for category in available_categories:
@@ -81,18 +470,15 @@ class DocumentClassifier:
                 return result
 
         # Final fallback: analyze lines for category names
-        lines = response_text.split('\n')
-        for line in lines:
-            line = line.strip()
-            if line and not line.startswith('<') and not line.startswith('Okay') and not line.startswith('Ich'):
-                for category in available_categories:
-                    if category in line:
-                        result['category'] = category
-                        return result
-                # If this line looks like a clean category answer, use it
-                if len(line) < 50 and not line.endswith('?'):
-                    result['category'] = line
+        for line in answer_lines:
+            for category in available_categories:
+                if category in line:
+                    result['category'] = category
                     return result
+            # If this line looks like a clean category answer, use it
+            if len(line) < 50 and not line.endswith('?'):
+                result['category'] = line
+                return result
 
         # Last resort: return first available category
         if available_categories:
@@ -114,27 +500,38 @@ class DocumentClassifier:
         Returns:
             Dictionary with 'category' and 'subdirectory' keys
         """
+        # Eindeutiger Dateiname oder Schlüsselbegriffe machen den LLM-Aufruf überflüssig
+        keyword_classification = (
+            self._classify_by_filename(filename, available_categories)
+            or self._classify_by_keywords(text, available_categories)
+        )
+        if keyword_classification:
+            return keyword_classification
+
+        # Bereits klassifizierter Text mit gleichem Dateinamen: LLM-Aufruf überspringen
+        cache_key = None
+        if len(text.strip()) >= CLASSIFICATION_CACHE_MIN_TEXT_LENGTH:
+            cache_key = get_classification_cache_key(text, available_categories, filename or '', 'document')
+            cached_result = classification_cache.get(cache_key)
+            if cached_result is not None:
+                return dict(cached_result)
+
+            similar_result = semantic_classification_cache.get(text, available_categories)
+            if similar_result is not None:
+                classification_cache.set(cache_key, dict(similar_result))
+                return similar_result
+
         try:
             # Build classification prompt
             prompt = self.prompt_manager.build_classification_prompt(
                 text, filename, category_info
             )
 
-            # Prepare request
-            request_config = self.prompt_manager.get_request_config()
-            request_data = {
-                **request_config,
-                "messages": [
-                    {"role": "system", "content": self.prompt_manager.get_system_message()},
-                    {"role": "user", "content": prompt}
-                ]
-            }
-
             # Make API request
-            response = requests.post(
+            response = self.session.post(
                 self.lm_studio_url,
-                json=request_data,
-                timeout=self.timeout
+                data=self._encode_chat_request(self._system_message, prompt),
+                timeout=(LM_CONNECT_TIMEOUT, self.timeout)
             )
 
             if response.status_code == 200:
@@ -145,6 +542,9 @@ class DocumentClassifier:
                 classification_result = self.parse_ai_response(raw_response, available_categories)
 
                 if classification_result['category'] in available_categories:
+                    if cache_key is not None:
+                        classification_cache.set(cache_key, dict(classification_result))
+                        semantic_classification_cache.set(text, available_categories, classification_result)
                     return classification_result
                 else:
                     # Return first available category as fallback
@@ -154,17 +554,17 @@ class DocumentClassifier:
                     }
 
             else:
-                print(f"LM Studio API error: {response.status_code} - {response.text}")
+                _log_api_error("LM Studio API error", response)
                 return {
                     'category': available_categories[0] if available_categories else 'Sonstiges',
                     'subdirectory': ''
                 }
 
         except Exception as e:
-            print(f"Error calling LM Studio: {e}")
+            logger.error("Error calling LM Studio", exception=e)
             # Smart fallback based on filename and text analysis
             fallback_category = self._smart_fallback_classification(text, filename, available_categories)
-            print(f"Using smart fallback classification: {fallback_category}")
+            logger.info("Using smart fallback classification", category=fallback_category)
             return {
                 'category': fallback_category,
                 'subdirectory': ''
@@ -185,64 +585,19 @@ class DocumentClassifier:
         filename_lower = filename.lower() if filename else ""
         text_sample = text[:500].lower() if text else ""
 
-        # Enhanced keyword mapping with partial matches
-        keyword_mappings = {
-            'arbeit': ['arbeit', 'gehalt', 'lohn', 'arbeitsvertrag', 'job', 'deutsche bahn', 'evg', 'evoik'],
-            'rechnung': ['rechnung', 'invoice', 'betrag', 'euro', 'umsatzsteuer', 'rechnungen', 'faktura'],
-            'finanzen': ['bank', 'steuer', 'finanz', 'geld', 'kapital', 'investment'],
-            'versicherung': ['versicherung', 'police', 'schadensfall'],
-            'wohnen': ['miete', 'wohnung', 'hausverwaltung', 'mietvertrag'],
-            'fahrzeug': ['auto', 'kfz', 'fahrzeug', 'tüv', 'motorrad'],
-            'medizin': ['arzt', 'behandlung', 'patient', 'medizin', 'gesundheit'],
-            'kita': ['kita', 'kindergarten', 'betreuung'],
-            'schöffe': ['schöffe', 'schöffin', 'schöffendienst', 'laienrichter', 'gericht', 'landgericht', 'amtsgericht'],
-            'gericht': ['gericht', 'richter', 'urteil', 'verhandlung', 'justiz', 'landgericht', 'amtsgericht'],
-            'politik': ['politik', 'politiker', 'partei', 'wahl', 'bundestag', 'landtag'],
-            'verein': ['verein', 'vereinigung', 'club', 'mitgliedschaft', 'beitrag'],
-            'immobilien': ['immobilie', 'haus', 'wohnung', 'grundstück', 'makler'],
-            'bildung': ['schule', 'universität', 'studium', 'kurs', 'ausbildung'],
-            'sport': ['sport', 'fitness', 'verein', 'training', 'wettkampf']
-        }
-
         # Enhanced matching: Check filename and text for keywords
         best_match = None
         best_score = 0
-
-        for pattern, keywords in keyword_mappings.items():
-            for keyword in keywords:
-                if keyword in filename_lower or keyword in text_sample:
-                    # Find matching category with partial string matching
-                    for category in available_categories:
-                        category_lower = category.lower()
-
-                        # Exact match gets highest score
-                        if pattern in category_lower:
-                            score = 10
-                            # Boost score for specific court/legal categories
-                            if pattern in ['schöffe', 'gericht'] and ('schöff' in category_lower or 'gericht' in category_lower):
-                                score = 15
-                        # Keyword match gets medium score
-                        elif any(k in category_lower for k in keywords):
-                            score = 5
-                            # Boost score for court/legal matches
-                            if any(legal_term in keyword for keyword in keywords for legal_term in ['schöff', 'gericht', 'landgericht', 'amtsgericht']) and \
-                               any(legal_cat in category_lower for legal_cat in ['schöff', 'gericht']):
-                                score = 12
-                            # Boost score for invoice/billing matches
-                            elif any(invoice_term in keyword for keyword in keywords for invoice_term in ['rechnung', 'rechnungen', 'invoice']) and \
-                                 any(invoice_cat in category_lower for invoice_cat in ['rechnung', 'rechnungen']):
-                                score = 12
-                        # Partial match (important for cases like "schöffe" -> "schöffendienst")
-                        elif any(category_part in keyword or keyword in category_part
-                                for category_part in category_lower.split()
-                                for keyword in keywords if len(keyword) > 3):
-                            score = 3
-                            # Special boost for schöffe matches
-                            if 'schöff' in keyword and 'schöff' in category_lower:
-                                score = 11
-                        else:
-                            continue
-
+        keyword_hits = find_fallback_keywords(filename_lower, text_sample)
+        lowered_categories = lowercase_categories(tuple(available_categories))
+
+        if keyword_hits:
+            for keywords, scored_categories in fallback_score_table(lowered_categories):
+                for index, keyword in enumerate(keywords):
+                    if keyword not in keyword_hits:
+                        continue
+                    for category, scores in scored_categories:
+                        score = scores[index]
                         if score > best_score:
                             best_score = score
                             best_match = category
@@ -250,19 +605,15 @@ class DocumentClassifier:
         if best_match:
             return best_match
 
-        # Enhanced partial matching for directory names
-        for category in available_categories:
-            category_words = category.lower().split()
-            text_words = text_sample.split()
-            filename_words = filename_lower.split()
-
-            for cat_word in category_words:
-                if len(cat_word) > 4:  # Only consider longer words
-                    for text_word in text_words + filename_words:
-                        if len(text_word) > 3:
-                            # Check if words have significant overlap
-                            if (cat_word in text_word or text_word in cat_word) and len(text_word) > 3:
-                                return category
+        # Enhanced partial matching for directory names (only longer words are considered)
+        document_words = [word for word in text_sample.split() + filename_lower.split() if len(word) > 3]
+        if document_words:
+            for category, category_words in category_match_words(tuple(available_categories)):
+                for cat_word in category_words:
+                    for text_word in document_words:
+                        # Check if words have significant overlap
+                        if cat_word in text_word or text_word in cat_word:
+                            return category
 
         # Default fallback to first non-blacklisted category
         preferred_fallbacks = ['Sonstiges', 'sonstiges', '12 schriftverkehr']
@@ -289,22 +640,174 @@ class DocumentClassifier:
         # Step 1: Template-based document type recognition
         template_result = document_template_engine.recognize_document_type(text, filename)
 
-        # Extract context hints
-        context_hints = self.prompt_manager.extract_document_context(text, filename)
-
         # Step 2: Enhanced classification with template information
         classification_result = self.classify_document_enhanced(
             text, filename, available_categories, category_info, template_result
         )
 
+        return self._build_analysis(text, filename, available_categories, classification_result, template_result)
+
+    def classify_with_analysis_batch(self, documents: List[Tuple[str, str]], available_categories: List[str],
+                                     category_info: str) -> List[Dict[str, Any]]:
+        """
+        Classify several documents with a single LM Studio request
+
+        Documents that can be mapped from a high-confidence template or an
+        unambiguous keyword rule skip the LLM entirely; all remaining prompts are sent as one list-of-prompts
+        request to the completions endpoint.
+
+        Args:
+            documents: List of (text, filename) tuples
+            available_categories: List of valid categories
+            category_info: Formatted category information
+
+        Returns:
+            List of analysis dictionaries in the same order as documents
+        """
+        template_results = [
+            document_template_engine.recognize_document_type(text, filename)
+            for text, filename in documents
+        ]
+
+        classifications: List[Optional[Dict[str, str]]] = []
+        pending = []
+        for index, template_result in enumerate(template_results):
+            classification = (
+                self._classify_from_template(template_result, available_categories)
+                or self._classify_by_filename(documents[index][1], available_categories)
+                or self._classify_by_keywords(documents[index][0], available_categories)
+            )
+            classifications.append(classification)
+            if classification is None:
+                pending.append(index)
+
+        if pending:
+            category_set = frozenset(available_categories)
+            system_message = self._enhanced_system_message
+            prompts = [
+                self.prompt_manager.build_completion_prompt(
+                    system_message,
+                    self._build_enhanced_prompt(documents[i][0], documents[i][1], category_info, template_results[i])
+                )
+                for i in pending
+            ]
+            raw_responses = self._request_completions_batch(prompts)
+
+            for index, raw_response in zip(pending, raw_responses):
+                text, filename = documents[index]
+                if raw_response is None:
+                    classifications[index] = self._enhanced_fallback_classification(
+                        text, filename, available_categories, template_results[index]
+                    )
+                    continue
+
+                classification_result = self.parse_ai_response(raw_response, available_categories)
+                if classification_result['category'] not in category_set:
+                    classification_result = {
+                        'category': available_categories[0] if available_categories else 'Sonstiges',
+                        'subdirectory': ''
+                    }
+                classifications[index] = classification_result
+
+        return [
+            self._build_analysis(text, filename, available_categories, classification, template_result)
+            for (text, filename), classification, template_result
+            in zip(documents, classifications, template_results)
+        ]
+
+    def classify_documents_batch(self, documents: List[Tuple[str, str]], available_categories: List[str],
+                                 category_info: str) -> List[Dict[str, Any]]:
+        """
+        Classify any number of documents in chunks of CLASSIFICATION_BATCH_SIZE
+
+        Each chunk is one LM Studio request. Small batches (up to
+        CLASSIFICATION_SEQUENTIAL_CHUNKS chunks) are sent one after another;
+        for larger ones up to CLASSIFICATION_CONCURRENCY chunks are in flight
+        at the same time.
+
+        Args:
+            documents: List of (text, filename) tuples
+            available_categories: List of valid categories
+            category_info: Formatted category information
+
+        Returns:
+            List of analysis dictionaries in the same order as documents
+        """
+        chunks = [
+            documents[start:start + CLASSIFICATION_BATCH_SIZE]
+            for start in range(0, len(documents), CLASSIFICATION_BATCH_SIZE)
+        ]
+        if len(chunks) <= CLASSIFICATION_SEQUENTIAL_CHUNKS:
+            return [
+                analysis
+                for chunk in chunks
+                for analysis in self.classify_with_analysis_batch(chunk, available_categories, category_info)
+            ]
+
+        with ThreadPoolExecutor(max_workers=min(CLASSIFICATION_CONCURRENCY, len(chunks))) as executor:
+            chunk_results = executor.map(
+                lambda chunk: self.classify_with_analysis_batch(chunk, available_categories, category_info),
+                chunks
+            )
+            return [analysis for chunk_result in chunk_results for analysis in chunk_result]
+
+    async def classify_document_async(self, text: str, filename: str, available_categories: List[str],
+                                      category_info: str) -> Dict[str, str]:
+        """
+        Classify document without blocking the event loop
+
+        The blocking LM Studio call runs in the loop's default thread pool and
+        uses the shared keep-alive session, so several documents can be
+        awaited concurrently with asyncio.gather.
+
+        Args:
+            text: Document text content
+            filename: Document filename
+            available_categories: List of valid categories
+            category_info: Formatted category information
+
+        Returns:
+            Dictionary with 'category' and 'subdirectory' keys
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self.classify_document, text, filename, available_categories, category_info
+        )
+
+    async def classify_documents_async(self, documents: List[Tuple[str, str]], available_categories: List[str],
+                                       category_info: str) -> List[Dict[str, str]]:
+        """
+        Classify several documents concurrently from async code
+
+        Args:
+            documents: List of (text, filename) tuples
+            available_categories: List of valid categories
+            category_info: Formatted category information
+
+        Returns:
+            List of classification dictionaries in the same order as documents
+        """
+        return list(await asyncio.gather(*(
+            self.classify_document_async(text, filename, available_categories, category_info)
+            for text, filename in documents
+        )))
+
+    def _build_analysis(self, text: str, filename: str, available_categories: List[str],
+                        classification_result: Dict[str, str],
+                        template_result: Optional[DocumentTypeResult]) -> Dict[str, Any]:
+        """Build the detailed analysis dictionary for a classification result"""
+        # Extract context hints
+        context_hints = self.prompt_manager.extract_document_context(text, filename)
+
         # Build detailed analysis
+        category_known = classification_result['category'] in available_categories
         analysis = {
             'category': classification_result,
             'context_hints': context_hints,
             'text_length': len(text),
             'filename': filename,
-            'confidence': 'high' if classification_result['category'] in available_categories else 'low',
-            'fallback_used': classification_result['category'] not in available_categories
+            'confidence': 'high' if category_known else 'low',
+            'fallback_used': not category_known
         }
 
         # Add template information if available
@@ -345,88 +848,377 @@ class DocumentClassifier:
             Dictionary with 'category' and 'subdirectory' keys
         """
         # If we have high-confidence template recognition, use it to guide classification
-        if template_result and template_result.confidence > 0.8:
-            # Try to map document type to available categories
-            category_mapping = self._map_document_type_to_category(
-                template_result.document_type, available_categories
+        template_classification = self._classify_from_template(template_result, available_categories)
+        if template_classification:
+            return template_classification
+
+        # Eindeutiger Dateiname oder Schlüsselbegriffe machen den LLM-Aufruf überflüssig
+        keyword_classification = (
+            self._classify_by_filename(filename, available_categories)
+            or self._classify_by_keywords(text, available_categories)
+        )
+        if keyword_classification:
+            return keyword_classification
+
+        # Erneut verarbeitete Dokumente (gleicher Text und Dateiname): LLM-Aufruf überspringen
+        cache_key = None
+        if len(text.strip()) >= CLASSIFICATION_CACHE_MIN_TEXT_LENGTH:
+            cache_key = get_classification_cache_key(text, available_categories, filename or '', 'enhanced')
+            cached_result = classification_cache.get(cache_key)
+            if cached_result is not None:
+                return dict(cached_result)
+
+            # Gleiche Vorlage mit anderen Daten (z.B. monatliche Abrechnung): Ergebnis übernehmen
+            similar_result = semantic_classification_cache.get(text, available_categories)
+            if similar_result is not None:
+                classification_cache.set(cache_key, dict(similar_result))
+                return similar_result
+
+        # Fallback to regular AI classification
+        try:
+            # Concurrent requests are coalesced into one LM Studio call
+            future = self.batcher.submit((text, filename, category_info, template_result))
+            raw_response = future.result(
+                timeout=self.timeout * self.batcher.max_batch_size + self.batcher.max_wait
             )
 
-            if category_mapping:
+            if raw_response is None:
+                return self._enhanced_fallback_classification(text, filename, available_categories, template_result)
+
+            # Parse response and extract category + subdirectory
+            classification_result = self.parse_ai_response(raw_response, available_categories)
+
+            if classification_result['category'] in available_categories:
+                if cache_key is not None:
+                    classification_cache.set(cache_key, dict(classification_result))
+                    semantic_classification_cache.set(text, available_categories, classification_result)
+                return classification_result
+            else:
+                # Return first available category as fallback
                 return {
-                    'category': category_mapping['category'],
-                    'subdirectory': category_mapping.get('subdirectory', template_result.document_type)
+                    'category': available_categories[0] if available_categories else 'Sonstiges',
+                    'subdirectory': ''
                 }
 
-        # Fallback to regular AI classification
+        except Exception as e:
+            logger.error("Error calling LM Studio", exception=e)
+            return self._enhanced_fallback_classification(text, filename, available_categories, template_result)
+
+    def _request_chat_batch(self, requests_batch: List[Tuple[str, str, str, Optional[DocumentTypeResult]]]) -> List[Optional[str]]:
+        """
+        Classify a batch of documents collected by the batcher
+
+        A single document uses the chat endpoint with the regular prompt as
+        before; documents sharing the same category context are combined into
+        one multi-document prompt that lists the categories only once.
+
+        Args:
+            requests_batch: List of (text, filename, category info, template result) tuples
+
+        Returns:
+            Raw response text per document (same order), None on failure
+        """
+        groups: Dict[str, List[int]] = {}
+        for index, (_, _, category_info, _) in enumerate(requests_batch):
+            groups.setdefault(category_info, []).append(index)
+
+        raw_responses: List[Optional[str]] = [None] * len(requests_batch)
+        for category_info, indices in groups.items():
+            if len(indices) == 1:
+                text, filename, _, template_result = requests_batch[indices[0]]
+                prompt = self._build_enhanced_prompt(text, filename, category_info, template_result)
+                raw_responses[indices[0]] = self._request_chat_completion(self._enhanced_system_message, prompt)
+                continue
+
+            group_responses = self._request_shared_prompt_batch(
+                [requests_batch[index] for index in indices], category_info
+            )
+            for index, raw_response in zip(indices, group_responses):
+                raw_responses[index] = raw_response
+
+        return raw_responses
+
+    def _request_shared_prompt_batch(self, documents: List[Tuple[str, str, str, Optional[DocumentTypeResult]]],
+                                     category_info: str) -> List[Optional[str]]:
+        """
+        Classify several documents with one multi-document chat request
+
+        Args:
+            documents: List of (text, filename, category info, template result) tuples
+            category_info: Category context shared by all documents
+
+        Returns:
+            "KATEGORIE|UNTERVERZEICHNIS" answer per document (same order), None where missing
+        """
+        prompt = self.prompt_manager.build_batch_prompt(
+            [
+                (text, filename, template_result.document_type if template_result else None)
+                for text, filename, _, template_result in documents
+            ],
+            category_info
+        )
+        raw_response = self._request_chat_completion(
+            self._enhanced_system_message,
+            prompt,
+            request_config=self.prompt_manager.get_batch_request_config(len(documents)),
+            timeout=self.timeout * len(documents)
+        )
+        return self._parse_batch_response(raw_response, len(documents))
+
+    @staticmethod
+    def _parse_batch_response(raw_response: Optional[str], count: int) -> List[Optional[str]]:
+        """
+        Extract the per-document answers from a multi-document response
+
+        Args:
+            raw_response: Raw response text (may contain reasoning before the JSON list)
+            count: Number of documents in the prompt
+
+        Returns:
+            Answer per document; all None if the list is missing or has the wrong length
+        """
+        answers: List[Optional[str]] = [None] * count
+        if not raw_response:
+            return answers
+
+        response_text = raw_response.split('</think>')[-1]
+        start = response_text.find('[')
+        end = response_text.rfind(']')
+        if start == -1 or end < start:
+            return answers
+
         try:
-            # Build enhanced prompt with template information
-            prompt = self._build_enhanced_prompt(text, filename, category_info, template_result)
+            entries = json.loads(response_text[start:end + 1])
+        except ValueError:
+            return answers
 
-            # Prepare request
-            request_config = self.prompt_manager.get_request_config()
-            request_data = {
-                **request_config,
-                "messages": [
-                    {"role": "system", "content": self._get_enhanced_system_message()},
-                    {"role": "user", "content": prompt}
-                ]
-            }
+        if not isinstance(entries, list) or len(entries) != count:
+            return answers
+
+        return [entry.strip() if isinstance(entry, str) and entry.strip() else None for entry in entries]
 
+    def _encode_chat_request(self, system_message: str, prompt: str,
+                             request_config: Optional[Dict[str, Any]] = None) -> bytes:
+        """
+        Serialize a chat request body
+
+        Args:
+            system_message: System message
+            prompt: User prompt
+            request_config: Request configuration (default: cached standard config)
+
+        Returns:
+            JSON-encoded request body (Content-Type is set on the session)
+        """
+        return _encode_json({
+            **(request_config or self._request_config),
+            "messages": [
+                {"role": "system", "content": system_message},
+                {"role": "user", "content": prompt}
+            ]
+        })
+
+    def _request_chat_completion(self, system_message: str, prompt: str,
+                                 request_config: Optional[Dict[str, Any]] = None,
+                                 timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Send a single prompt to the LM Studio chat endpoint
+
+        Args:
+            system_message: System message
+            prompt: User prompt
+            request_config: Request configuration (default: cached standard config)
+            timeout: Read timeout in seconds (default: self.timeout)
+
+        Returns:
+            Raw response text or None on failure
+        """
+        try:
             # Make API request
-            response = requests.post(
+            response = self.session.post(
                 self.lm_studio_url,
-                json=request_data,
-                timeout=self.timeout
+                data=self._encode_chat_request(system_message, prompt, request_config),
+                timeout=(LM_CONNECT_TIMEOUT, timeout or self.timeout)
             )
 
-            if response.status_code == 200:
-                result = response.json()
-                raw_response = result['choices'][0]['message']['content'].strip()
+            if response.status_code != 200:
+                _log_api_error("LM Studio API error", response)
+                return None
 
-                # Parse response and extract category + subdirectory
-                classification_result = self.parse_ai_response(raw_response, available_categories)
+            result = response.json()
+            return result['choices'][0]['message']['content'].strip()
 
-                if classification_result['category'] in available_categories:
-                    return classification_result
-                else:
-                    # Return first available category as fallback
-                    return {
-                        'category': available_categories[0] if available_categories else 'Sonstiges',
-                        'subdirectory': ''
-                    }
+        except Exception as e:
+            logger.error("Error calling LM Studio", exception=e)
+            return None
+
+    def _classify_from_template(self, template_result: Optional[DocumentTypeResult],
+                                available_categories: List[str]) -> Optional[Dict[str, str]]:
+        """Map a high-confidence template recognition directly to a category"""
+        if not template_result or template_result.confidence <= 0.8:
+            return None
+
+        # Try to map document type to available categories
+        category_mapping = self._map_document_type_to_category(
+            template_result.document_type, available_categories
+        )
+
+        if not category_mapping:
+            return None
+
+        return {
+            'category': category_mapping['category'],
+            'subdirectory': category_mapping.get('subdirectory', template_result.document_type)
+        }
 
+    def _classify_by_keywords(self, text: str, available_categories: List[str]) -> Optional[Dict[str, str]]:
+        """
+        Rule-based classification for documents with unambiguous keywords
+
+        Args:
+            text: Document text content
+            available_categories: List of valid categories
+
+        Returns:
+            Classification dictionary if exactly one category matches, else None
+        """
+        if not text:
+            return None
+
+        text_sample = text[:KEYWORD_RULE_TEXT_LENGTH]
+        matches = set()
+        lowered_categories = lowercase_categories(tuple(available_categories))
+
+        for stem, pattern in CATEGORY_KEYWORD_RULES.items():
+            if not pattern.search(text_sample):
+                continue
+            matches.update(category for category, category_lower in lowered_categories if stem in category_lower)
+            if len(matches) > 1:
+                return None
+
+        if len(matches) != 1:
+            return None
+
+        return {'category': matches.pop(), 'subdirectory': ''}
+
+    def _classify_by_filename(self, filename: str, available_categories: List[str]) -> Optional[Dict[str, str]]:
+        """
+        Rule-based classification from fallback keywords in the filename
+
+        Args:
+            filename: Document filename
+            available_categories: List of valid categories
+
+        Returns:
+            Classification dictionary if the filename points to exactly one
+            category with at least FILENAME_RULE_MIN_CONFIDENCE, else None
+        """
+        classification = None
+        if filename:
+            filename_lower = filename.lower()
+            keyword_hits = find_fallback_keywords(filename_lower)
+            if keyword_hits:
+                classification = self._match_filename_keywords(
+                    keyword_hits, set(FILENAME_TOKEN_PATTERN.findall(filename_lower)), available_categories
+                )
+
+        with self._filename_rule_lock:
+            if classification is None:
+                self.filename_rule_misses += 1
             else:
-                print(f"LM Studio API error: {response.status_code} - {response.text}")
-                return self._enhanced_fallback_classification(text, filename, available_categories, template_result)
+                self.filename_rule_hits += 1
+        return classification
+
+    @staticmethod
+    def _match_filename_keywords(keyword_hits: Set[str], filename_words: Set[str],
+                                 available_categories: List[str]) -> Optional[Dict[str, str]]:
+        """Map filename keyword hits to a single category with confidence score"""
+        matches = set()
+        confidence = 0.0
+        lowered_categories = lowercase_categories(tuple(available_categories))
+
+        for stem, keywords in FALLBACK_KEYWORD_MAPPINGS.items():
+            stem_hits = keyword_hits.intersection(keywords)
+            if not stem_hits:
+                continue
+            matches.update(category for category, category_lower in lowered_categories if stem in category_lower)
+            if len(matches) > 1:
+                return None
+            if matches:
+                confidence = max(confidence, 1.0 if stem_hits & filename_words else 0.6)
+
+        if len(matches) != 1 or confidence < FILENAME_RULE_MIN_CONFIDENCE:
+            return None
+
+        return {'category': matches.pop(), 'subdirectory': ''}
+
+    def get_filename_rule_stats(self) -> Dict[str, Any]:
+        """
+        Get hit statistics of the filename rule
+
+        Returns:
+            Dictionary with hit and miss counters
+        """
+        with self._filename_rule_lock:
+            hits, misses = self.filename_rule_hits, self.filename_rule_misses
+        total = hits + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': round(hits / total, 3) if total else 0.0
+        }
+
+    def _request_completions_batch(self, prompts: List[str]) -> List[Optional[str]]:
+        """
+        Send several prompts as one list-of-prompts request to LM Studio
+
+        Args:
+            prompts: Complete prompts (system message already included)
+
+        Returns:
+            Raw response text per prompt (same order), None where no answer was returned
+        """
+        raw_responses: List[Optional[str]] = [None] * len(prompts)
+        if not prompts:
+            return raw_responses
+
+        try:
+            request_data = {
+                **self._request_config,
+                "prompt": prompts
+            }
+
+            response = self.session.post(
+                self.completions_url,
+                data=_encode_json(request_data),
+                timeout=(LM_CONNECT_TIMEOUT, self.timeout * len(prompts))
+            )
+
+            if response.status_code != 200:
+                _log_api_error("LM Studio batch API error", response)
+                return raw_responses
+
+            # Map choices back to their prompts by index
+            for choice in response.json().get('choices', []):
+                index = choice.get('index')
+                if isinstance(index, int) and 0 <= index < len(prompts):
+                    raw_responses[index] = choice.get('text', '').strip()
 
         except Exception as e:
-            print(f"Error calling LM Studio: {e}")
-            return self._enhanced_fallback_classification(text, filename, available_categories, template_result)
+            logger.error("Error calling LM Studio batch endpoint", exception=e)
+
+        return raw_responses
 
     def _map_document_type_to_category(self, document_type: str, available_categories: List[str]) -> Optional[Dict[str, str]]:
         """Map document type to available category"""
-        type_mappings = {
-            'invoice': ['Steuern', 'Finanzen', 'Rechnungen'],
-            'contract': ['Verträge', 'Legal'],
-            'bank_statement': ['Banken', 'Finanzen'],
-            'insurance': ['Versicherungen'],
-            'employment_contract': ['Arbeit', 'Personal', 'HR'],
-            'rental_contract': ['Wohnen', 'Immobilien', 'Miete']
-        }
-
-        if document_type not in type_mappings:
+        category = document_type_category(document_type, tuple(available_categories))
+        if category is None:
             return None
 
-        # Find best matching category
-        for preferred_category in type_mappings[document_type]:
-            for available_category in available_categories:
-                if preferred_category.lower() in available_category.lower():
-                    return {
-                        'category': available_category,
-                        'subdirectory': document_type
-                    }
-
-        return None
+        return {
+            'category': category,
+            'subdirectory': document_type
+        }
 
     def _build_enhanced_prompt(self, text: str, filename: str, category_info: str,
                              template_result: Optional[DocumentTypeResult] = None) -> str:
@@ -488,6 +1280,11 @@ Focus on accuracy and use the template information to improve classification con
             'subdirectory': subdirectory
         }
 
+    def clear_cache(self) -> None:
+        """Discard cached LM Studio classifications (exact and similarity cache)"""
+        classification_cache.clear()
+        semantic_classification_cache.clear()
+
     def test_connection(self) -> Dict[str, Any]:
         """
         Test connection to LM Studio
@@ -496,16 +1293,17 @@ Focus on accuracy and use the template information to improve classification con
             Dictionary with connection test results
         """
         try:
-            response = requests.post(
+            # Gleiche Keep-Alive-Verbindung und gleiches Modell wie die Klassifizierung
+            response = self.session.post(
                 self.lm_studio_url,
-                json={
-                    "model": "deepseek-r1-distill-qwen-7b",
+                data=_encode_json({
+                    "model": self._request_config['model'],
                     "messages": [
                         {"role": "user", "content": "Test"}
                     ],
                     "max_tokens": 5
-                },
-                timeout=5
+                }),
+                timeout=(LM_CONNECT_TIMEOUT, self.timeout)
             )
 
             return {
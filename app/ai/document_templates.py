@@ -13,6 +13,46 @@ from datetime import datetime
 from ..monitoring import get_logger
 
 
+# Metadaten-Muster, einmalig beim Import kompiliert
+DATE_PATTERNS = [
+    re.compile(r'\b(\d{1,2})[./](\d{1,2})[./](\d{4})\b'),
+    re.compile(r'\b(\d{4})-(\d{2})-(\d{2})\b'),
+    re.compile(r'\b(\d{1,2})\.\s*([A-Za-z]{3,9})\s*(\d{4})\b'),
+]
+
+AMOUNT_PATTERNS = [
+    re.compile(r'\b(\d{1,3}(?:[.,]\d{3})*[.,]\d{2})\s*€'),
+    re.compile(r'€\s*(\d{1,3}(?:[.,]\d{3})*[.,]\d{2})'),
+    re.compile(r'\b(\d{1,3}(?:[.,]\d{3})*[.,]\d{2})\s*EUR'),
+]
+
+INVOICE_NUMBER_PATTERNS = [
+    re.compile(r'(?:rechnung|invoice)[^\w]*nr\.?\s*:?\s*([A-Z0-9\-/]+)', re.IGNORECASE),
+    re.compile(r'(?:rg|inv)[^\w]*nr\.?\s*:?\s*([A-Z0-9\-/]+)', re.IGNORECASE),
+    re.compile(r'nr\.?\s*([A-Z0-9\-/]{3,})', re.IGNORECASE),
+]
+
+TAX_ID_PATTERNS = [
+    re.compile(r'ust[-\s]*id\.?\s*:?\s*([A-Z]{2}\d+)', re.IGNORECASE),
+    re.compile(r'steuer[-\s]*nr\.?\s*:?\s*([\d/\s]+)', re.IGNORECASE),
+]
+
+CONTRACT_NUMBER_PATTERNS = [
+    re.compile(r'(?:vertrag|contract)[^\w]*nr\.?\s*:?\s*([A-Z0-9\-/]+)', re.IGNORECASE),
+    re.compile(r'(?:kunden|kunde)[^\w]*nr\.?\s*:?\s*([A-Z0-9\-/]+)', re.IGNORECASE),
+]
+
+CONTRACT_DURATION_PATTERNS = [
+    re.compile(r'(?:laufzeit|gültig)\s+(?:bis|until)\s+([0-9./\-]+)', re.IGNORECASE),
+    re.compile(r'(?:endet|ends)\s+(?:am|on)\s+([0-9./\-]+)', re.IGNORECASE),
+]
+
+ACCOUNT_NUMBER_PATTERNS = [
+    re.compile(r'IBAN\s*:?\s*([A-Z]{2}\d{2}\s?[\d\s]{15,})', re.IGNORECASE),
+    re.compile(r'(?:konto|account)[^\w]*nr\.?\s*:?\s*([\d\s]+)', re.IGNORECASE),
+]
+
+
 @dataclass
 class DocumentTemplate:
     """Template für Dokumenttyp-Erkennung"""
@@ -52,6 +92,7 @@ class DocumentTemplateEngine:
         self.logger = get_logger('document_templates')
         self.templates: List[DocumentTemplate] = []
         self.templates_file = Path("document_templates.json")
+        self._compiled_patterns: Dict[str, Optional[re.Pattern]] = {}
         self._load_default_templates()
         self._load_custom_templates()
 
@@ -103,12 +144,10 @@ class DocumentTemplateEngine:
         # Pattern-Matching
         pattern_score = 0.0
         for pattern in template.patterns:
-            try:
-                if re.search(pattern, text, re.IGNORECASE | re.MULTILINE):
-                    matched_patterns.append(pattern)
-                    pattern_score += 1.0
-            except re.error:
-                self.logger.warning("Invalid regex pattern", pattern=pattern, template_id=template.id)
+            compiled = self._compile_pattern(pattern, template.id)
+            if compiled and compiled.search(text):
+                matched_patterns.append(pattern)
+                pattern_score += 1.0
 
         # Keyword-Matching
         keyword_score = 0.0
@@ -158,33 +197,37 @@ class DocumentTemplateEngine:
             metadata=metadata
         )
 
+    def _compile_pattern(self, pattern: str, template_id: str) -> Optional[re.Pattern]:
+        """Kompiliere Template-Pattern einmalig (None bei ungültigem Regex)"""
+        try:
+            return self._compiled_patterns[pattern]
+        except KeyError:
+            pass
+
+        try:
+            compiled = re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+        except re.error:
+            self.logger.warning("Invalid regex pattern", pattern=pattern, template_id=template_id)
+            compiled = None
+
+        self._compiled_patterns[pattern] = compiled
+        return compiled
+
     def _extract_metadata(self, template: DocumentTemplate, text: str) -> Dict[str, Any]:
         """Extrahiere spezifische Metadaten basierend auf Dokumenttyp"""
         metadata = {}
 
         # Datum-Extraktion
-        date_patterns = [
-            r'\b(\d{1,2})[./](\d{1,2})[./](\d{4})\b',
-            r'\b(\d{4})-(\d{2})-(\d{2})\b',
-            r'\b(\d{1,2})\.\s*([A-Za-z]{3,9})\s*(\d{4})\b'
-        ]
-
-        for pattern in date_patterns:
-            matches = re.findall(pattern, text)
+        for pattern in DATE_PATTERNS:
+            matches = pattern.findall(text)
             if matches:
                 metadata['dates'] = matches[:3]  # Maximal 3 Daten
                 break
 
         # Beträge-Extraktion
-        amount_patterns = [
-            r'\b(\d{1,3}(?:[.,]\d{3})*[.,]\d{2})\s*€',
-            r'€\s*(\d{1,3}(?:[.,]\d{3})*[.,]\d{2})',
-            r'\b(\d{1,3}(?:[.,]\d{3})*[.,]\d{2})\s*EUR',
-        ]
-
         amounts = []
-        for pattern in amount_patterns:
-            matches = re.findall(pattern, text)
+        for pattern in AMOUNT_PATTERNS:
+            matches = pattern.findall(text)
             amounts.extend(matches)
 
         if amounts:
@@ -205,26 +248,15 @@ class DocumentTemplateEngine:
         metadata = {}
 
         # Rechnungsnummer
-        invoice_patterns = [
-            r'(?:rechnung|invoice)[^\w]*nr\.?\s*:?\s*([A-Z0-9\-/]+)',
-            r'(?:rg|inv)[^\w]*nr\.?\s*:?\s*([A-Z0-9\-/]+)',
-            r'nr\.?\s*([A-Z0-9\-/]{3,})'
-        ]
-
-        for pattern in invoice_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in INVOICE_NUMBER_PATTERNS:
+            match = pattern.search(text)
             if match:
                 metadata['invoice_number'] = match.group(1)
                 break
 
         # Steuernummer/USt-ID
-        tax_patterns = [
-            r'ust[-\s]*id\.?\s*:?\s*([A-Z]{2}\d+)',
-            r'steuer[-\s]*nr\.?\s*:?\s*([\d/\s]+)',
-        ]
-
-        for pattern in tax_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in TAX_ID_PATTERNS:
+            match = pattern.search(text)
             if match:
                 metadata['tax_id'] = match.group(1)
                 break
@@ -236,25 +268,15 @@ class DocumentTemplateEngine:
         metadata = {}
 
         # Vertragsnummer
-        contract_patterns = [
-            r'(?:vertrag|contract)[^\w]*nr\.?\s*:?\s*([A-Z0-9\-/]+)',
-            r'(?:kunden|kunde)[^\w]*nr\.?\s*:?\s*([A-Z0-9\-/]+)',
-        ]
-
-        for pattern in contract_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in CONTRACT_NUMBER_PATTERNS:
+            match = pattern.search(text)
             if match:
                 metadata['contract_number'] = match.group(1)
                 break
 
         # Laufzeit
-        duration_patterns = [
-            r'(?:laufzeit|gültig)\s+(?:bis|until)\s+([0-9./\-]+)',
-            r'(?:endet|ends)\s+(?:am|on)\s+([0-9./\-]+)',
-        ]
-
-        for pattern in duration_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in CONTRACT_DURATION_PATTERNS:
+            match = pattern.search(text)
             if match:
                 metadata['end_date'] = match.group(1)
                 break
@@ -266,13 +288,8 @@ class DocumentTemplateEngine:
         metadata = {}
 
         # Kontonummer/IBAN
-        account_patterns = [
-            r'IBAN\s*:?\s*([A-Z]{2}\d{2}\s?[\d\s]{15,})',
-            r'(?:konto|account)[^\w]*nr\.?\s*:?\s*([\d\s]+)',
-        ]
-
-        for pattern in account_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in ACCOUNT_NUMBER_PATTERNS:
+            match = pattern.search(text)
             if match:
                 metadata['account_number'] = match.group(1).replace(' ', '')
                 break
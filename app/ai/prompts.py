@@ -3,26 +3,34 @@ AI Prompt Management Module
 Handles prompt templates and context building for document classification
 """
 
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 
+# Textausschnitt je Dokument im Sammel-Prompt (hält 8 Dokumente im Kontextfenster)
+BATCH_TEXT_SAMPLE_LENGTH = 1000
 
-class PromptManager:
-    """Manages AI prompts and context building for document classification"""
+# Unveränderliche Teile stehen vorne, damit LM Studio den KV-Cache des Präfixes
+# (Systemnachricht + Kategorien + Regeln) über alle Anfragen wiederverwenden kann
+BATCH_PROMPT_TEMPLATE = """Du bist ein Experte für deutsche Dokumentenklassifizierung.
+Wähle für jedes Dokument die beste Kategorie UND das beste Unterverzeichnis.
 
-    def __init__(self):
-        """Initialize prompt manager with templates"""
-        self.classification_template = self._get_classification_template()
-        self.context_hints = self._get_context_hints()
+VERFÜGBARE KATEGORIEN MIT STRUKTUR:
+{category_info}
 
-    def _get_classification_template(self) -> str:
-        """Get the main classification prompt template"""
-        return """Du bist ein Experte für deutsche Dokumentenklassifizierung.
-Analysiere das Dokument und wähle die beste Kategorie UND das beste Unterverzeichnis basierend auf Inhalt, Dateiname und verfügbaren Verzeichnissen.
+DOKUMENTE ({count}):
+{documents}
 
-DOKUMENT-KONTEXT:
-- Dateiname: {filename}
-- Textlänge: {text_length} Zeichen
-- Erkannte Hinweise: {context_hints}
+ANTWORT-FORMAT:
+Antworte ausschließlich mit einer JSON-Liste mit genau {count} Einträgen in der Reihenfolge der Dokumente.
+Jeder Eintrag hat das Format "KATEGORIE|UNTERVERZEICHNIS", z.B. ["11 finanzen|banken", "Sonstiges|"]
+
+WICHTIG: Kein zusätzlicher Text."""
+
+
+# Klassifizierungs-Prompt in zwei Teilen: die Präambel hängt nur von den Kategorien ab
+# und ist bei gleichem Kategoriekontext byte-identisch, das Dokument folgt am Ende
+CLASSIFICATION_PREAMBLE_TEMPLATE = """Du bist ein Experte für deutsche Dokumentenklassifizierung.
+Analysiere das Dokument und wähle die beste Kategorie UND das beste Unterverzeichnis basierend auf Inhalt, Dateiname und verfügbaren Verzeichnissen.
 
 VERFÜGBARE KATEGORIEN MIT STRUKTUR:
 {category_info}
@@ -37,9 +45,6 @@ KLASSIFIZIERUNGS-REGELN:
 7. Bei Wissenschaft/Studium → Bildungskategorie
 8. Bei Wohnen/Miete → Wohnkategorie (z.B. mietvertrag, hausverwaltung)
 
-DOKUMENTENTEXT (erste 2000 Zeichen):
-{text_sample}
-
 ANTWORT-FORMAT:
 Antworte im Format: "KATEGORIE|UNTERVERZEICHNIS"
 - KATEGORIE: Der exakte Hauptkategorienname aus der Liste oben
@@ -52,6 +57,41 @@ Beispiele:
 
 WICHTIG: Nur dieses Format verwenden. Kein zusätzlicher Text."""
 
+CLASSIFICATION_DOCUMENT_TEMPLATE = """DOKUMENT-KONTEXT:
+- Dateiname: {filename}
+- Textlänge: {text_length} Zeichen
+- Erkannte Hinweise: {context_hints}
+
+DOKUMENTENTEXT (erste 2000 Zeichen):
+{text_sample}"""
+
+
+@lru_cache(maxsize=8)
+def build_classification_preamble(category_info: str) -> str:
+    """
+    Format the static prompt preamble for a category context (cached)
+
+    Args:
+        category_info: Available categories information
+
+    Returns:
+        Preamble with instructions, categories and answer format
+    """
+    return CLASSIFICATION_PREAMBLE_TEMPLATE.format(category_info=category_info)
+
+
+class PromptManager:
+    """Manages AI prompts and context building for document classification"""
+
+    def __init__(self):
+        """Initialize prompt manager with templates"""
+        self.classification_template = self._get_classification_template()
+        self.context_hints = self._get_context_hints()
+
+    def _get_classification_template(self) -> str:
+        """Get the main classification prompt template (static preamble first, document last)"""
+        return f"{CLASSIFICATION_PREAMBLE_TEMPLATE}\n\n{CLASSIFICATION_DOCUMENT_TEMPLATE}"
+
     def _get_context_hints(self) -> Dict[str, List[str]]:
         """Get context hint patterns for document analysis"""
         return {
@@ -112,16 +152,66 @@ WICHTIG: Nur dieses Format verwenden. Kein zusätzlicher Text."""
         Returns:
             Complete prompt for AI classification
         """
-        context_hints = self.extract_document_context(text, filename)
+        return f"{build_classification_preamble(category_info)}\n\n{self.build_document_prompt(text, filename)}"
 
-        return self.classification_template.format(
+    def build_document_prompt(self, text: str, filename: str) -> str:
+        """
+        Build the document-specific tail of the classification prompt
+
+        Args:
+            text: Document text content
+            filename: Document filename
+
+        Returns:
+            Document context and text sample
+        """
+        return CLASSIFICATION_DOCUMENT_TEMPLATE.format(
             filename=filename or 'Unbekannt',
             text_length=len(text),
-            context_hints=context_hints,
-            category_info=category_info,
+            context_hints=self.extract_document_context(text, filename),
             text_sample=text[:2000]
         )
 
+    def build_completion_prompt(self, system_message: str, prompt: str) -> str:
+        """
+        Build a plain completion prompt for the /v1/completions endpoint
+
+        Args:
+            system_message: System instruction
+            prompt: User prompt
+
+        Returns:
+            Single prompt string combining system message and user prompt
+        """
+        return f"{system_message}\n\n{prompt}\n\nAntwort:"
+
+    def build_batch_prompt(self, documents: List[Tuple[str, str, Optional[str]]], category_info: str) -> str:
+        """
+        Build one prompt classifying several documents against the same categories
+
+        The category structure is listed only once; the model answers with a
+        JSON list holding one "KATEGORIE|UNTERVERZEICHNIS" entry per document.
+
+        Args:
+            documents: List of (text, filename, detected document type or None) tuples
+            category_info: Available categories information
+
+        Returns:
+            Complete multi-document prompt
+        """
+        document_blocks = []
+        for number, (text, filename, document_type) in enumerate(documents, 1):
+            header = f"{number}) Dateiname: {filename or 'Unbekannt'} | Hinweise: {self.extract_document_context(text, filename)}"
+            if document_type:
+                header += f" | Erkannter Typ: {document_type}"
+            document_blocks.append(f"{header}\nText: {text[:BATCH_TEXT_SAMPLE_LENGTH]}")
+
+        return BATCH_PROMPT_TEMPLATE.format(
+            count=len(documents),
+            category_info=category_info,
+            documents="\n\n".join(document_blocks)
+        )
+
     def get_system_message(self) -> str:
         """Get system message for AI classification"""
         return "Du bist ein Experte für deutsche Dokumentenklassifizierung. Antworte nur mit dem exakten Kategorienamen."
@@ -135,6 +225,14 @@ WICHTIG: Nur dieses Format verwenden. Kein zusätzlicher Text."""
             "stop": ["\n", ".", "!", "?"]
         }
 
+    def get_batch_request_config(self, document_count: int) -> Dict[str, Any]:
+        """Get request configuration for a multi-document prompt (answer spans several entries)"""
+        return {
+            "model": "deepseek-r1-distill-qwen-7b",
+            "temperature": 0.1,
+            "max_tokens": 100 * document_count
+        }
+
 
 # Default instance for backward compatibility
 default_prompt_manager = PromptManager()
@@ -0,0 +1,135 @@
+"""
+Semantic Classification Cache
+Reuses classifications of near-duplicate documents (same form letter,
+different dates or amounts) based on word-set similarity
+"""
+
+import re
+from collections import OrderedDict
+from threading import RLock
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+# Word tokens; pure numbers (dates, amounts, customer ids) are ignored so
+# letters from the same template map to nearly the same token set
+_WORD_RE = re.compile(r'[^\W_]+')
+
+# Only the prompt sample of the document is compared
+SEMANTIC_CACHE_TEXT_LENGTH = 2000
+
+
+def document_signature(text: str) -> FrozenSet[str]:
+    """
+    Build word-set signature of a document text sample
+
+    Args:
+        text: Document text content
+
+    Returns:
+        Frozen set of lowercase, non-numeric word tokens
+    """
+    sample = text[:SEMANTIC_CACHE_TEXT_LENGTH].lower()
+    return frozenset(token for token in _WORD_RE.findall(sample) if not token.isdigit())
+
+
+class SemanticCache:
+    """Bounded near-duplicate cache for classification results"""
+
+    def __init__(self, threshold: float = 0.9, maxsize: int = 512, min_tokens: int = 20):
+        """
+        Initialize semantic cache
+
+        Args:
+            threshold: Minimum Jaccard similarity for a cache hit
+            maxsize: Maximum number of cached documents
+            min_tokens: Texts with fewer tokens are too short to compare reliably
+        """
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.min_tokens = min_tokens
+        self._entries: "OrderedDict[int, Tuple[Tuple[str, ...], FrozenSet[str], Dict[str, Any]]]" = OrderedDict()
+        self._next_id = 0
+        self._lock = RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, text: str, available_categories: List[str]) -> Optional[Dict[str, Any]]:
+        """
+        Find classification of the most similar cached document
+
+        Args:
+            text: Document text content
+            available_categories: List of valid categories (must match exactly)
+
+        Returns:
+            Copy of cached classification or None
+        """
+        signature = document_signature(text)
+        if len(signature) < self.min_tokens:
+            return None
+
+        categories = tuple(available_categories)
+        size = len(signature)
+        best_id, best_similarity = None, self.threshold
+
+        with self._lock:
+            for entry_id, (entry_categories, entry_signature, _) in self._entries.items():
+                if entry_categories != categories:
+                    continue
+                # Jaccard is bounded by the size ratio; skip without intersecting
+                entry_size = len(entry_signature)
+                if min(size, entry_size) < best_similarity * max(size, entry_size):
+                    continue
+                intersection = len(signature & entry_signature)
+                similarity = intersection / (size + entry_size - intersection)
+                if similarity >= best_similarity:
+                    best_id, best_similarity = entry_id, similarity
+
+            if best_id is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(best_id)
+            self.hits += 1
+            return dict(self._entries[best_id][2])
+
+    def set(self, text: str, available_categories: List[str], result: Dict[str, Any]) -> None:
+        """
+        Store classification of a document
+
+        Args:
+            text: Document text content
+            available_categories: List of valid categories
+            result: Classification result
+        """
+        signature = document_signature(text)
+        if len(signature) < self.min_tokens:
+            return
+
+        with self._lock:
+            self._entries[self._next_id] = (tuple(available_categories), signature, dict(result))
+            self._next_id += 1
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dictionary with size, threshold, hit and miss counters
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'threshold': self.threshold,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / total, 3) if total else 0.0
+            }
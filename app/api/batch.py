@@ -8,6 +8,7 @@ from pathlib import Path
 
 from ..settings import CONFIG
 from ..monitoring import get_logger
+from ..directory import scan_pdf_entries
 from ..services.batch_processor import batch_processor, JobStatus
 
 # Create blueprint
@@ -182,11 +183,11 @@ def create_quick_batch():
         if not scan_dir.exists():
             return jsonify({'error': 'Scan directory not found'}), 404
 
-        pdf_files = list(scan_dir.glob('*.pdf'))
+        pdf_files = scan_pdf_entries(scan_dir)
         if not pdf_files:
             return jsonify({'error': 'No PDF files found in scan directory'}), 404
 
-        file_paths = [str(pdf) for pdf in pdf_files]
+        file_paths = [entry.path for entry in pdf_files]
 
         # Create and auto-start batch operation
         operation_id = batch_processor.create_batch_operation(
@@ -3,18 +3,49 @@ Directory Management API Blueprint
 Handles directory operations and path suggestions
 """
 
+import heapq
 import os
+from typing import List, Tuple
 from flask import Blueprint, request, jsonify, render_template
 
 from ..settings import CONFIG
 from ..directory import DirectoryManager, CategoryManager
+from ..directory.similarity import name_similarities
 
 # Create blueprint
 directories_bp = Blueprint('directories', __name__)
 
 # Initialize components
 directory_manager = DirectoryManager()
-category_manager = CategoryManager()
+# Verzeichnisbaum (bis 3 Ebenen) höchstens alle 5 s per stat() gegen die mtimes prüfen
+category_manager = CategoryManager(cache_ttl=5.0)
+
+# Anzahl der Kombinationsvorschläge (Standard und Obergrenze für 'max_combinations')
+DEFAULT_PATH_COMBINATIONS = 5
+MAX_PATH_COMBINATIONS = 20
+
+
+def best_category_pairs(similarities: List[float], limit: int) -> List[Tuple[int, int]]:
+    """
+    Find the index pairs (i < j) with the highest similarity sum
+
+    Only the limit + 1 best categories can be part of the best limit pairs,
+    so pairs are built from those candidates instead of all N² combinations.
+
+    Args:
+        similarities: Similarity score per category
+        limit: Number of pairs to return
+
+    Returns:
+        Best index pairs, highest similarity sum first
+    """
+    candidates = sorted(heapq.nlargest(limit + 1, range(len(similarities)), key=similarities.__getitem__))
+    candidate_pairs = (
+        (i, j)
+        for pos, i in enumerate(candidates)
+        for j in candidates[pos + 1:]
+    )
+    return heapq.nlargest(limit, candidate_pairs, key=lambda pair: similarities[pair[0]] + similarities[pair[1]])
 
 
 @directories_bp.route('/api/suggest-subdirs', methods=['POST'])
@@ -67,56 +98,54 @@ def suggest_similar_paths():
     if not filename:
         return jsonify({'error': 'Kein Dateiname angegeben'}), 400
 
+    try:
+        combination_limit = int(data.get('max_combinations', DEFAULT_PATH_COMBINATIONS))
+    except (TypeError, ValueError):
+        return jsonify({'error': 'max_combinations muss eine Zahl sein'}), 400
+    combination_limit = max(0, min(combination_limit, MAX_PATH_COMBINATIONS))
+
     # Hole alle Kategorien/Verzeichnisse
     categories = category_manager.get_smart_categories()
     similar_paths = []
     combinations = []
 
-    # Suche existierende Verzeichnisse im SORTED_DIR (max. 2 Ebenen tief)
-    existing_dirs = []
-    for root, dirs, files in os.walk(CONFIG['SORTED_DIR']):
-        depth = root[len(CONFIG['SORTED_DIR']):].count(os.sep)
-        if depth <= 2:
-            for d in dirs:
-                dir_path = os.path.join(root, d)
-                if d not in CONFIG['BLACKLIST_DIRS']:
-                    existing_dirs.append(dir_path)
-
-    # String-Similarity für Kategorien
-    for cat in categories:
-        similarity = 1.0 if cat.lower() in filename.lower() else 0.5 if filename.lower()[:3] in cat.lower() else 0.2
-        path = os.path.join(CONFIG['SORTED_DIR'], cat, filename)
+    # Kategorien und existierende Verzeichnisse (flache, gecachte Pfadliste, max. 3 Ebenen)
+    # werden in einem Aufruf bewertet
+    directory_index = category_manager.get_directory_index(max_depth=3)
+    names = categories + [dir_name for _, dir_name, _ in directory_index]
+    names_lower = [cat.lower() for cat in categories] + [dir_lower for _, _, dir_lower in directory_index]
+    similarities = name_similarities(filename, names, names_lower)
+
+    # Zielpfade per f-String aus einmal berechnetem Präfix statt os.path.join je Eintrag
+    prefix = os.path.join(CONFIG['SORTED_DIR'], '')
+    suffix = f"{os.sep}{filename}"
+
+    for cat, similarity in zip(categories, similarities):
         similar_paths.append({
             'directory': cat,
-            'path': path,
+            'path': f"{prefix}{cat}{suffix}",
             'similarity': similarity
         })
 
-    # String-Similarity für existierende Verzeichnisse
-    for dir_path in existing_dirs:
-        dir_name = os.path.basename(dir_path)
-        similarity = 1.0 if dir_name.lower() in filename.lower() else 0.5 if filename.lower()[:3] in dir_name.lower() else 0.2
-        path = os.path.join(dir_path, filename)
+    for (rel_path, dir_name, _), similarity in zip(directory_index, similarities[len(categories):]):
         similar_paths.append({
             'directory': dir_name,
-            'path': path,
+            'path': f"{prefix}{rel_path}{suffix}",
             'similarity': similarity
         })
 
-    # Kombinationsvorschläge: Jede Kategorie mit jeder anderen
-    for i, cat_a in enumerate(categories):
-        for j, cat_b in enumerate(categories):
-            if i != j:
-                combined_path_ab = os.path.join(CONFIG['SORTED_DIR'], cat_a, cat_b, filename)
-                combined_path_ba = os.path.join(CONFIG['SORTED_DIR'], cat_b, cat_a, filename)
-                combined_similarity = (similar_paths[i]['similarity'] + similar_paths[j]['similarity']) / 2
-                combinations.append({
-                    'path_a': similar_paths[i],
-                    'path_b': similar_paths[j],
-                    'combined_path_ab': combined_path_ab,
-                    'combined_path_ba': combined_path_ba,
-                    'combined_similarity': combined_similarity
-                })
+    # Kombinationsvorschläge: nur die besten Paare (jedes Paar liefert beide Reihenfolgen)
+    best_pairs = best_category_pairs(similarities[:len(categories)], combination_limit)
+
+    for i, j in best_pairs:
+        cat_a, cat_b = categories[i], categories[j]
+        combinations.append({
+            'path_a': similar_paths[i],
+            'path_b': similar_paths[j],
+            'combined_path_ab': f"{prefix}{cat_a}{os.sep}{cat_b}{suffix}",
+            'combined_path_ba': f"{prefix}{cat_b}{os.sep}{cat_a}{suffix}",
+            'combined_similarity': (similar_paths[i]['similarity'] + similar_paths[j]['similarity']) / 2
+        })
 
     return jsonify({
         'similar_paths': similar_paths,
@@ -173,5 +202,6 @@ def validate_category(category):
 def cleanup_empty_directories():
     """Remove empty directories"""
     result = directory_manager.cleanup_empty_directories()
+    category_manager.invalidate()
 
     return jsonify(result)
\ No newline at end of file
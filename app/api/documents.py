@@ -3,22 +3,33 @@ Document Processing API Blueprint
 Handles document scanning, processing, and classification
 """
 
+import hashlib
 import os
 import random
 import shutil
-from datetime import datetime
+import sqlite3
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from pathlib import Path
-from flask import Blueprint, request, jsonify
+from threading import Lock
+from typing import Dict
+from flask import Blueprint, Response, request, jsonify, send_file, url_for
 
 try:
     import psutil
+    # Prime CPU counter so later non-blocking calls return the delta
+    psutil.cpu_percent(interval=None)
 except ImportError:
     psutil = None
 
 from ..settings import CONFIG
+from ..cache import LRUCache, SQLiteCache
+from ..executors import PDF_TASK_TIMEOUT, get_pdf_executor
 from ..pdf import PDFProcessor, PDFPreviewGenerator
+from ..pdf.processor import TEXT_EXTRACTION_BUDGET
 from ..ai import DocumentClassifier, PromptManager
-from ..directory import CategoryManager
+from ..ai.classifier import classification_cache, semantic_classification_cache
+from ..directory import CategoryManager, scan_pdf_entries
 from ..monitoring import get_logger, log_performance
 from ..services.file_renaming import file_renaming_service
 
@@ -27,10 +38,217 @@ documents_bp = Blueprint('documents', __name__, url_prefix='/api')
 
 # Initialize components
 logger = get_logger('documents_api')
-pdf_processor = PDFProcessor(max_pages=3)
-preview_generator = PDFPreviewGenerator(dpi=1.5)
+pdf_processor = PDFProcessor(max_pages=3, max_chars=TEXT_EXTRACTION_BUDGET)
+preview_generator = PDFPreviewGenerator()
 document_classifier = DocumentClassifier()
-category_manager = CategoryManager()
+# Kategorien und KI-Kontext höchstens alle 5 s gegen die Verzeichnis-mtimes prüfen
+category_manager = CategoryManager(cache_ttl=5.0)
+
+# Browser-Cache für Vorschaubilder (URL enthält mtime, daher gefahrlos)
+PREVIEW_MAX_AGE = 3600
+
+# Pfade der auf der Platte gecachten Vorschaubilder, Schlüssel (path, mtime_ns, size)
+preview_cache = LRUCache(maxsize=256)
+
+# Das Verzeichnis wird beim Schreiben höchstens alle PREVIEW_SWEEP_INTERVAL Sekunden
+# auf PREVIEW_CACHE_MAX_FILES Dateien begrenzt
+PREVIEW_SWEEP_INTERVAL = 300
+next_preview_sweep = 0.0
+
+# Laufende Vorschau-Renderings je Zieldatei (process-document und /api/preview teilen sie)
+pending_previews: Dict[Path, Future] = {}
+pending_previews_lock = Lock()
+
+# Dateiinfos der Scan-Liste, Schlüssel (path, mtime_ns, size)
+file_info_cache = LRUCache(maxsize=4096)
+
+# Verarbeitungsergebnisse, Schlüssel (path, mtime_ns, size, Kategorien, Kategoriekontext)
+document_cache = LRUCache(maxsize=128)
+
+# Zweite Stufe auf der Platte: gilt über Neustarts und für alle Worker-Prozesse
+persistent_document_cache = SQLiteCache(CONFIG['DOCUMENT_CACHE_PATH'])
+
+# Zuletzt gesehene Generation des SQLite-Caches; /classify-cache/clear erhöht sie für alle Worker
+seen_cache_generation = None
+
+# Obergrenze für /api/process-batch (Texte aller Dokumente liegen gleichzeitig im Speicher)
+MAX_BATCH_DOCUMENTS = 64
+
+
+def sync_cache_generation() -> None:
+    """Verwirft die prozesslokalen Caches, wenn ein anderer Worker die Caches geleert hat"""
+    global seen_cache_generation
+    generation = persistent_document_cache.generation()
+    if generation is None or generation == seen_cache_generation:
+        return
+    if seen_cache_generation is not None:
+        document_classifier.clear_cache()
+        document_cache.clear()
+        logger.info("Classification caches cleared by another worker", generation=generation)
+    seen_cache_generation = generation
+
+
+def is_in_document_dirs(path: str) -> bool:
+    """Prüft, ob der Pfad (nach Auflösen von Symlinks und '..') im Scan- oder Zielverzeichnis liegt"""
+    resolved = Path(path).resolve()
+    for directory in (CONFIG['SCAN_DIR'], CONFIG['SORTED_DIR']):
+        try:
+            resolved.relative_to(Path(directory).resolve())
+            return True
+        except ValueError:
+            continue
+    return False
+
+
+def format_mtime(timestamp: float) -> str:
+    """Format modification time as local ISO 8601 string (seconds precision)"""
+    return time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(timestamp))
+
+
+def get_file_info(entry: os.DirEntry) -> dict:
+    """
+    Get file information dictionary for a scanned PDF
+
+    Entries are cached by (path, mtime_ns, size), so polling an unchanged
+    scan directory only costs the (cached) stat per file.
+
+    Args:
+        entry: Directory entry of the PDF
+
+    Returns:
+        Dictionary with name, path, size and modification time
+    """
+    file_stat = entry.stat()
+    cache_key = (entry.path, file_stat.st_mtime_ns, file_stat.st_size)
+    file_info = file_info_cache.get(cache_key)
+    if file_info is None:
+        file_info = {
+            'name': entry.name,
+            'path': entry.path,
+            'size': file_stat.st_size,
+            'modified': format_mtime(file_stat.st_mtime)
+        }
+        file_info_cache.set(cache_key, file_info)
+    return file_info
+
+
+def get_preview_file(pdf_path: str, file_stat: os.stat_result) -> Path:
+    """
+    Get disk cache location of the preview image for a PDF version
+
+    Args:
+        pdf_path: Path to PDF file
+        file_stat: Stat result of the PDF (mtime and size identify the version)
+
+    Returns:
+        Path of the cached preview image
+    """
+    digest = hashlib.sha1(
+        f"{pdf_path}:{file_stat.st_mtime_ns}:{file_stat.st_size}:"
+        f"{preview_generator.dpi}:{preview_generator.jpg_quality}".encode('utf-8')
+    ).hexdigest()
+    return Path(CONFIG['PREVIEW_CACHE_DIR']) / f"{digest}.{preview_generator.format}"
+
+
+def write_preview_file(preview_file: Path, image_data: bytes) -> None:
+    """Write preview image atomically so concurrent requests never see partial files"""
+    global next_preview_sweep
+    preview_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = preview_file.with_name(f"{preview_file.name}.{os.getpid()}.tmp")
+    tmp_file.write_bytes(image_data)
+    os.replace(tmp_file, preview_file)
+
+    now = time.monotonic()
+    if now >= next_preview_sweep:
+        next_preview_sweep = now + PREVIEW_SWEEP_INTERVAL
+        sweep_preview_cache(preview_file.parent, CONFIG['PREVIEW_CACHE_MAX_FILES'])
+
+
+def sweep_preview_cache(preview_dir: Path, max_files: int) -> int:
+    """
+    Delete the oldest preview images beyond max_files
+
+    Preview filenames hash the PDF version and preview settings, so moved or
+    edited PDFs leave orphaned images behind; the in-memory preview_cache
+    only bounds the lookup table, not the directory.
+
+    Args:
+        preview_dir: Preview cache directory
+        max_files: Number of most recently written images to keep
+
+    Returns:
+        Number of deleted files
+    """
+    try:
+        with os.scandir(preview_dir) as entries:
+            files = [(entry.stat().st_mtime, entry.path) for entry in entries if entry.is_file()]
+    except OSError as e:
+        logger.warning("Preview cache sweep failed", preview_dir=str(preview_dir), error=repr(e))
+        return 0
+
+    excess = len(files) - max_files
+    if excess <= 0:
+        return 0
+
+    files.sort()
+    removed = 0
+    for _, path in files[:excess]:
+        try:
+            os.unlink(path)
+            removed += 1
+        except OSError:
+            pass
+    logger.info("Preview cache swept", removed=removed, kept=len(files) - removed)
+    return removed
+
+
+def schedule_preview(pdf_path: str, file_stat: os.stat_result, preview_file: Path) -> Future:
+    """
+    Render preview image in the PDF pool and store it on disk, once per version
+
+    A render already running for the same preview file is shared, so a
+    /api/preview request arriving while process-document renders waits for
+    that render instead of starting a second one.
+
+    Args:
+        pdf_path: Path to PDF file
+        file_stat: Stat result of the PDF
+        preview_file: Disk cache location from get_preview_file
+
+    Returns:
+        Future resolving to the written preview file, or None on failure
+    """
+    with pending_previews_lock:
+        pending = pending_previews.get(preview_file)
+        if pending is not None:
+            return pending
+        stored = Future()
+        pending_previews[preview_file] = stored
+
+    def store_preview(render_future: Future) -> None:
+        result = None
+        try:
+            image_data = render_future.result()
+            if image_data is not None:
+                write_preview_file(preview_file, image_data)
+                preview_cache.set((pdf_path, file_stat.st_mtime_ns, file_stat.st_size), preview_file)
+                result = preview_file
+        except Exception as e:
+            logger.warning("Preview rendering failed", pdf_path=pdf_path, error=repr(e))
+        finally:
+            with pending_previews_lock:
+                pending_previews.pop(preview_file, None)
+            stored.set_result(result)
+
+    try:
+        render_future = get_pdf_executor().submit(preview_generator.render_preview, pdf_path)
+    except Exception:
+        with pending_previews_lock:
+            pending_previews.pop(preview_file, None)
+        stored.set_result(None)
+        raise
+    render_future.add_done_callback(store_preview)
+    return stored
 
 
 @documents_bp.route('/scan-files')
@@ -41,14 +259,7 @@ def scan_files():
     if not scan_dir.exists():
         return jsonify({'error': 'Scan directory not found'}), 404
 
-    pdf_files = []
-    for pdf_file in scan_dir.glob('*.pdf'):
-        pdf_files.append({
-            'name': pdf_file.name,
-            'path': str(pdf_file),
-            'size': pdf_file.stat().st_size,
-            'modified': datetime.fromtimestamp(pdf_file.stat().st_mtime).isoformat()
-        })
+    pdf_files = [get_file_info(entry) for entry in scan_pdf_entries(scan_dir)]
 
     return jsonify({
         'files': pdf_files,
@@ -75,7 +286,7 @@ def get_random_document():
     if not scan_dir.exists():
         return jsonify({'error': 'Scan directory not found'}), 404
 
-    pdf_files = list(scan_dir.glob('*.pdf'))
+    pdf_files = scan_pdf_entries(scan_dir)
 
     if not pdf_files:
         return jsonify({'error': 'No PDF files found'}), 404
@@ -83,12 +294,34 @@ def get_random_document():
     # Zufällige Datei auswählen
     random_file = random.choice(pdf_files)
 
-    return jsonify({
-        'name': random_file.name,
-        'path': str(random_file),
-        'size': random_file.stat().st_size,
-        'modified': datetime.fromtimestamp(random_file.stat().st_mtime).isoformat()
-    })
+    return jsonify(get_file_info(random_file))
+
+
+def build_suggestion(pdf_path: str, text: str, result: dict) -> dict:
+    """Erstellt Zielpfad und Dateinamensvorschlag aus einer Klassifizierung"""
+    filename = os.path.basename(pdf_path)
+
+    # Generate smart filename suggestion
+    suggested_category = result['category']['category']
+    filename_suggestion = file_renaming_service.suggest_filename(filename, text, suggested_category)
+
+    # Vorgeschlagenen Pfad generieren mit AI-Unterverzeichnis
+    suggested_subdirectory = result['category'].get('subdirectory', '')
+
+    if suggested_subdirectory:
+        suggested_path = os.path.join(CONFIG['SORTED_DIR'], suggested_category, suggested_subdirectory, filename_suggestion['suggested_filename'])
+    else:
+        suggested_path = os.path.join(CONFIG['SORTED_DIR'], suggested_category, filename_suggestion['suggested_filename'])
+
+    return {
+        'suggested_category': suggested_category,
+        'suggested_subdirectory': suggested_subdirectory,
+        'suggested_path': suggested_path,
+        'original_path': pdf_path,
+        'context_hints': result['context_hints'],
+        'confidence': result['confidence'],
+        'filename_suggestion': filename_suggestion
+    }
 
 
 @documents_bp.route('/process-document', methods=['POST'])
@@ -108,52 +341,67 @@ def process_document():
                    pdf_path=pdf_path,
                    filename=os.path.basename(pdf_path))
 
-        # Preview-Image generieren
-        preview = preview_generator.generate_preview(pdf_path)
-
-        # Text extrahieren
-        text = pdf_processor.extract_text(pdf_path)
-
-        # KI-Klassifizierung
-        filename = os.path.basename(pdf_path)
+        file_stat = os.stat(pdf_path)
 
         # Hole verfügbare Kategorien und erstelle Kontext
         categories = category_manager.get_smart_categories()
         category_info = category_manager.build_category_context_for_ai()
 
+        # Unveränderte Dateien nicht erneut verarbeiten
+        sync_cache_generation()
+        cache_key = (pdf_path, file_stat.st_mtime_ns, file_stat.st_size,
+                     tuple(categories), category_info)
+        cached_response = document_cache.get(cache_key)
+        if cached_response is None:
+            cached_response = persistent_document_cache.get(cache_key)
+            if cached_response is not None:
+                document_cache.set(cache_key, cached_response)
+        if cached_response is not None:
+            logger.info("PDF processing served from cache", pdf_path=pdf_path)
+            return jsonify(cached_response)
+
+        # Preview wird separat über /api/preview als Binärbild ausgeliefert
+        preview = url_for('documents.preview', path=pdf_path, v=file_stat.st_mtime_ns)
+
+        # Text und Vorschaubild in getrennten Prozessen des PDF-Pools erzeugen
+        # (hält nicht die GIL des Request-Workers): die KI-Klassifizierung startet,
+        # sobald der Text vorliegt, und überlappt mit dem Rendern der Vorschau.
+        # Die Antwort wartet nicht auf die Vorschau; /api/preview übernimmt das
+        # laufende Rendering
+        preview_file = get_preview_file(pdf_path, file_stat)
+        if not preview_file.exists():
+            schedule_preview(pdf_path, file_stat, preview_file)
+        text = get_pdf_executor().submit(pdf_processor.extract_text, pdf_path).result(
+            timeout=PDF_TASK_TIMEOUT
+        )
+
+        # KI-Klassifizierung
+        filename = os.path.basename(pdf_path)
+
         # Klassifiziere Dokument
         result = document_classifier.classify_with_analysis(
             text, filename, categories, category_info
         )
 
-        # Generate smart filename suggestion
-        suggested_category = result['category']['category']
-        filename_suggestion = file_renaming_service.suggest_filename(filename, text, suggested_category)
-
-        # Vorgeschlagenen Pfad generieren mit AI-Unterverzeichnis
-        suggested_subdirectory = result['category'].get('subdirectory', '')
-
-        if suggested_subdirectory:
-            suggested_path = os.path.join(CONFIG['SORTED_DIR'], suggested_category, suggested_subdirectory, filename_suggestion['suggested_filename'])
-        else:
-            suggested_path = os.path.join(CONFIG['SORTED_DIR'], suggested_category, filename_suggestion['suggested_filename'])
+        response_data = {'preview': preview, **build_suggestion(pdf_path, text, result)}
 
         logger.info("PDF processing completed successfully",
                    pdf_path=pdf_path,
-                   suggested_category=suggested_category,
-                   suggested_subdirectory=suggested_subdirectory,
+                   suggested_category=response_data['suggested_category'],
+                   suggested_subdirectory=response_data['suggested_subdirectory'],
                    text_length=len(text))
 
-        return jsonify({
-            'preview': preview,
-            'suggested_category': suggested_category,
-            'suggested_subdirectory': suggested_subdirectory,
-            'suggested_path': suggested_path,
-            'original_path': pdf_path,
-            'context_hints': result['context_hints'],
-            'confidence': result['confidence'],
-            'filename_suggestion': filename_suggestion
-        })
+        document_cache.set(cache_key, response_data)
+        try:
+            persistent_document_cache.set(cache_key, response_data)
+        except sqlite3.Error as e:
+            logger.warning("Persistent document cache write failed", pdf_path=pdf_path, error=repr(e))
+
+        return jsonify(response_data)
+
+    except FutureTimeoutError:
+        logger.error("PDF processing timed out", pdf_path=pdf_path, timeout=PDF_TASK_TIMEOUT)
+        return jsonify({'error': 'PDF processing timed out'}), 504
 
     except Exception as e:
         logger.error("PDF processing failed with exception",
@@ -162,6 +410,99 @@ def process_document():
         return jsonify({'error': 'PDF processing failed'}), 500
 
 
+@documents_bp.route('/process-batch', methods=['POST'])
+@log_performance("process_batch")
+def process_batch():
+    """Klassifiziert mehrere PDFs: Texte parallel im PDF-Pool, KI in gebündelten Anfragen"""
+    data = request.get_json(silent=True) or {}
+    paths = data.get('paths')
+
+    if not isinstance(paths, list) or not paths:
+        return jsonify({'error': 'No paths provided'}), 400
+    if len(paths) > MAX_BATCH_DOCUMENTS:
+        return jsonify({'error': f'At most {MAX_BATCH_DOCUMENTS} documents per batch'}), 400
+
+    pdf_paths = [path for path in paths if isinstance(path, str) and os.path.isfile(path)]
+    missing = [path for path in paths if path not in pdf_paths]
+
+    try:
+        categories = category_manager.get_smart_categories()
+        category_info = category_manager.build_category_context_for_ai()
+
+        texts = list(get_pdf_executor().map(pdf_processor.extract_text, pdf_paths, timeout=PDF_TASK_TIMEOUT))
+        sync_cache_generation()
+        documents = [(text, os.path.basename(path)) for path, text in zip(pdf_paths, texts)]
+        results = document_classifier.classify_documents_batch(documents, categories, category_info)
+
+        processed = [
+            build_suggestion(path, text, result)
+            for path, text, result in zip(pdf_paths, texts, results)
+        ]
+
+        logger.info("PDF batch processing completed",
+                   processed=len(processed),
+                   missing=len(missing))
+
+        return jsonify({'results': processed, 'missing': missing})
+
+    except FutureTimeoutError:
+        logger.error("PDF batch text extraction timed out",
+                    document_count=len(pdf_paths),
+                    timeout=PDF_TASK_TIMEOUT)
+        return jsonify({'error': 'PDF batch processing timed out'}), 504
+
+    except Exception as e:
+        logger.error("PDF batch processing failed with exception",
+                    document_count=len(pdf_paths),
+                    exception=e)
+        return jsonify({'error': 'PDF batch processing failed'}), 500
+
+
+@documents_bp.route('/preview')
+def preview():
+    """Liefert das Vorschaubild eines PDFs als Binärdaten"""
+    pdf_path = request.args.get('path', '')
+
+    if not pdf_path.lower().endswith('.pdf') or not os.path.isfile(pdf_path):
+        return jsonify({'error': 'PDF file not found'}), 404
+
+    # Nur Dokumente aus Scan- und Zielverzeichnis, nicht beliebige PDFs des Servers
+    if not is_in_document_dirs(pdf_path):
+        return jsonify({'error': 'PDF must be in scan or sorted directory'}), 403
+
+    file_stat = os.stat(pdf_path)
+    cache_key = (pdf_path, file_stat.st_mtime_ns, file_stat.st_size)
+
+    preview_file = preview_cache.get(cache_key)
+    if preview_file is None or not preview_file.exists():
+        preview_file = get_preview_file(pdf_path, file_stat)
+        if not preview_file.exists():
+            try:
+                preview_file = schedule_preview(pdf_path, file_stat, preview_file).result(
+                    timeout=PDF_TASK_TIMEOUT
+                )
+            except FutureTimeoutError:
+                logger.error("Preview generation timed out", pdf_path=pdf_path, timeout=PDF_TASK_TIMEOUT)
+                return jsonify({'error': 'Preview generation timed out'}), 504
+            if preview_file is None:
+                logger.error("Preview generation failed", pdf_path=pdf_path)
+                return jsonify({'error': 'Preview generation failed'}), 500
+        preview_cache.set(cache_key, preview_file)
+
+    # Hinter Nginx liefert der Proxy die Bilddaten aus, Python setzt nur den Header
+    accel_prefix = CONFIG['PREVIEW_ACCEL_REDIRECT']
+    if accel_prefix:
+        response = Response(mimetype=preview_generator.mimetype)
+        response.headers['X-Accel-Redirect'] = f"{accel_prefix.rstrip('/')}/{preview_file.name}"
+        return response
+
+    response = send_file(preview_file.resolve(), mimetype=preview_generator.mimetype,
+                         max_age=PREVIEW_MAX_AGE)
+    response.cache_control.public = False
+    response.cache_control.private = True
+    return response
+
+
 @documents_bp.route('/move-document', methods=['POST'])
 @log_performance("move_document")
 def move_document():
@@ -193,6 +534,8 @@ def move_document():
         result = directory_manager.move_document(source_path, target_path)
 
         if result['success']:
+            # Der Move kann neue Unterverzeichnisse angelegt haben
+            category_manager.invalidate()
             logger.info("Document moved successfully",
                        source_path=source_path,
                        target_path=result['target_path'])
@@ -257,8 +600,8 @@ def get_system_stats():
 
     if psutil:
         try:
-            # CPU percentage (1 second interval for accuracy)
-            stats['cpu_percent'] = round(psutil.cpu_percent(interval=0.1), 1)
+            # CPU percentage since the previous call (non-blocking)
+            stats['cpu_percent'] = round(psutil.cpu_percent(interval=None), 1)
 
             # Memory percentage
             memory = psutil.virtual_memory()
@@ -276,6 +619,33 @@ def get_system_stats():
     return stats
 
 
+@documents_bp.route('/classify-cache/stats')
+def classify_cache_stats():
+    """Statistiken des Klassifizierungs-Caches (Trefferquote)"""
+    stats = classification_cache.get_stats()
+    stats['semantic'] = semantic_classification_cache.get_stats()
+    stats['batching'] = document_classifier.batcher.get_stats()
+    stats['filename_rules'] = document_classifier.get_filename_rule_stats()
+    return jsonify(stats)
+
+
+@documents_bp.route('/classify-cache/clear', methods=['POST'])
+def clear_classify_cache():
+    """
+    Verwirft gecachte Klassifizierungen (z.B. nach Änderungen am Prompt)
+
+    Die übrigen Worker-Prozesse erkennen die erhöhte Generation des SQLite-Caches
+    bei ihrer nächsten Dokumentverarbeitung und leeren dann ihre eigenen Caches.
+    """
+    global seen_cache_generation
+    document_classifier.clear_cache()
+    document_cache.clear()
+    persistent_document_cache.clear()
+    seen_cache_generation = persistent_document_cache.generation()
+    logger.info("Classification caches cleared")
+    return jsonify({'success': True})
+
+
 @documents_bp.route('/system-status')
 def system_status():
     """Systemstatus für Frontend"""
@@ -288,7 +658,7 @@ def system_status():
     # Count cached files
     cached_count = 0
     if scan_dir.exists():
-        cached_count = len(list(scan_dir.glob('*.pdf')))
+        cached_count = len(scan_pdf_entries(scan_dir))
 
     return jsonify({
         'scan_dir_exists': scan_dir.exists(),
@@ -9,7 +9,7 @@ from flask import Blueprint, request, jsonify
 
 from ..monitoring import get_logger, ErrorReporter, LogAggregator
 from ..monitoring.performance_tracker import get_performance_tracker
-from ..middleware import performance_monitor, rate_limiter
+from ..middleware import get_client_ip, performance_monitor, rate_limiter
 
 # Create blueprint
 monitoring_bp = Blueprint('monitoring', __name__, url_prefix='/api')
@@ -328,7 +328,7 @@ def get_middleware_performance():
 def get_rate_limit_status():
     """Gibt Rate Limiting Status zurück"""
     try:
-        client_ip = request.remote_addr
+        client_ip = get_client_ip()
         rate_info = rate_limiter.get_rate_limit_info(client_ip)
 
         return jsonify({
@@ -342,11 +342,20 @@ def get_rate_limit_status():
         return jsonify({'error': 'Failed to retrieve rate limit status'}), 500
 
 
+# Dashboard wird schneller gepollt, als sich die Metriken ändern
+DASHBOARD_CACHE_TTL = 1.0
+_dashboard_cache = {'expires': 0.0, 'overview': None}
+
+
 # Dashboard Endpoint
 @monitoring_bp.route('/dashboard/overview')
 def dashboard_overview():
     """Gibt Dashboard-Übersicht zurück"""
     try:
+        now = time.monotonic()
+        if _dashboard_cache['overview'] is not None and now < _dashboard_cache['expires']:
+            return jsonify(_dashboard_cache['overview'])
+
         # Sammle verschiedene Metriken für Dashboard
         current_perf = performance_tracker.get_current_metrics()
         error_stats = error_reporter.get_error_statistics()
@@ -363,7 +372,7 @@ def dashboard_overview():
             },
             'application_stats': {
                 'total_requests': sum(current_perf.get('request_counts', {}).values()),
-                'average_response_time': _calculate_overall_avg_response_time(current_perf),
+                'average_response_time': performance_tracker.get_average_response_time(),
                 'error_count': sum(error_stats.get('total_errors', {}).values()),
                 'monitoring_active': current_perf.get('monitoring_active', False)
             },
@@ -374,24 +383,11 @@ def dashboard_overview():
             'alerts': perf_summary.get('alerts', [])[:5]  # Top 5 alerts
         }
 
+        _dashboard_cache['overview'] = overview
+        _dashboard_cache['expires'] = now + DASHBOARD_CACHE_TTL
+
         logger.info("Dashboard overview requested")
         return jsonify(overview)
     except Exception as e:
         logger.error("Failed to get dashboard overview", exception=e)
         return jsonify({'error': 'Failed to retrieve dashboard overview'}), 500
-
-
-def _calculate_overall_avg_response_time(current_perf):
-    """Berechnet durchschnittliche Response Time über alle Endpoints"""
-    response_times = current_perf.get('response_times', {})
-    if not response_times:
-        return 0
-
-    total_time = 0
-    total_requests = 0
-
-    for endpoint, stats in response_times.items():
-        total_time += stats['avg'] * stats['count']
-        total_requests += stats['count']
-
-    return total_time / total_requests if total_requests > 0 else 0
\ No newline at end of file
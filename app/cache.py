@@ -0,0 +1,248 @@
+"""
+Cache Module
+Thread-safe bounded caches shared by API handlers and background workers
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+from pathlib import Path
+from threading import RLock
+from typing import Any, Dict, Hashable, Optional
+
+
+class LRUCache:
+    """Thread-safe least-recently-used cache with a fixed number of entries"""
+
+    def __init__(self, maxsize: int = 128):
+        """
+        Initialize LRU cache
+
+        Args:
+            maxsize: Maximum number of entries kept in the cache
+        """
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get cached value and mark it as recently used
+
+        Args:
+            key: Cache key
+            default: Value returned on cache miss
+
+        Returns:
+            Cached value or default
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store value, evicting the least recently used entry if full
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove entry from cache and return its value"""
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dictionary with size, hit and miss counters
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / total, 3) if total else 0.0
+            }
+
+
+class SQLiteCache:
+    """
+    Persistent JSON cache in a SQLite file
+
+    Survives restarts and is shared by all worker processes; values must be
+    JSON-serializable. Keys are hashed with SHA-1 of their repr, so tuples of
+    strings and numbers can be used like with LRUCache. clear() increments a
+    stored generation counter, so other processes can detect it and drop
+    their in-memory caches.
+    """
+
+    def __init__(self, path: str, maxsize: int = 10000):
+        """
+        Initialize SQLite cache (the database is opened on first use)
+
+        Args:
+            path: Path of the SQLite database file
+            maxsize: Maximum number of entries; oldest entries are evicted
+        """
+        self.path = Path(path)
+        self.maxsize = maxsize
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open database and create the table if needed"""
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(self.path), timeout=5.0, check_same_thread=False)
+            # WAL: Leser blockieren Schreiber anderer Worker-Prozesse nicht
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS cache '
+                '(key TEXT PRIMARY KEY, value TEXT NOT NULL, stored_at REAL NOT NULL)'
+            )
+            connection.execute('CREATE INDEX IF NOT EXISTS cache_stored_at ON cache (stored_at)')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL)'
+            )
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    @staticmethod
+    def _hash_key(key: Hashable) -> str:
+        """Stable string key for the database"""
+        return hashlib.sha1(repr(key).encode('utf-8')).hexdigest()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get cached value
+
+        Args:
+            key: Cache key
+            default: Value returned on cache miss or database error
+
+        Returns:
+            Cached value or default
+        """
+        with self._lock:
+            try:
+                row = self._connect().execute(
+                    'SELECT value FROM cache WHERE key = ?', (self._hash_key(key),)
+                ).fetchone()
+            except sqlite3.Error:
+                row = None
+            if row is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+            return json.loads(row[0])
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store value, evicting the oldest entries if full
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+
+        Raises:
+            sqlite3.Error: If the database cannot be written
+        """
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute(
+                    'INSERT OR REPLACE INTO cache (key, value, stored_at) VALUES (?, ?, ?)',
+                    (self._hash_key(key), json.dumps(value), time.time())
+                )
+                connection.execute(
+                    'DELETE FROM cache WHERE key IN '
+                    '(SELECT key FROM cache ORDER BY stored_at DESC, rowid DESC LIMIT -1 OFFSET ?)',
+                    (self.maxsize,)
+                )
+
+    def clear(self) -> None:
+        """Remove all entries and increment the generation"""
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute('DELETE FROM cache')
+                connection.execute(
+                    "INSERT INTO meta (name, value) VALUES ('generation', 1) "
+                    "ON CONFLICT (name) DO UPDATE SET value = value + 1"
+                )
+
+    def generation(self) -> Optional[int]:
+        """
+        Get the number of clear() calls on this database (from any process)
+
+        Returns:
+            Generation counter, None if the database cannot be read
+        """
+        with self._lock:
+            try:
+                row = self._connect().execute(
+                    "SELECT value FROM meta WHERE name = 'generation'"
+                ).fetchone()
+            except sqlite3.Error:
+                return None
+            return row[0] if row else 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connect().execute('SELECT COUNT(*) FROM cache').fetchone()[0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dictionary with size, hit and miss counters
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'size': len(self),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / total, 3) if total else 0.0
+            }
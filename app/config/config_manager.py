@@ -54,6 +54,7 @@ class ConfigManager:
                 'node_modules'
             ]
         }
+        self._blacklist = frozenset(self.config['BLACKLIST_DIRS'])
     
     def get(self, key: str) -> Any:
         """Gibt den Wert für einen Konfigurationsschlüssel zurück"""
@@ -62,6 +63,8 @@ class ConfigManager:
     def set(self, key: str, value: Any) -> None:
         """Setzt den Wert für einen Konfigurationsschlüssel"""
         self.config[key] = value
+        if key == 'BLACKLIST_DIRS':
+            self._blacklist = frozenset(value)
     
     def get_path(self, key: str) -> Path:
         """Gibt einen Konfigurationswert als Path-Objekt zurück"""
@@ -78,4 +81,4 @@ class ConfigManager:
     
     def is_blacklisted(self, dirname: str) -> bool:
         """Prüft ob ein Verzeichnisname auf der Blacklist steht"""
-        return dirname in self.config['BLACKLIST_DIRS']
\ No newline at end of file
+        return dirname in self._blacklist
\ No newline at end of file
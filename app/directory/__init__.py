@@ -3,7 +3,7 @@ Directory Management Module
 Handles directory operations and category management
 """
 
-from .manager import DirectoryManager
+from .manager import DirectoryManager, scan_pdf_entries
 from .categories import CategoryManager
 
-__all__ = ['DirectoryManager', 'CategoryManager']
\ No newline at end of file
+__all__ = ['DirectoryManager', 'CategoryManager', 'scan_pdf_entries']
\ No newline at end of file
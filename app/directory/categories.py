@@ -3,54 +3,117 @@ Category Management Module
 Handles document categories and directory structure analysis
 """
 
+import os
+import time
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from ..settings import config
 
 
 class CategoryManager:
     """Manages document categories and directory structure"""
 
-    def __init__(self, sorted_dir: str = None, blacklist_dirs: List[str] = None):
+    def __init__(self, sorted_dir: str = None, blacklist_dirs: List[str] = None,
+                 cache_ttl: float = 0.0):
         """
         Initialize category manager
 
         Args:
             sorted_dir: Base directory for sorted documents (uses config if not provided)
             blacklist_dirs: List of directories to ignore (uses config if not provided)
+            cache_ttl: Seconds during which cached results are returned without
+                re-checking directory mtimes (0 checks on every call)
         """
         self.sorted_dir = Path(sorted_dir or config.sorted_dir)
-        self.blacklist_dirs = blacklist_dirs or config.blacklist_dirs
+        self.blacklist_dirs = frozenset(blacklist_dirs) if blacklist_dirs else config.blacklist_set
         self.fallback_categories = [
             'Steuern', 'Versicherungen', 'Verträge', 'Banken',
             'Medizin', 'Behörden', 'Sonstiges'
         ]
 
+        # mtime-invalidated caches: (sorted_dir mtime, categories) and
+        # (path, max_depth) -> (directory mtime snapshot, tree)
+        self._categories_cache: Optional[Tuple[Optional[int], List[str]]] = None
+        self._tree_cache: Dict[Tuple[str, int], Tuple[Dict[str, Optional[int]], Dict[str, Any]]] = {}
+        # max_depth -> (tree the index was flattened from, [(path, name, lowercase name)], [path])
+        self._paths_cache: Dict[int, Tuple[Dict[str, Any], List[Tuple[str, str, str]], List[str]]] = {}
+        # category -> (category dir mtime, subdirectories)
+        self._subdirs_cache: Dict[str, Tuple[Optional[int], List[str]]] = {}
+        # (tree the context was built from, AI category context)
+        self._ai_context_cache: Optional[Tuple[Dict[str, Any], str]] = None
+
+        # Cache key -> monotonic time of the last mtime check (see cache_ttl)
+        self.cache_ttl = cache_ttl
+        self._validated_at: Dict[Any, float] = {}
+
+    def _recently_validated(self, key: Any) -> bool:
+        """Check whether a cache entry was validated within cache_ttl"""
+        if self.cache_ttl <= 0:
+            return False
+        validated_at = self._validated_at.get(key)
+        return validated_at is not None and time.monotonic() - validated_at < self.cache_ttl
+
+    def _mark_validated(self, key: Any) -> None:
+        """Record that a cache entry was just checked against the filesystem"""
+        if self.cache_ttl > 0:
+            self._validated_at[key] = time.monotonic()
+
+    def invalidate(self) -> None:
+        """Force the next calls to re-check directory mtimes (e.g. after moving files)"""
+        self._validated_at.clear()
+
+    @staticmethod
+    def _get_mtime(path: Path) -> Optional[int]:
+        """Return directory mtime in ns, None if it does not exist"""
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
     def get_smart_categories(self) -> List[str]:
         """
         Generate intelligent categories based on existing directory structure
 
+        The result is cached until the mtime of the sorted directory changes.
+
         Returns:
             Sorted list of available categories
         """
+        cached = self._categories_cache
+        if cached is not None and self._recently_validated('categories'):
+            return list(cached[1])
+
+        mtime = self._get_mtime(self.sorted_dir)
+        if cached is not None and cached[0] == mtime:
+            self._mark_validated('categories')
+            return list(cached[1])
+
         categories = []
 
-        if self.sorted_dir.exists():
-            for item in self.sorted_dir.iterdir():
-                if item.is_dir() and item.name not in self.blacklist_dirs:
-                    categories.append(item.name)
+        if mtime is not None:
+            with os.scandir(self.sorted_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir() and entry.name not in self.blacklist_dirs:
+                        categories.append(entry.name)
 
         # Use fallback categories if directory is empty
         if not categories:
             categories = self.fallback_categories.copy()
 
-        return sorted(categories)
+        categories.sort()
+        self._categories_cache = (mtime, categories)
+        self._mark_validated('categories')
+        return list(categories)
 
     def get_directory_tree(self, base_path: Optional[Path] = None,
                           max_depth: int = 3, current_depth: int = 0) -> Dict[str, Any]:
         """
         Create directory tree with blacklist filtering
 
+        Top-level trees are cached and only rebuilt when the mtime of one of
+        the scanned directories changes. The returned tree is shared and must
+        not be modified.
+
         Args:
             base_path: Base path to scan (uses sorted_dir if not provided)
             max_depth: Maximum depth to scan
@@ -65,28 +128,107 @@ class CategoryManager:
         if base_path is None:
             base_path = self.sorted_dir
 
+        if current_depth > 0:
+            return self._build_directory_tree(base_path, max_depth, current_depth, {})
+
+        cache_key = (str(base_path), max_depth)
+        cached = self._tree_cache.get(cache_key)
+        if cached is not None and self._recently_validated(cache_key):
+            return cached[1]
+        if cached is not None and all(
+            self._get_mtime(Path(path)) == mtime for path, mtime in cached[0].items()
+        ):
+            self._mark_validated(cache_key)
+            return cached[1]
+
+        snapshot: Dict[str, Optional[int]] = {}
+        tree = self._build_directory_tree(base_path, max_depth, current_depth, snapshot)
+        self._tree_cache[cache_key] = (snapshot, tree)
+        self._mark_validated(cache_key)
+        return tree
+
+    def _build_directory_tree(self, base_path: Path, max_depth: int, current_depth: int,
+                              snapshot: Dict[str, Optional[int]]) -> Dict[str, Any]:
+        """Scan directory tree, recording the mtime of every scanned directory"""
+        if current_depth >= max_depth:
+            return {}
+
         tree = {}
 
-        if not base_path.exists():
+        mtime = self._get_mtime(base_path)
+        snapshot[str(base_path)] = mtime
+        if mtime is None:
             return tree
 
         try:
-            for item in base_path.iterdir():
-                if item.is_dir() and item.name not in self.blacklist_dirs:
-                    subtree = self.get_directory_tree(
-                        item, max_depth, current_depth + 1
-                    )
-                    tree[item.name] = {
-                        'path': str(item),
-                        'children': subtree,
-                        'has_children': bool(subtree)
-                    }
+            with os.scandir(base_path) as entries:
+                for entry in entries:
+                    if entry.is_dir() and entry.name not in self.blacklist_dirs:
+                        subtree = self._build_directory_tree(
+                            Path(entry.path), max_depth, current_depth + 1, snapshot
+                        )
+                        tree[entry.name] = {
+                            'path': entry.path,
+                            'children': subtree,
+                            'has_children': bool(subtree)
+                        }
         except PermissionError:
             # Handle permission errors gracefully
             pass
 
         return tree
 
+    def get_directory_paths(self, max_depth: int = 3) -> List[str]:
+        """
+        Get all directories below sorted_dir as flat list of relative paths
+
+        The list is flattened from the cached directory tree and rebuilt only
+        when the tree changes, so similarity searches become a linear scan.
+        The returned list is shared and must not be modified.
+
+        Args:
+            max_depth: Maximum depth to scan
+
+        Returns:
+            Relative directory paths in depth-first order
+        """
+        self.get_directory_index(max_depth)
+        return self._paths_cache[max_depth][2]
+
+    def get_directory_index(self, max_depth: int = 3) -> List[Tuple[str, str, str]]:
+        """
+        Get all directories below sorted_dir with their precomputed names
+
+        Same order and caching as get_directory_paths; the directory name and
+        its lowercase form are stored once so similarity scans do not split
+        and lowercase every path per request. The returned list is shared and
+        must not be modified.
+
+        Args:
+            max_depth: Maximum depth to scan
+
+        Returns:
+            List of (relative path, directory name, lowercase name) tuples
+        """
+        tree = self.get_directory_tree(max_depth=max_depth)
+        cached = self._paths_cache.get(max_depth)
+        if cached is not None and cached[0] is tree:
+            return cached[1]
+
+        index: List[Tuple[str, str, str]] = []
+        stack = [('', tree)]
+        while stack:
+            prefix, subtree = stack.pop()
+            for name, info in subtree.items():
+                rel_path = prefix + name
+                index.append((rel_path, name, name.lower()))
+                if info['children']:
+                    stack.append((rel_path + os.sep, info['children']))
+
+        paths = [rel_path for rel_path, _, _ in index]
+        self._paths_cache[max_depth] = (tree, index, paths)
+        return index
+
     def get_live_directory_structure(self) -> Dict[str, Any]:
         """
         Get real-time directory structure
@@ -105,6 +247,8 @@ class CategoryManager:
         """
         Build structured category information for AI classification
 
+        The text is rebuilt only when the cached directory tree changes.
+
         Returns:
             Formatted string with category structure for AI
         """
@@ -116,6 +260,10 @@ class CategoryManager:
             categories = self.get_smart_categories()
             return "Verfügbare Kategorien: " + ", ".join(categories)
 
+        cached = self._ai_context_cache
+        if cached is not None and cached[0] is directory_structure:
+            return cached[1]
+
         category_lines = []
         for category, info in directory_structure.items():
             if not info.get('has_children', False):
@@ -130,30 +278,44 @@ class CategoryManager:
                     remaining = len(info.get('children', {})) - 5
                     category_lines.append(f"   └── ... ({remaining} weitere)")
 
-        return "\n".join(category_lines)
+        context = "\n".join(category_lines)
+        self._ai_context_cache = (directory_structure, context)
+        return context
 
     def get_subdirectories(self, category: str) -> List[str]:
         """
         Get subdirectories for a specific category
 
+        The result is cached until the mtime of the category directory changes.
+
         Args:
             category: Category name
 
         Returns:
             List of subdirectory names
         """
-        subdirs = []
         category_path = self.sorted_dir / category
+        mtime = self._get_mtime(category_path)
 
-        if category_path.exists() and category_path.is_dir():
+        cached = self._subdirs_cache.get(category)
+        if cached is not None and cached[0] == mtime:
+            return list(cached[1])
+
+        subdirs = []
+        if mtime is not None and category_path.is_dir():
             try:
-                for item in category_path.iterdir():
-                    if item.is_dir() and item.name not in self.blacklist_dirs:
-                        subdirs.append(item.name)
+                with os.scandir(category_path) as entries:
+                    for entry in entries:
+                        if entry.is_dir() and entry.name not in self.blacklist_dirs:
+                            subdirs.append(entry.name)
             except PermissionError:
                 pass
 
-        return sorted(subdirs)
+        subdirs.sort()
+        # Only existing categories are cached (keys come from API input)
+        if mtime is not None:
+            self._subdirs_cache[category] = (mtime, subdirs)
+        return list(subdirs)
 
     def validate_category(self, category: str) -> bool:
         """
@@ -213,6 +375,7 @@ class CategoryManager:
 
         try:
             category_path.mkdir(parents=True, exist_ok=True)
+            self.invalidate()
             return True
         except Exception:
             return False
@@ -10,19 +10,41 @@ from typing import List, Dict, Any, Optional, Tuple
 from ..settings import config
 
 
+def scan_pdf_entries(directory) -> List[os.DirEntry]:
+    """
+    List PDF files of a directory (non-recursive, like glob('*.pdf'))
+
+    os.scandir returns the file type with the directory listing, and
+    DirEntry.stat() caches its result, so each file costs at most one stat.
+
+    Args:
+        directory: Directory to scan
+
+    Returns:
+        List of DirEntry objects for the PDF files
+    """
+    with os.scandir(directory) as entries:
+        return [
+            entry for entry in entries
+            if entry.name.endswith('.pdf') and not entry.name.startswith('.') and entry.is_file()
+        ]
+
+
 class DirectoryManager:
     """Manages directory operations and file movements"""
 
-    def __init__(self, scan_dir: str = None, sorted_dir: str = None):
+    def __init__(self, scan_dir: str = None, sorted_dir: str = None, blacklist_dirs: List[str] = None):
         """
         Initialize directory manager
 
         Args:
             scan_dir: Directory for scanned documents (uses config if not provided)
             sorted_dir: Directory for sorted documents (uses config if not provided)
+            blacklist_dirs: Directories to skip when walking trees (uses config if not provided)
         """
         self.scan_dir = Path(scan_dir or config.scan_dir)
         self.sorted_dir = Path(sorted_dir or config.sorted_dir)
+        self.blacklist_dirs = frozenset(blacklist_dirs) if blacklist_dirs is not None else config.blacklist_set
 
     def ensure_directories(self) -> Dict[str, bool]:
         """
@@ -68,11 +90,11 @@ class DirectoryManager:
             return pdf_files
 
         try:
-            for pdf_file in directory.glob('*.pdf'):
-                file_stat = pdf_file.stat()
+            for entry in scan_pdf_entries(directory):
+                file_stat = entry.stat()
                 pdf_files.append({
-                    'name': pdf_file.name,
-                    'path': str(pdf_file),
+                    'name': entry.name,
+                    'path': entry.path,
                     'size': file_stat.st_size,
                     'modified': file_stat.st_mtime
                 })
@@ -128,6 +150,36 @@ class DirectoryManager:
                 'target_path': target_path
             }
 
+    def _scan_subdirectories(self, directory) -> List[str]:
+        """Return paths of non-blacklisted subdirectories (symlinks are not followed)"""
+        with os.scandir(directory) as entries:
+            return [
+                entry.path for entry in entries
+                if entry.is_dir(follow_symlinks=False) and entry.name not in self.blacklist_dirs
+            ]
+
+    def _remove_if_empty(self, directory: str, removed_dirs: List[str]) -> bool:
+        """
+        Remove empty subdirectories bottom-up, then the directory itself if empty
+
+        Args:
+            directory: Directory to clean
+            removed_dirs: List collecting removed directory paths
+
+        Returns:
+            True if the directory was removed
+        """
+        try:
+            for entry_path in self._scan_subdirectories(directory):
+                self._remove_if_empty(entry_path, removed_dirs)
+            os.rmdir(directory)
+        except OSError:
+            # Not empty (files, blacklisted or non-removable subdirectories) or not accessible
+            return False
+
+        removed_dirs.append(directory)
+        return True
+
     def _get_unique_filename(self, file_path: Path) -> Path:
         """
         Get unique filename if file already exists
@@ -259,18 +311,27 @@ class DirectoryManager:
         if not directory.exists():
             return info
 
-        try:
-            for item in directory.rglob('*'):
-                if item.is_file():
-                    info['total_files'] += 1
-                    info['total_size'] += item.stat().st_size
-                    if item.suffix.lower() == '.pdf':
-                        info['pdf_count'] += 1
-                elif item.is_dir():
-                    info['total_dirs'] += 1
-
-        except Exception:
-            pass
+        # Depth-first walk with os.scandir; blacklisted directories are pruned
+        # before descending so their contents are never listed
+        stack = [str(directory)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if entry.name not in self.blacklist_dirs:
+                                    info['total_dirs'] += 1
+                                    stack.append(entry.path)
+                            elif entry.is_file():
+                                info['total_files'] += 1
+                                info['total_size'] += entry.stat().st_size
+                                if entry.name.lower().endswith('.pdf'):
+                                    info['pdf_count'] += 1
+                        except OSError:
+                            continue
+            except OSError:
+                continue
 
         return info
 
@@ -286,13 +347,15 @@ class DirectoryManager:
             List of suggested path dictionaries
         """
         suggestions = []
+        # Pfade per f-String statt Path-Objekten je Kategorie
+        prefix = os.path.join(str(self.sorted_dir), '')
+        suffix = f"{os.sep}{filename}"
 
         for category in categories[:5]:  # Limit to top 5 for better UX
-            category_path = self.sorted_dir / category / filename
             confidence = 0.7 if category != 'Sonstiges' else 0.3
 
             suggestions.append({
-                'path': str(category_path),
+                'path': f"{prefix}{category}{suffix}",
                 'category': category,
                 'confidence': confidence
             })
@@ -314,24 +377,13 @@ class DirectoryManager:
 
         removed_dirs = []
 
+        if not os.path.isdir(directory):
+            return {'success': True, 'removed_count': 0, 'removed_dirs': removed_dirs}
+
         try:
-            # Walk bottom-up to handle nested empty directories
-            for root, dirs, files in os.walk(str(directory), topdown=False):
-                root_path = Path(root)
-
-                # Skip if not empty
-                if files or dirs:
-                    continue
-
-                # Skip if it's the base directory
-                if root_path == directory:
-                    continue
-
-                try:
-                    root_path.rmdir()
-                    removed_dirs.append(str(root_path))
-                except Exception:
-                    pass
+            # Depth-first scandir; blacklisted subtrees are never entered
+            for entry_path in self._scan_subdirectories(directory):
+                self._remove_if_empty(entry_path, removed_dirs)
 
             return {
                 'success': True,
@@ -0,0 +1,130 @@
+"""
+String Similarity Module
+Token-set and character based similarity for filenames and directory names
+"""
+
+import re
+from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import FrozenSet, List, Sequence
+
+try:
+    from rapidfuzz import fuzz, process, utils as fuzz_utils
+except ImportError:
+    process = None
+
+# Alphanumeric word tokens ('_' and punctuation act as separators)
+_TOKEN_RE = re.compile(r'[^\W_]+')
+
+
+@lru_cache(maxsize=4096)
+def tokenize(text: str) -> FrozenSet[str]:
+    """
+    Split text into a set of lowercase word tokens
+
+    Results are memoized: directory and file names in the sorted tree are
+    stable, so repeated similarity searches become dictionary lookups.
+
+    Args:
+        text: Filename, directory name or any other string
+
+    Returns:
+        Frozen set of tokens
+    """
+    return frozenset(_TOKEN_RE.findall(text.lower()))
+
+
+def token_similarity(tokens1: FrozenSet[str], tokens2: FrozenSet[str]) -> float:
+    """
+    Jaccard similarity of two pre-tokenized strings
+
+    Args:
+        tokens1: Tokens of the first string
+        tokens2: Tokens of the second string
+
+    Returns:
+        Similarity between 0.0 and 1.0
+    """
+    if not tokens1 or not tokens2:
+        return 0.0
+    return len(tokens1 & tokens2) / len(tokens1 | tokens2)
+
+
+def calculate_similarity(text1: str, text2: str) -> float:
+    """
+    Calculate token-set Jaccard similarity of two strings
+
+    Args:
+        text1: First string
+        text2: Second string
+
+    Returns:
+        Similarity between 0.0 and 1.0
+    """
+    return token_similarity(tokenize(text1), tokenize(text2))
+
+
+def filename_similarity(text1: str, text2: str, score_cutoff: float = 0.0) -> float:
+    """
+    Character-level similarity of two filenames
+
+    Unlike the token-set Jaccard similarity, names that differ only in a
+    single token (dates, counters, months) stay close to 1.0. Uses RapidFuzz's
+    token-set ratio if installed, otherwise difflib's SequenceMatcher on the
+    lowercase strings, whose cheap upper bounds skip hopeless pairs.
+
+    Args:
+        text1: First filename
+        text2: Second filename
+        score_cutoff: Scores below this value are returned as 0.0
+
+    Returns:
+        Similarity between 0.0 and 1.0
+    """
+    if process is not None:
+        return fuzz.token_set_ratio(
+            text1, text2, processor=fuzz_utils.default_process, score_cutoff=score_cutoff * 100
+        ) / 100.0
+
+    matcher = SequenceMatcher(None, text1.lower(), text2.lower())
+    if matcher.real_quick_ratio() < score_cutoff or matcher.quick_ratio() < score_cutoff:
+        return 0.0
+    ratio = matcher.ratio()
+    return ratio if ratio >= score_cutoff else 0.0
+
+
+def name_similarities(filename: str, names: Sequence[str], names_lower: Sequence[str]) -> List[float]:
+    """
+    Score a filename against many directory names in one call
+
+    With RapidFuzz installed the token-set ratio of all names is computed in
+    a single C-level call; otherwise the containment heuristic is used (1.0 if
+    the name occurs in the filename, 0.5 if the filename's first three
+    characters occur in the name, else 0.2).
+
+    Args:
+        filename: Filename to match
+        names: Directory or category names
+        names_lower: Lowercase form of names (same order)
+
+    Returns:
+        Similarity between 0.0 and 1.0 per name (same order)
+    """
+    if not names:
+        return []
+
+    if process is not None:
+        scores = [0.0] * len(names)
+        for _, score, index in process.extract(
+            filename, names, scorer=fuzz.token_set_ratio,
+            processor=fuzz_utils.default_process, limit=None
+        ):
+            scores[index] = score / 100.0
+        return scores
+
+    filename_lower = filename.lower()
+    filename_prefix = filename_lower[:3]
+    return [
+        1.0 if name_lower in filename_lower else 0.5 if filename_prefix in name_lower else 0.2
+        for name_lower in names_lower
+    ]
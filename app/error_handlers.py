@@ -9,6 +9,7 @@ from flask import jsonify, request
 from werkzeug.exceptions import HTTPException
 
 from .monitoring import get_logger, ErrorReporter
+from .middleware import get_client_ip
 
 logger = get_logger('error_handlers')
 error_reporter = ErrorReporter()
@@ -23,7 +24,7 @@ def register_error_handlers(app):
         logger.warning("404 Not Found",
                       path=request.path,
                       method=request.method,
-                      remote_addr=request.remote_addr)
+                      remote_addr=get_client_ip())
 
         return jsonify({
             'error': 'Not Found',
@@ -53,7 +54,7 @@ def register_error_handlers(app):
         logger.warning("401 Unauthorized",
                       path=request.path,
                       method=request.method,
-                      remote_addr=request.remote_addr)
+                      remote_addr=get_client_ip())
 
         return jsonify({
             'error': 'Unauthorized',
@@ -68,7 +69,7 @@ def register_error_handlers(app):
         logger.warning("403 Forbidden",
                       path=request.path,
                       method=request.method,
-                      remote_addr=request.remote_addr)
+                      remote_addr=get_client_ip())
 
         return jsonify({
             'error': 'Forbidden',
@@ -83,7 +84,7 @@ def register_error_handlers(app):
         logger.warning("429 Rate Limit Exceeded",
                       path=request.path,
                       method=request.method,
-                      remote_addr=request.remote_addr)
+                      remote_addr=get_client_ip())
 
         return jsonify({
             'error': 'Rate Limit Exceeded',
@@ -101,7 +102,7 @@ def register_error_handlers(app):
             {
                 'path': request.path,
                 'method': request.method,
-                'remote_addr': request.remote_addr,
+                'remote_addr': get_client_ip(),
                 'traceback': traceback.format_exc()
             }
         )
@@ -145,7 +146,7 @@ def register_error_handlers(app):
             {
                 'path': request.path,
                 'method': request.method,
-                'remote_addr': request.remote_addr,
+                'remote_addr': get_client_ip(),
                 'traceback': traceback.format_exc(),
                 'error_type': type(error).__name__
             }
@@ -0,0 +1,65 @@
+"""
+Shared Executors
+Worker pools for blocking PDF work, shared by API handlers and background services
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from threading import Lock
+from typing import Optional
+
+# PyMuPDF is not thread-safe and holds the GIL while parsing and rendering,
+# so PDF work runs in worker processes instead of request threads
+PDF_WORKERS = min(8, os.cpu_count() or 1)
+
+# Obergrenze für das Warten eines Request-Threads auf den Pool (Sekunden); unter
+# gthread beendet der Gunicorn-Timeout hängende Threads nicht
+PDF_TASK_TIMEOUT = 60
+
+# Der Pool startet aus Request-Threads eines Multi-Thread-Workers; ein fork() könnte
+# Locks anderer Threads (Batcher, Monitoring, MuPDF) gesperrt in die Kinder kopieren
+PDF_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+_pdf_executor: Optional[ProcessPoolExecutor] = None
+_lock = Lock()
+
+
+def get_pdf_executor() -> ProcessPoolExecutor:
+    """
+    Get shared process pool for PDF rendering and text extraction
+
+    The pool is created on first use so importing the application does not
+    spawn processes. Workers are started via forkserver (spawn where that is
+    unavailable) instead of forking the multi-threaded request process. A pool
+    broken by a crashed worker (segfault or OOM kill on a malformed PDF) is
+    replaced; only the tasks running at the time of the crash fail.
+
+    Returns:
+        Shared process pool executor
+    """
+    global _pdf_executor
+    with _lock:
+        if _pdf_executor is not None and _pdf_executor._broken:
+            _pdf_executor.shutdown(wait=False, cancel_futures=True)
+            _pdf_executor = None
+        if _pdf_executor is None:
+            _pdf_executor = ProcessPoolExecutor(
+                max_workers=PDF_WORKERS,
+                mp_context=multiprocessing.get_context(PDF_START_METHOD)
+            )
+        return _pdf_executor
+
+
+def shutdown_executors(wait: bool = False) -> None:
+    """
+    Shut down shared executors (recreated on next use)
+
+    Args:
+        wait: Wait for running tasks to finish
+    """
+    global _pdf_executor
+    with _lock:
+        if _pdf_executor is not None:
+            _pdf_executor.shutdown(wait=wait)
+            _pdf_executor = None
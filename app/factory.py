@@ -0,0 +1,68 @@
+"""
+Application Factory
+Builds the Flask application shared by the app.py and main.py entry points
+"""
+
+from importlib import import_module
+from typing import Callable, Optional
+
+from flask import Flask
+
+from .json_provider import OrjsonJSONProvider
+
+# Blueprints als (Modul, Attribut); Module werden erst bei der Registrierung importiert
+# Math blueprint removed
+BLUEPRINTS = [
+    ('app.api.documents', 'documents_bp'),
+    ('app.api.directories', 'directories_bp'),
+    ('app.api.monitoring', 'monitoring_bp'),
+    ('app.api.batch', 'batch_bp'),
+    ('app.api.templates', 'templates_bp'),
+    ('app.api.workflows', 'workflows_bp'),
+]
+
+
+def register_blueprints(app: Flask) -> None:
+    """Importiert und registriert alle API-Blueprints"""
+    for module_name, attribute in BLUEPRINTS:
+        app.register_blueprint(getattr(import_module(module_name), attribute))
+
+
+def create_app(import_name: str, extras: bool = True,
+               on_request: Optional[Callable] = None,
+               on_response: Optional[Callable] = None) -> Flask:
+    """
+    Create Flask application
+
+    Args:
+        import_name: Import name of the entry module (determines the root path
+            for templates and static files)
+        extras: Set up production config, error handlers, middleware and API
+            blueprints; the minimal app only gets the JSON provider
+        on_request: Request hook passed to the middleware (extras only)
+        on_response: Response hook passed to the middleware (extras only)
+
+    Returns:
+        Configured Flask application
+    """
+    app = Flask(import_name, static_folder='static')
+    app.json = OrjsonJSONProvider(app)
+
+    if not extras:
+        return app
+
+    from .error_handlers import register_error_handlers
+    from .middleware import register_middleware
+    from .production_config import config_manager
+
+    # Initialize production configuration
+    config_manager.initialize_app(app)
+
+    # Register global error handlers
+    register_error_handlers(app)
+
+    # Register performance and security middleware (inkl. Request-Logging)
+    register_middleware(app, on_request=on_request, on_response=on_response)
+
+    register_blueprints(app)
+    return app
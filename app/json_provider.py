@@ -0,0 +1,94 @@
+"""
+JSON Provider Module
+Fast JSON serialization for Flask responses using orjson when installed
+"""
+
+from typing import Any, Optional
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Arguments of json.dumps that the orjson path can honour
+_SUPPORTED_DUMP_ARGS = frozenset({'indent', 'separators'})
+
+
+class OrjsonJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson
+
+    Output matches the default provider (sorted keys, RFC 822 dates via
+    ``default``); falls back to the stdlib implementation if orjson is not
+    installed or cannot serialize a value. Request bodies are parsed with
+    orjson as well.
+    """
+
+    def _orjson_dumps(self, obj: Any, indent: Optional[int] = None) -> bytes:
+        """Serialize object to UTF-8 JSON bytes with orjson"""
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def _use_orjson(self, kwargs: dict) -> bool:
+        """Check whether the requested dump arguments can be served by orjson"""
+        if orjson is None or not _SUPPORTED_DUMP_ARGS.issuperset(kwargs):
+            return False
+        return kwargs.get('indent') in (None, 2)
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """
+        Serialize data as JSON string
+
+        Args:
+            obj: Data to serialize
+            **kwargs: Arguments for json.dumps (unsupported ones use stdlib json)
+
+        Returns:
+            JSON string
+        """
+        if self._use_orjson(kwargs):
+            try:
+                return self._orjson_dumps(obj, kwargs.get('indent')).decode('utf-8')
+            except TypeError:
+                pass
+        return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs: Any) -> Any:
+        """
+        Deserialize JSON from string or bytes (request bodies)
+
+        Args:
+            s: Text or UTF-8 bytes
+            **kwargs: Arguments for json.loads (any given argument uses stdlib json)
+
+        Returns:
+            Deserialized data
+        """
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        """
+        Serialize arguments into a JSON response
+
+        The orjson bytes are passed to the response directly, avoiding the
+        str round trip of the default provider.
+        """
+        if orjson is None:
+            return super().response(*args, **kwargs)
+
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = 2 if (self.compact is None and self._app.debug) or self.compact is False else None
+        try:
+            data = self._orjson_dumps(obj, indent)
+        except TypeError:
+            return super().response(*args, **kwargs)
+
+        return self._app.response_class(data + b"\n", mimetype=self.mimetype)
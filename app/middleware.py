@@ -20,6 +20,9 @@ logger = get_logger('middleware')
 class RateLimiter:
     """Token bucket rate limiter with per-IP tracking"""
 
+    # Seconds between sweeps of idle buckets
+    CLEANUP_INTERVAL = 300
+
     def __init__(self):
         self.config = config_manager.config
         self.buckets = defaultdict(lambda: {
@@ -27,10 +30,14 @@ class RateLimiter:
             'last_update': time.time()
         })
         self.request_history = defaultdict(deque)
+        self._next_cleanup = time.time() + self.CLEANUP_INTERVAL
 
     def is_allowed(self, client_ip: str) -> bool:
         """Check if request is allowed for given IP"""
         now = time.time()
+        if now >= self._next_cleanup:
+            self._next_cleanup = now + self.CLEANUP_INTERVAL
+            self.cleanup_old_entries()
         bucket = self.buckets[client_ip]
 
         # Calculate tokens to add based on time passed
@@ -53,7 +60,14 @@ class RateLimiter:
 
     def get_rate_limit_info(self, client_ip: str) -> dict:
         """Get rate limit information for client"""
-        bucket = self.buckets[client_ip]
+        bucket = self.buckets.get(client_ip)
+        if bucket is None:
+            # Unknown clients have a full bucket; do not create an entry for them
+            return {
+                'remaining': self.config.rate_limit_burst,
+                'limit': self.config.rate_limit_burst,
+                'reset_time': time.time() + 60
+            }
         return {
             'remaining': int(bucket['tokens']),
             'limit': self.config.rate_limit_burst,
@@ -66,12 +80,12 @@ class RateLimiter:
         cutoff = now - 3600  # Clean entries older than 1 hour
 
         old_keys = [
-            ip for ip, bucket in self.buckets.items()
+            ip for ip, bucket in list(self.buckets.items())
             if bucket['last_update'] < cutoff
         ]
 
         for key in old_keys:
-            del self.buckets[key]
+            self.buckets.pop(key, None)
 
         logger.debug(f"Cleaned up {len(old_keys)} old rate limit entries")
 
@@ -183,20 +197,55 @@ class SecurityMiddleware:
         return True
 
 
+def get_client_ip() -> str:
+    """
+    Get client IP of the current request, resolved once and stored on g
+
+    X-Forwarded-For is only honoured with TRUST_PROXY_HEADERS=true, since
+    clients could otherwise spoof their address past rate limits and blocks.
+
+    Returns:
+        Client IP address
+    """
+    client_ip = g.get('client_ip')
+    if client_ip is None:
+        environ = request.environ
+        client_ip = environ.get('REMOTE_ADDR', '')
+        if config_manager.config.trust_proxy_headers:
+            forwarded = environ.get('HTTP_X_FORWARDED_FOR')
+            if forwarded:
+                client_ip = forwarded.split(',', 1)[0].strip()
+        g.client_ip = client_ip
+    return client_ip
+
+
 # Global middleware instances
 rate_limiter = RateLimiter()
 performance_monitor = PerformanceMonitor()
 security_middleware = SecurityMiddleware()
 
 
-def register_middleware(app):
-    """Register all middleware with Flask app"""
+def register_middleware(app, on_request=None, on_response=None):
+    """
+    Register all middleware with Flask app
+
+    Middleware and application request hooks are merged into one
+    before_request/after_request pair, so Flask dispatches a single hook per
+    phase and the request duration is measured once for all consumers.
+
+    Args:
+        app: Flask application
+        on_request: Optional hook called after the middleware checks passed
+        on_response: Optional hook called as on_response(response, duration)
+            before the middleware headers are added; returns the response
+    """
 
     @app.before_request
     def before_request():
         """Pre-request middleware"""
-        g.start_time = time.time()
-        client_ip = request.remote_addr
+        # Gemeinsame Startzeit aller Request-Hooks (monoton, ganzzahlige ns, request-lokal)
+        g.start_ns = time.perf_counter_ns()
+        client_ip = get_client_ip()
 
         # Security checks
         if security_middleware.is_ip_blocked(client_ip):
@@ -224,23 +273,32 @@ def register_middleware(app):
                 response.headers['X-RateLimit-Reset'] = str(int(rate_info['reset_time']))
                 return response, 429
 
+        if on_request is not None:
+            return on_request()
+
     @app.after_request
     def after_request(response):
         """Post-request middleware"""
         # Calculate request duration
-        duration = time.time() - g.get('start_time', time.time())
+        start_ns = g.get('start_ns')
+        duration = (time.perf_counter_ns() - start_ns) / 1e9 if start_ns is not None else 0.0
+
+        if on_response is not None:
+            response = on_response(response, duration)
+
+        path = request.path
 
         # Record performance metrics
         performance_monitor.record_request(
-            request.path,
-            request.method,
+            path,
+            request.environ.get('REQUEST_METHOD'),
             duration,
             response.status_code
         )
 
         # Add rate limit headers for API requests
-        if request.path.startswith('/api/'):
-            rate_info = rate_limiter.get_rate_limit_info(request.remote_addr)
+        if path.startswith('/api/'):
+            rate_info = rate_limiter.get_rate_limit_info(get_client_ip())
             response.headers['X-RateLimit-Limit'] = str(config_manager.config.rate_limit_burst)
             response.headers['X-RateLimit-Remaining'] = str(rate_info['remaining'])
             response.headers['X-RateLimit-Reset'] = str(int(rate_info['reset_time']))
@@ -253,19 +311,7 @@ def register_middleware(app):
 
         return response
 
-    # Periodic cleanup task (runs every hour)
-    def cleanup_middleware():
-        """Clean up old middleware data"""
-        rate_limiter.cleanup_old_entries()
-        logger.info("Middleware cleanup completed")
-
-    # Schedule cleanup (in production, this would be handled by a scheduler)
-    # For now, we'll clean up periodically during requests
-    cleanup_counter = getattr(app, '_cleanup_counter', 0)
-    app._cleanup_counter = cleanup_counter + 1
-
-    if app._cleanup_counter % 1000 == 0:  # Clean up every 1000 requests
-        cleanup_middleware()
+    # Idle rate limit buckets are swept by RateLimiter.is_allowed every CLEANUP_INTERVAL
 
 
 def rate_limit(per_minute: int = None, burst: int = None):
@@ -273,14 +319,14 @@ def rate_limit(per_minute: int = None, burst: int = None):
     def decorator(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            client_ip = request.remote_addr
+            client_ip = get_client_ip()
 
             # Use custom limits if provided, otherwise use global config
             limit_per_minute = per_minute or config_manager.config.rate_limit_per_minute
             limit_burst = burst or config_manager.config.rate_limit_burst
 
-            # Create custom rate limiter for this endpoint
-            endpoint_key = f"{client_ip}:{request.endpoint}"
+            # Create custom rate limiter for this endpoint (tuple key, no string formatting)
+            endpoint_key = (client_ip, request.endpoint)
 
             # Simple check (in production, use Redis or similar)
             if hasattr(f, '_rate_limit_cache'):
@@ -289,13 +335,12 @@ def rate_limit(per_minute: int = None, burst: int = None):
                 cache = f._rate_limit_cache = {}
 
             now = time.time()
-            if endpoint_key not in cache:
-                cache[endpoint_key] = {
+            endpoint_data = cache.get(endpoint_key)
+            if endpoint_data is None:
+                endpoint_data = cache[endpoint_key] = {
                     'requests': deque(),
                     'tokens': limit_burst
                 }
-
-            endpoint_data = cache[endpoint_key]
             requests = endpoint_data['requests']
 
             # Remove old requests (older than 1 minute)
@@ -321,11 +366,11 @@ def performance_critical(max_duration: float = 5.0):
     def decorator(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
 
             try:
                 result = f(*args, **kwargs)
-                duration = time.time() - start_time
+                duration = (time.perf_counter_ns() - start_ns) / 1e9
 
                 if duration > max_duration:
                     logger.warning(f"Performance critical endpoint exceeded threshold",
@@ -336,7 +381,7 @@ def performance_critical(max_duration: float = 5.0):
                 return result
 
             except Exception as e:
-                duration = time.time() - start_time
+                duration = (time.perf_counter_ns() - start_ns) / 1e9
                 logger.error(f"Performance critical endpoint failed",
                            endpoint=request.endpoint,
                            duration=duration,
@@ -12,6 +12,24 @@ import traceback
 import os
 from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Markiert Records, deren Nachricht bereits ein JSON-Eintrag ist
+_STRUCTURED = {'structured': True}
+
+
+def _dumps(entry: Dict[str, Any]) -> str:
+    """Serialisiert Log-Eintrag als JSON (orjson wenn installiert)"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(entry).decode('utf-8')
+        except TypeError:
+            pass
+    return json.dumps(entry)
+
 class StructuredLogger:
     """Strukturierter Logger mit JSON-Format und Context-Support"""
 
@@ -21,7 +39,9 @@ class StructuredLogger:
         self.log_dir.mkdir(exist_ok=True)
 
         self.logger = logging.getLogger(name)
-        self.logger.setLevel(logging.INFO)
+        # LOG_LEVEL=WARNING überspringt Info-Einträge vor dem Aufbau der Kwargs
+        level = logging.getLevelName(os.getenv('LOG_LEVEL', 'INFO').upper())
+        self.logger.setLevel(level if isinstance(level, int) else logging.INFO)
 
         # Verhindere doppelte Handler
         if not self.logger.handlers:
@@ -77,6 +97,10 @@ class StructuredLogger:
         """Löscht globalen Kontext"""
         self.context.clear()
 
+    def is_enabled_for(self, level: int) -> bool:
+        """Prüft, ob Einträge des Levels ausgegeben werden (Kwargs-Aufbau sparen)"""
+        return self.logger.isEnabledFor(level)
+
     def _create_log_entry(self, level: str, message: str, **kwargs) -> Dict[str, Any]:
         """Erstellt strukturierten Log-Eintrag"""
         entry = {
@@ -97,21 +121,29 @@ class StructuredLogger:
 
     def info(self, message: str, **kwargs):
         """Info-Level Logging"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         entry = self._create_log_entry('INFO', message, **kwargs)
-        self.logger.info(json.dumps(entry))
+        self.logger.info(_dumps(entry), extra=_STRUCTURED)
 
     def debug(self, message: str, **kwargs):
         """Debug-Level Logging"""
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         entry = self._create_log_entry('DEBUG', message, **kwargs)
-        self.logger.debug(json.dumps(entry))
+        self.logger.debug(_dumps(entry), extra=_STRUCTURED)
 
     def warning(self, message: str, **kwargs):
         """Warning-Level Logging"""
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
         entry = self._create_log_entry('WARNING', message, **kwargs)
-        self.logger.warning(json.dumps(entry))
+        self.logger.warning(_dumps(entry), extra=_STRUCTURED)
 
     def error(self, message: str, exception: Optional[Exception] = None, **kwargs):
         """Error-Level Logging mit Exception-Support"""
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
         entry = self._create_log_entry('ERROR', message, **kwargs)
 
         if exception:
@@ -121,7 +153,7 @@ class StructuredLogger:
                 'traceback': traceback.format_exc()
             }
 
-        self.logger.error(json.dumps(entry))
+        self.logger.error(_dumps(entry), extra=_STRUCTURED)
 
     def critical(self, message: str, exception: Optional[Exception] = None, **kwargs):
         """Critical-Level Logging"""
@@ -134,12 +166,16 @@ class StructuredLogger:
                 'traceback': traceback.format_exc()
             }
 
-        self.logger.critical(json.dumps(entry))
+        self.logger.critical(_dumps(entry), extra=_STRUCTURED)
 
 class StructuredFormatter(logging.Formatter):
     """Custom Formatter für strukturierte Logs"""
 
     def format(self, record):
+        # Einträge des StructuredLogger sind bereits serialisiert
+        if getattr(record, 'structured', False):
+            return record.getMessage()
+
         # Wenn die Nachricht bereits JSON ist, gib sie direkt zurück
         try:
             json.loads(record.getMessage())
@@ -156,7 +192,7 @@ class StructuredFormatter(logging.Formatter):
                 'line': record.lineno,
                 'process_id': os.getpid()
             }
-            return json.dumps(entry)
+            return _dumps(entry)
 
 # Global Logger Instanzen
 _loggers = {}
@@ -173,11 +209,11 @@ def log_performance(operation: str):
         @wraps(func)
         async def async_wrapper(*args, **kwargs):
             logger = get_logger('performance')
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
 
             try:
                 result = await func(*args, **kwargs)
-                duration = time.time() - start_time
+                duration = (time.perf_counter_ns() - start_ns) / 1e9
 
                 logger.info(f"Operation completed: {operation}",
                            operation=operation,
@@ -186,7 +222,7 @@ def log_performance(operation: str):
                 return result
 
             except Exception as e:
-                duration = time.time() - start_time
+                duration = (time.perf_counter_ns() - start_ns) / 1e9
                 logger.error(f"Operation failed: {operation}",
                            operation=operation,
                            duration=duration,
@@ -197,11 +233,11 @@ def log_performance(operation: str):
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
             logger = get_logger('performance')
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
 
             try:
                 result = func(*args, **kwargs)
-                duration = time.time() - start_time
+                duration = (time.perf_counter_ns() - start_ns) / 1e9
 
                 logger.info(f"Operation completed: {operation}",
                            operation=operation,
@@ -210,7 +246,7 @@ def log_performance(operation: str):
                 return result
 
             except Exception as e:
-                duration = time.time() - start_time
+                duration = (time.perf_counter_ns() - start_ns) / 1e9
                 logger.error(f"Operation failed: {operation}",
                            operation=operation,
                            duration=duration,
@@ -318,7 +354,7 @@ class RequestLogger:
 
     async def __call__(self, scope, receive, send):
         if scope['type'] == 'http':
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
 
             # Request Info sammeln
             method = scope['method']
@@ -354,7 +390,7 @@ class RequestLogger:
 
             try:
                 await self.app(scope, receive, logging_send)
-                duration = time.time() - start_time
+                duration = (time.perf_counter_ns() - start_ns) / 1e9
 
                 self.logger.info("HTTP Request",
                                request=request_info,
@@ -363,7 +399,7 @@ class RequestLogger:
                                status='completed')
 
             except Exception as e:
-                duration = time.time() - start_time
+                duration = (time.perf_counter_ns() - start_ns) / 1e9
 
                 self.logger.error("HTTP Request failed",
                                 request=request_info,
@@ -13,6 +13,11 @@ from .logger import get_logger
 class PerformanceTracker:
     """System für Performance-Monitoring und Metriken"""
 
+    # Gepufferte Request-Metriken (älteste fallen bei Überlauf heraus)
+    PENDING_BUFFER_SIZE = 4096
+    # Sekunden zwischen zwei Übernahmen des Puffers
+    FLUSH_INTERVAL = 0.1
+
     def __init__(self, sample_interval: int = 60):
         self.sample_interval = sample_interval  # Sekunden
         self.logger = get_logger('performance_tracker')
@@ -34,6 +39,16 @@ class PerformanceTracker:
             'custom': defaultdict(lambda: deque(maxlen=1000))
         }
 
+        # Laufende Summen über die Response-Time-Fenster (O(1) Gesamtdurchschnitt)
+        self._response_time_sums = defaultdict(float)
+        self._response_time_total = 0.0
+        self._response_time_count = 0
+
+        # Request-Metriken werden ohne Lock gepuffert (deque.append ist atomar)
+        # und vom Flush-Thread gesammelt unter einem Lock übernommen
+        self._pending_requests = deque(maxlen=self.PENDING_BUFFER_SIZE)
+        self._flush_thread = None
+
         # Monitoring Thread
         self.monitoring_thread = None
         self.monitoring_active = False
@@ -45,6 +60,8 @@ class PerformanceTracker:
             return
 
         self.monitoring_active = True
+        # Prime CPU counter; samples then cover the whole interval without blocking
+        psutil.cpu_percent(interval=None)
         self.monitoring_thread = threading.Thread(target=self._monitoring_loop, daemon=True)
         self.monitoring_thread.start()
 
@@ -74,16 +91,23 @@ class PerformanceTracker:
         try:
             timestamp = time.time()
 
+            # Sample outside the lock so request threads recording metrics never wait on psutil
+            cpu_percent = psutil.cpu_percent(interval=None)
+            memory = psutil.virtual_memory()
+            disk = psutil.disk_usage('/')
+            network = psutil.net_io_counters()
+            process = psutil.Process()
+            connection_count = len(process.connections())
+            memory_mb = round(process.memory_info().rss / (1024**2), 2)
+
             with self.lock:
                 # CPU Usage
-                cpu_percent = psutil.cpu_percent(interval=1)
                 self.metrics['system']['cpu_percent'].append({
                     'timestamp': timestamp,
                     'value': cpu_percent
                 })
 
                 # Memory Usage
-                memory = psutil.virtual_memory()
                 self.metrics['system']['memory_percent'].append({
                     'timestamp': timestamp,
                     'value': memory.percent,
@@ -91,7 +115,6 @@ class PerformanceTracker:
                 })
 
                 # Disk Usage
-                disk = psutil.disk_usage('/')
                 self.metrics['system']['disk_usage'].append({
                     'timestamp': timestamp,
                     'value': (disk.used / disk.total) * 100,
@@ -99,7 +122,6 @@ class PerformanceTracker:
                 })
 
                 # Network I/O
-                network = psutil.net_io_counters()
                 self.metrics['system']['network_io'].append({
                     'timestamp': timestamp,
                     'bytes_sent': network.bytes_sent,
@@ -107,24 +129,99 @@ class PerformanceTracker:
                 })
 
                 # Process-spezifische Metriken
-                process = psutil.Process()
                 self.metrics['application']['active_connections'].append({
                     'timestamp': timestamp,
-                    'value': len(process.connections()),
-                    'memory_mb': round(process.memory_info().rss / (1024**2), 2)
+                    'value': connection_count,
+                    'memory_mb': memory_mb
                 })
 
         except Exception as e:
             self.logger.error("Error collecting system metrics", exception=e)
 
+    def record_request(self, endpoint: str, duration: float, error_occurred: bool):
+        """
+        Puffert Response-Zeit und Fehlerstatus eines Requests ohne Lock
+
+        Der Flush-Thread übernimmt gepufferte Einträge gesammelt per record_bulk.
+        """
+        self._ensure_flush_thread()
+        self._pending_requests.append((endpoint, duration, error_occurred, time.time()))
+
+    def _ensure_flush_thread(self):
+        """Startet Flush-Thread bei erster Verwendung"""
+        if self._flush_thread is not None and self._flush_thread.is_alive():
+            return
+        with self.lock:
+            if self._flush_thread is None or not self._flush_thread.is_alive():
+                self._flush_thread = threading.Thread(target=self._flush_loop, daemon=True)
+                self._flush_thread.start()
+
+    def _flush_loop(self):
+        """Übernimmt gepufferte Request-Metriken in festen Intervallen"""
+        while True:
+            time.sleep(self.FLUSH_INTERVAL)
+            try:
+                self.flush()
+            except Exception as e:
+                self.logger.error("Error flushing request metrics", exception=e)
+
+    def flush(self):
+        """Übernimmt alle gepufferten Request-Metriken"""
+        events = []
+        try:
+            while True:
+                events.append(self._pending_requests.popleft())
+        except IndexError:
+            pass
+        if events:
+            self.record_bulk(events)
+
+    def record_bulk(self, events: List[tuple]):
+        """
+        Zeichnet mehrere Requests mit einer Lock-Akquisition auf
+
+        Args:
+            events: Tupel (endpoint, duration, error_occurred, timestamp)
+        """
+        app_metrics = self.metrics['application']
+        with self.lock:
+            for endpoint, duration, error_occurred, timestamp in events:
+                self._add_response_time(endpoint, duration, timestamp)
+                app_metrics['error_rates'][endpoint].append({
+                    'timestamp': timestamp,
+                    'error': error_occurred
+                })
+
+    def _add_response_time(self, endpoint: str, duration: float, timestamp: float):
+        """Fügt Response-Zeit hinzu und pflegt laufende Summen (Lock muss gehalten werden)"""
+        times = self.metrics['application']['response_times'][endpoint]
+        if len(times) == times.maxlen:
+            # Ältester Eintrag fällt aus dem Fenster
+            evicted = times[0]['duration']
+            self._response_time_sums[endpoint] -= evicted
+            self._response_time_total -= evicted
+            self._response_time_count -= 1
+        times.append({
+            'timestamp': timestamp,
+            'duration': duration
+        })
+        self._response_time_sums[endpoint] += duration
+        self._response_time_total += duration
+        self._response_time_count += 1
+        self.metrics['application']['request_counts'][endpoint] += 1
+
     def record_response_time(self, endpoint: str, duration: float):
         """Zeichnet Response-Zeit für Endpoint auf"""
         with self.lock:
-            self.metrics['application']['response_times'][endpoint].append({
-                'timestamp': time.time(),
-                'duration': duration
-            })
-            self.metrics['application']['request_counts'][endpoint] += 1
+            self._add_response_time(endpoint, duration, time.time())
+
+    def get_average_response_time(self) -> float:
+        """Gibt durchschnittliche Response-Zeit über alle Endpoints zurück (laufende Summen)"""
+        self.flush()
+        with self.lock:
+            if not self._response_time_count:
+                return 0
+            return self._response_time_total / self._response_time_count
 
     def record_error_rate(self, endpoint: str, error_occurred: bool):
         """Zeichnet Error-Rate für Endpoint auf"""
@@ -145,6 +242,7 @@ class PerformanceTracker:
 
     def get_current_metrics(self) -> Dict[str, Any]:
         """Gibt aktuelle Performance-Metriken zurück"""
+        self.flush()
         with self.lock:
             current_time = time.time()
 
@@ -162,7 +260,7 @@ class PerformanceTracker:
                 if times:
                     durations = [t['duration'] for t in times]
                     response_stats[endpoint] = {
-                        'avg': sum(durations) / len(durations),
+                        'avg': self._response_time_sums[endpoint] / len(durations),
                         'min': min(durations),
                         'max': max(durations),
                         'count': len(durations)
@@ -193,6 +291,7 @@ class PerformanceTracker:
         """Gibt historische Metriken zurück"""
         cutoff_time = time.time() - (hours * 3600)
 
+        self.flush()
         with self.lock:
             historical = {
                 'time_range_hours': hours,
@@ -5,5 +5,6 @@ Handles PDF operations including text extraction and preview generation
 
 from .processor import PDFProcessor
 from .preview import PDFPreviewGenerator
+from .extraction import render_and_extract
 
-__all__ = ['PDFProcessor', 'PDFPreviewGenerator']
\ No newline at end of file
+__all__ = ['PDFProcessor', 'PDFPreviewGenerator', 'render_and_extract']
\ No newline at end of file
@@ -0,0 +1,48 @@
+"""
+Combined PDF Extraction Module
+Renders the preview and extracts the text of a PDF in a single open pass
+"""
+
+import fitz  # PyMuPDF
+from typing import Optional, Tuple
+
+from .processor import PDFProcessor
+from .preview import PDFPreviewGenerator
+
+
+def render_and_extract(pdf_path: str, pdf_processor: PDFProcessor,
+                       preview_generator: PDFPreviewGenerator,
+                       page_num: int = 0) -> Tuple[Optional[bytes], str]:
+    """
+    Render preview image and extract text from one opened document
+
+    The PDF structure is parsed only once instead of once per operation.
+
+    Args:
+        pdf_path: Path to PDF file
+        pdf_processor: Processor used for text extraction
+        preview_generator: Generator used for the preview image
+        page_num: Page number to render (0-indexed)
+
+    Returns:
+        Tuple of (encoded image bytes or None, extracted text)
+    """
+    try:
+        doc = fitz.open(pdf_path)
+    except Exception as e:
+        print(f"Error opening PDF: {e}")
+        return None, ""
+
+    with doc:
+        try:
+            image_data = preview_generator.render_page(doc, page_num)
+        except Exception as e:
+            print(f"Error creating PDF preview: {e}")
+            image_data = None
+        try:
+            text = pdf_processor.extract_text_from_document(doc)
+        except Exception as e:
+            print(f"Error extracting text from PDF: {e}")
+            text = ""
+
+    return image_data, text
@@ -4,66 +4,179 @@ Handles conversion of PDF pages to preview images
 """
 
 import base64
+import io
 import fitz  # PyMuPDF
 from typing import Optional
 from pathlib import Path
 
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+from ..monitoring import get_logger
+
+logger = get_logger('pdf_preview')
+
+
+# Vorschau in Bildschirmgröße: 1.2 (≈ 86 DPI) reicht für eine A4-Seite im Viewer,
+# JPEG-Qualität 70 ist für Scans visuell kaum von 75 zu unterscheiden
+PREVIEW_DPI = 1.2
+PREVIEW_JPEG_QUALITY = 70
+
+# pypdfium2 rastert schneller als PyMuPDF; nach einem Importfehler (z.B. Pillow fehlt)
+# wird es für den Rest des Prozesses nicht mehr versucht
+pdfium_available = pdfium is not None
+pdfium_failures = 0
+
 
 class PDFPreviewGenerator:
     """Handles PDF preview image generation"""
 
-    def __init__(self, dpi: float = 1.5, format: str = "png"):
+    def __init__(self, dpi: float = PREVIEW_DPI, format: str = "jpeg", jpg_quality: int = PREVIEW_JPEG_QUALITY):
         """
         Initialize PDF preview generator
 
         Args:
-            dpi: DPI scaling factor (1.5 = 150 DPI)
-            format: Output image format (png, jpeg)
+            dpi: Zoom factor relative to 72 DPI (1.2 ≈ 86 DPI, 1.5 = 108 DPI)
+            format: Output image format (jpeg, png); JPEG is much smaller and faster to encode for scans
+            jpg_quality: JPEG quality (1-100), ignored for PNG
         """
         self.dpi = dpi
-        self.format = format.lower()
+        self.format = "jpeg" if format.lower() == "jpg" else format.lower()
+        self.jpg_quality = jpg_quality
 
-    def generate_preview(self, pdf_path: str, page_num: int = 0) -> Optional[str]:
+    @property
+    def mimetype(self) -> str:
+        """MIME type of the rendered preview images"""
+        return f"image/{self.format}"
+
+    def render_preview(self, pdf_path: str, page_num: int = 0) -> Optional[bytes]:
         """
-        Generate base64-encoded preview image of PDF page
+        Render PDF page to raw image bytes
 
         Args:
             pdf_path: Path to PDF file
             page_num: Page number to convert (0-indexed)
 
         Returns:
-            Base64-encoded image data URL or None if error
+            Encoded image bytes or None if error
         """
         try:
             pdf_path = Path(pdf_path)
             if not pdf_path.exists():
                 raise FileNotFoundError(f"PDF file not found: {pdf_path}")
 
-            doc = fitz.open(str(pdf_path))
-
-            # Check if page exists
-            if page_num >= len(doc):
-                raise IndexError(f"Page {page_num} does not exist (PDF has {len(doc)} pages)")
+            if pdfium_available:
+                img_data = self._render_page_pdfium(str(pdf_path), page_num)
+                if img_data is not None:
+                    return img_data
 
-            page = doc[page_num]
+            with fitz.open(str(pdf_path)) as doc:
+                return self.render_page(doc, page_num)
 
-            # Render page as image with specified DPI
-            mat = fitz.Matrix(self.dpi, self.dpi)
-            pix = page.get_pixmap(matrix=mat)
+        except Exception as e:
+            print(f"Error creating PDF preview: {e}")
+            return None
 
-            # Convert to bytes
-            img_data = pix.tobytes(self.format)
-            doc.close()
+    def _render_page_pdfium(self, pdf_path: str, page_num: int) -> Optional[bytes]:
+        """
+        Render PDF page with pypdfium2 (rasterization only, no layout analysis)
 
-            # Base64 encode for HTML display
-            img_b64 = base64.b64encode(img_data).decode()
+        Args:
+            pdf_path: Path to PDF file
+            page_num: Page number to convert (0-indexed)
 
-            return f"data:image/{self.format};base64,{img_b64}"
+        Returns:
+            Encoded image bytes, or None if pypdfium2 failed and PyMuPDF should render
+        """
+        global pdfium_available, pdfium_failures
+        try:
+            pdf = pdfium.PdfDocument(pdf_path)
+            try:
+                if page_num >= len(pdf):
+                    return None
+                image = pdf[page_num].render(scale=self.dpi).to_pil()
+            finally:
+                pdf.close()
+
+            buffer = io.BytesIO()
+            if self.format == "jpeg":
+                image.convert("RGB").save(buffer, "JPEG", quality=self.jpg_quality)
+            else:
+                image.save(buffer, self.format.upper())
+            return buffer.getvalue()
 
         except Exception as e:
-            print(f"Error creating PDF preview: {e}")
+            pdfium_failures += 1
+            if isinstance(e, ImportError):
+                pdfium_available = False
+            # Erster Fehler als Warnung, weitere (z.B. verschlüsselte PDFs) nur im Debug-Log
+            log = logger.warning if pdfium_failures == 1 else logger.debug
+            log("pypdfium2 preview failed, falling back to PyMuPDF",
+                pdf_path=pdf_path, error=repr(e), disabled=not pdfium_available)
             return None
 
+    def render_page(self, doc: "fitz.Document", page_num: int = 0) -> bytes:
+        """
+        Render page of an already opened PDF to raw image bytes
+
+        Args:
+            doc: Open PyMuPDF document (caller keeps ownership)
+            page_num: Page number to convert (0-indexed)
+
+        Returns:
+            Encoded image bytes
+
+        Raises:
+            IndexError: If the page does not exist
+        """
+        # Check if page exists
+        if page_num >= len(doc):
+            raise IndexError(f"Page {page_num} does not exist (PDF has {len(doc)} pages)")
+
+        page = doc[page_num]
+
+        # Render page as image with specified DPI
+        mat = fitz.Matrix(self.dpi, self.dpi)
+        pix = page.get_pixmap(matrix=mat, alpha=False)
+
+        # Convert to bytes
+        if self.format == "jpeg":
+            return pix.tobytes("jpeg", jpg_quality=self.jpg_quality)
+        return pix.tobytes(self.format)
+
+    def generate_preview(self, pdf_path: str, page_num: int = 0) -> Optional[str]:
+        """
+        Generate base64-encoded preview image of PDF page
+
+        Args:
+            pdf_path: Path to PDF file
+            page_num: Page number to convert (0-indexed)
+
+        Returns:
+            Base64-encoded image data URL or None if error
+        """
+        img_data = self.render_preview(pdf_path, page_num)
+        if img_data is None:
+            return None
+        return self.to_data_url(img_data)
+
+    def to_data_url(self, img_data: bytes) -> str:
+        """
+        Encode rendered image bytes as data URL
+
+        Args:
+            img_data: Encoded image bytes
+
+        Returns:
+            Base64-encoded image data URL
+        """
+        # Base64 encode for HTML display
+        img_b64 = base64.b64encode(img_data).decode()
+
+        return f"data:{self.mimetype};base64,{img_b64}"
+
     def get_pdf_info(self, pdf_path: str) -> dict:
         """
         Get basic information about PDF file
@@ -7,28 +7,45 @@ import fitz  # PyMuPDF
 from typing import Optional, Dict, List
 from pathlib import Path
 
+# Plain text extraction flags: no ligature/CID handling, only what the
+# classifier needs (whitespace preserved, text clipped to the page)
+TEXT_EXTRACTION_FLAGS = fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_MEDIABOX_CLIP
+
+# Text budgets: the classifier prompt uses the first 2000 characters; template
+# recognition and filename analysis look a bit further into the document
+CLASSIFIER_TEXT_BUDGET = 3000
+TEXT_EXTRACTION_BUDGET = 8000
+
+# Broken PDFs are reported through our own error handling
+fitz.TOOLS.mupdf_display_errors(False)
+
 
 class PDFProcessor:
     """Handles PDF text extraction and processing"""
 
-    def __init__(self, max_pages: int = 3, min_text_length: int = 10):
+    def __init__(self, max_pages: int = 3, min_text_length: int = 10,
+                 max_chars: Optional[int] = None):
         """
         Initialize PDF processor
 
         Args:
             max_pages: Maximum number of pages to process for performance
             min_text_length: Minimum text length to consider valid
+            max_chars: Default character budget for extract_text (None = unlimited)
         """
         self.max_pages = max_pages
         self.min_text_length = min_text_length
+        self.max_chars = max_chars
 
-    def extract_text(self, pdf_path: str, max_pages: Optional[int] = None) -> str:
+    def extract_text(self, pdf_path: str, max_pages: Optional[int] = None,
+                     max_chars: Optional[int] = None) -> str:
         """
         Extract text content from PDF
 
         Args:
             pdf_path: Path to PDF file
             max_pages: Override default max pages limit
+            max_chars: Stop reading pages once this many characters are collected
 
         Returns:
             Extracted text content
@@ -38,25 +55,50 @@ class PDFProcessor:
             if not pdf_path.exists():
                 raise FileNotFoundError(f"PDF file not found: {pdf_path}")
 
-            doc = fitz.open(str(pdf_path))
-            text = ""
-
-            # Use parameter or instance default
-            page_limit = max_pages if max_pages is not None else self.max_pages
-
-            # Extract text from first N pages for performance
-            for page_num in range(min(page_limit, len(doc))):
-                page = doc[page_num]
-                page_text = page.get_text()
-                text += page_text
-
-            doc.close()
-            return text.strip()
+            with fitz.open(str(pdf_path)) as doc:
+                return self.extract_text_from_document(doc, max_pages, max_chars)
 
         except Exception as e:
             print(f"Error extracting text from PDF: {e}")
             return ""
 
+    def extract_text_from_document(self, doc: "fitz.Document", max_pages: Optional[int] = None,
+                                   max_chars: Optional[int] = None) -> str:
+        """
+        Extract text content from an already opened PDF
+
+        Args:
+            doc: Open PyMuPDF document (caller keeps ownership)
+            max_pages: Override default max pages limit
+            max_chars: Stop reading pages once this many characters are collected
+                       (uses instance default if not provided)
+
+        Returns:
+            Extracted text content
+        """
+        if max_chars is None:
+            max_chars = self.max_chars
+
+        parts = []
+        collected = 0
+
+        # Use parameter or instance default
+        page_limit = max_pages if max_pages is not None else self.max_pages
+
+        # Extract text from first N pages for performance
+        for page_num in range(min(page_limit, len(doc))):
+            page = doc[page_num]
+            page_text = page.get_text("text", flags=TEXT_EXTRACTION_FLAGS)
+            parts.append(page_text)
+            collected += len(page_text)
+
+            # Later pages are not decoded once the budget is reached
+            if max_chars is not None and collected >= max_chars:
+                break
+
+        text = "".join(parts).strip()
+        return text[:max_chars] if max_chars is not None else text
+
     def extract_text_by_page(self, pdf_path: str, max_pages: Optional[int] = None) -> List[str]:
         """
         Extract text content from PDF, returning list of page texts
@@ -73,25 +115,38 @@ class PDFProcessor:
             if not pdf_path.exists():
                 raise FileNotFoundError(f"PDF file not found: {pdf_path}")
 
-            doc = fitz.open(str(pdf_path))
-            page_texts = []
-
-            # Use parameter or instance default
-            page_limit = max_pages if max_pages is not None else self.max_pages
-
-            # Extract text from first N pages
-            for page_num in range(min(page_limit, len(doc))):
-                page = doc[page_num]
-                page_text = page.get_text().strip()
-                page_texts.append(page_text)
-
-            doc.close()
-            return page_texts
+            with fitz.open(str(pdf_path)) as doc:
+                return self.extract_text_by_page_from_document(doc, max_pages)
 
         except Exception as e:
             print(f"Error extracting text by page from PDF: {e}")
             return []
 
+    def extract_text_by_page_from_document(self, doc: "fitz.Document",
+                                           max_pages: Optional[int] = None) -> List[str]:
+        """
+        Extract page texts from an already opened PDF
+
+        Args:
+            doc: Open PyMuPDF document (caller keeps ownership)
+            max_pages: Override default max pages limit
+
+        Returns:
+            List of text content per page
+        """
+        page_texts = []
+
+        # Use parameter or instance default
+        page_limit = max_pages if max_pages is not None else self.max_pages
+
+        # Extract text from first N pages
+        for page_num in range(min(page_limit, len(doc))):
+            page = doc[page_num]
+            page_text = page.get_text("text", flags=TEXT_EXTRACTION_FLAGS).strip()
+            page_texts.append(page_text)
+
+        return page_texts
+
     def analyze_content(self, pdf_path: str) -> Dict[str, any]:
         """
         Analyze PDF content and extract metadata
@@ -107,9 +162,10 @@ class PDFProcessor:
             if not pdf_path.exists():
                 return {'error': f"PDF file not found: {pdf_path}"}
 
-            # Extract text
-            text = self.extract_text(pdf_path)
-            page_texts = self.extract_text_by_page(pdf_path)
+            # Extract text (document is opened only once for both passes)
+            with fitz.open(str(pdf_path)) as doc:
+                text = self.extract_text_from_document(doc)
+                page_texts = self.extract_text_by_page_from_document(doc)
 
             # Basic analysis
             analysis = {
@@ -167,6 +223,6 @@ default_processor = PDFProcessor()
 def extract_text_from_pdf(pdf_path: str) -> str:
     """
     Legacy function for backward compatibility
-    Extracts text from PDF for AI analysis
+    Extracts text from PDF for AI analysis (limited to the classifier budget)
     """
-    return default_processor.extract_text(pdf_path)
\ No newline at end of file
+    return default_processor.extract_text(pdf_path, max_chars=CLASSIFIER_TEXT_BUDGET)
\ No newline at end of file
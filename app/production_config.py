@@ -21,7 +21,8 @@ class ProductionConfig:
     # Server settings
     host: str = '0.0.0.0'
     port: int = 5000
-    workers: int = 4
+    workers: int = 2
+    threads: int = 8
     timeout: int = 120
 
     # Application directories
@@ -53,6 +54,8 @@ class ProductionConfig:
     # Rate limiting
     rate_limit_per_minute: int = 60
     rate_limit_burst: int = 10
+    # Client-IP aus X-Forwarded-For übernehmen (nur hinter eigenem Reverse Proxy)
+    trust_proxy_headers: bool = False
 
     # Database/Storage
     state_persistence: bool = True
@@ -126,6 +129,7 @@ class ProductionConfig:
             'FLASK_SECRET_KEY': ('secret_key', str),
 
             'WORKERS': ('workers', int),
+            'THREADS': ('threads', int),
             'TIMEOUT': ('timeout', int),
 
             'SCAN_DIR': ('scan_dir', str),
@@ -150,6 +154,7 @@ class ProductionConfig:
 
             'RATE_LIMIT_PER_MINUTE': ('rate_limit_per_minute', int),
             'RATE_LIMIT_BURST': ('rate_limit_burst', int),
+            'TRUST_PROXY_HEADERS': ('trust_proxy_headers', lambda x: x.lower() == 'true'),
 
             'STATE_PERSISTENCE': ('state_persistence', lambda x: x.lower() == 'true'),
             'BACKUP_INTERVAL_HOURS': ('backup_interval_hours', int),
@@ -237,6 +242,7 @@ class ConfigManager:
         return {
             'enabled': self.config.performance_tracking,
             'workers': self.config.workers,
+            'threads': self.config.threads,
             'timeout': self.config.timeout
         }
 
@@ -246,7 +252,7 @@ class ConfigManager:
         print("\n🔧 Configuration Summary:")
         print(f"   Mode: {'Production' if self.is_production else 'Development'}")
         print(f"   Host: {config.host}:{config.port}")
-        print(f"   Workers: {config.workers}")
+        print(f"   Workers: {config.workers} x {config.threads} threads")
         print(f"   Debug: {config.debug}")
         print(f"   📁 Scan: {config.scan_dir}")
         print(f"   📂 Sorted: {config.sorted_dir}")
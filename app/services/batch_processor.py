@@ -6,6 +6,7 @@ Implementiert Queue-basierte Batch-Verarbeitung mit Progress-Tracking
 import json
 import time
 import uuid
+from concurrent.futures import as_completed
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
@@ -15,13 +16,34 @@ from typing import Dict, List, Optional, Any, Callable
 from dataclasses import dataclass, asdict
 
 from ..monitoring import get_logger
-from ..pdf import PDFProcessor, PDFPreviewGenerator
+from ..executors import get_pdf_executor
+from ..pdf import PDFProcessor, PDFPreviewGenerator, render_and_extract
+from ..pdf.processor import TEXT_EXTRACTION_BUDGET
 from ..ai import DocumentClassifier
 from ..directory import CategoryManager, DirectoryManager
 from ..services.file_renaming import file_renaming_service
 from ..services.workflow_engine import workflow_engine
 
 
+# Per-process extraction helpers (PyMuPDF is not thread-safe, so extraction
+# runs in worker processes instead of threads)
+_worker_pdf_processor = None
+_worker_preview_generator = None
+
+
+def _extract_document(file_path: str):
+    """Render preview and extract text for one document in a worker process"""
+    global _worker_pdf_processor, _worker_preview_generator
+    if _worker_pdf_processor is None:
+        _worker_pdf_processor = PDFProcessor(max_pages=3, max_chars=TEXT_EXTRACTION_BUDGET)
+        _worker_preview_generator = PDFPreviewGenerator()
+
+    # Document is opened once for preview and text extraction
+    image_data, text = render_and_extract(file_path, _worker_pdf_processor, _worker_preview_generator)
+    preview = _worker_preview_generator.to_data_url(image_data) if image_data is not None else None
+    return preview, text
+
+
 class JobStatus(Enum):
     PENDING = "pending"
     RUNNING = "running"
@@ -73,9 +95,10 @@ class BatchOperation:
 class BatchProcessor:
     """Service für Batch-Verarbeitung von Dokumenten"""
 
-    def __init__(self, max_workers: int = 3):
+    def __init__(self, max_workers: int = 3, classification_batch_size: int = 8):
         self.logger = get_logger('batch_processor')
         self.max_workers = max_workers
+        self.classification_batch_size = classification_batch_size
         self.workers = []
         self.job_queue = Queue()
         self.operations: Dict[str, BatchOperation] = {}
@@ -83,8 +106,8 @@ class BatchProcessor:
         self.is_running = False
 
         # Initialize processors
-        self.pdf_processor = PDFProcessor(max_pages=3)
-        self.preview_generator = PDFPreviewGenerator(dpi=1.5)
+        self.pdf_processor = PDFProcessor(max_pages=3, max_chars=TEXT_EXTRACTION_BUDGET)
+        self.preview_generator = PDFPreviewGenerator()
         self.document_classifier = DocumentClassifier()
         self.category_manager = CategoryManager()
         self.directory_manager = DirectoryManager()
@@ -120,6 +143,7 @@ class BatchProcessor:
             worker.join(timeout=5.0)
 
         self.workers.clear()
+
         self.logger.info("Batch processor stopped")
 
     def create_batch_operation(self,
@@ -179,9 +203,10 @@ class BatchProcessor:
         if not self.is_running:
             self.start_workers()
 
-        # Queue all jobs
-        for job in operation.jobs:
-            self.job_queue.put((operation_id, job.id))
+        # Queue jobs in groups so each group shares one classification request
+        job_ids = [job.id for job in operation.jobs]
+        for i in range(0, len(job_ids), self.classification_batch_size):
+            self.job_queue.put((operation_id, job_ids[i:i + self.classification_batch_size]))
 
         self.logger.info("Batch operation started", operation_id=operation_id)
         self._save_state()
@@ -272,32 +297,51 @@ class BatchProcessor:
                 if item is None:  # Sentinel value
                     break
 
-                operation_id, job_id = item
-                self._process_job(operation_id, job_id)
+                operation_id, job_ids = item
+                self._process_jobs(operation_id, job_ids)
 
             except Exception as e:
                 self.logger.error("Worker error", exception=e)
 
-    def _process_job(self, operation_id: str, job_id: str):
-        """Verarbeitet einen einzelnen Job"""
+    def _process_jobs(self, operation_id: str, job_ids: List[str]):
+        """Verarbeitet eine Gruppe von Jobs mit einem gemeinsamen Klassifizierungs-Request"""
         with self.operations_lock:
             operation = self.operations.get(operation_id)
             if not operation:
                 return
 
-            job = next((j for j in operation.jobs if j.id == job_id), None)
-            if not job:
-                return
-
-            if job.status != JobStatus.PENDING:
+            wanted = set(job_ids)
+            jobs = [j for j in operation.jobs if j.id in wanted and j.status == JobStatus.PENDING]
+            if not jobs:
                 return
 
-            job.status = JobStatus.RUNNING
-            job.started_at = datetime.now().isoformat()
+            started_at = datetime.now().isoformat()
+            for job in jobs:
+                job.status = JobStatus.RUNNING
+                job.started_at = started_at
 
         try:
-            # Process the document
-            result = self._process_document(job.file_path, job.target_category)
+            # Process the documents
+            results = self._process_documents([job.file_path for job in jobs], jobs[0].target_category)
+        except Exception as e:
+            results = [e] * len(jobs)
+
+        for job, result in zip(jobs, results):
+            if isinstance(result, Exception):
+                with self.operations_lock:
+                    job.status = JobStatus.FAILED
+                    job.completed_at = datetime.now().isoformat()
+                    job.error_message = str(result)
+
+                    operation.failed_jobs += 1
+                    self._update_operation_progress(operation)
+
+                self.logger.error("Job failed",
+                                operation_id=operation_id,
+                                job_id=job.id,
+                                file_path=job.file_path,
+                                exception=result)
+                continue
 
             with self.operations_lock:
                 job.status = JobStatus.COMPLETED
@@ -310,35 +354,40 @@ class BatchProcessor:
 
             self.logger.info("Job completed successfully",
                            operation_id=operation_id,
-                           job_id=job_id,
+                           job_id=job.id,
                            file_path=job.file_path)
 
-        except Exception as e:
-            with self.operations_lock:
-                job.status = JobStatus.FAILED
-                job.completed_at = datetime.now().isoformat()
-                job.error_message = str(e)
-
-                operation.failed_jobs += 1
-                self._update_operation_progress(operation)
-
-            self.logger.error("Job failed",
-                            operation_id=operation_id,
-                            job_id=job_id,
-                            file_path=job.file_path,
-                            exception=e)
-
         self._save_state()
 
-    def _process_document(self, file_path: str, target_category: Optional[str] = None) -> Dict[str, Any]:
-        """Verarbeitet ein einzelnes Dokument mit Workflow Engine"""
-        file_path_obj = Path(file_path)
-
-        if not file_path_obj.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
+    def _process_documents(self, file_paths: List[str], target_category: Optional[str] = None) -> List[Any]:
+        """
+        Verarbeitet mehrere Dokumente mit der Workflow Engine
+
+        Returns:
+            Liste mit Ergebnis-Dictionary oder Exception pro Dokument
+        """
+        results: List[Any] = [None] * len(file_paths)
+        extracted = {}
+        futures = {}
+
+        # Generate previews and extract text in parallel worker processes
+        pool = get_pdf_executor()
+        for index, file_path in enumerate(file_paths):
+            if not Path(file_path).exists():
+                results[index] = FileNotFoundError(f"File not found: {file_path}")
+                continue
+            futures[pool.submit(_extract_document, file_path)] = index
+
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                extracted[index] = future.result()
+            except Exception as e:
+                results[index] = e
 
-        # Generate preview for result
-        preview = self.preview_generator.generate_preview(file_path)
+        existing = sorted(extracted)
+        if not existing:
+            return results
 
         # Use Workflow Engine for intelligent processing
         workflow_context = {
@@ -347,15 +396,27 @@ class BatchProcessor:
             'batch_mode': True
         }
 
-        workflow_result = workflow_engine.process_document(file_path, workflow_context)
+        workflow_results = workflow_engine.process_documents(
+            [file_paths[index] for index in existing], workflow_context,
+            texts=[extracted[index][1] for index in existing]
+        )
 
-        # Extract text for result (if not already done)
-        try:
-            text = self.pdf_processor.extract_text(file_path)
-            text_length = len(text)
-        except Exception:
-            text_length = 0
+        for index, workflow_result in zip(existing, workflow_results):
+            preview, text = extracted[index]
+            results[index] = self._build_result(file_paths[index], preview, len(text), workflow_result)
+
+        return results
+
+    def _process_document(self, file_path: str, target_category: Optional[str] = None) -> Dict[str, Any]:
+        """Verarbeitet ein einzelnes Dokument mit Workflow Engine"""
+        result = self._process_documents([file_path], target_category)[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
 
+    def _build_result(self, file_path: str, preview: Optional[str], text_length: int,
+                      workflow_result) -> Dict[str, Any]:
+        """Baut das Ergebnis-Dictionary für einen verarbeiteten Job"""
         # Build result dictionary
         result = {
             'original_path': file_path,
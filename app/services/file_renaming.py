@@ -9,6 +9,168 @@ from typing import List, Optional, Tuple, Dict
 from pathlib import Path
 
 
+# Regex-Muster werden einmalig beim Import kompiliert
+_SCAN_ARTIFACT_PATTERNS = [
+    re.compile(r'[#_]*[Ss]canbot[#_]*'),
+    re.compile(r'[#_]*[Gg]escanntes?\s*[Dd]okument[#_]*'),
+    re.compile(r'[#_]*[Ss]can[#_]*'),
+]
+_LEADING_DATE_RE = re.compile(r'^[\d\-\.\/]+[_\s]*')
+_SEPARATORS_RE = re.compile(r'[_\s]+')
+_WHITESPACE_RE = re.compile(r'\s+')
+_MULTI_UNDERSCORE_RE = re.compile(r'[_]{2,}')
+_EDGE_UNDERSCORE_RE = re.compile(r'^_+|_+$')
+_LEADING_NUMBER_RE = re.compile(r'^\d+[_\s]*')
+
+# Common patterns for document titles - improved flexibility
+TITLE_PATTERNS = [
+    # Look for lines starting with specific document type keywords
+    re.compile(r'^(Rechnung|Invoice|Mahnung|Mitteilung|Bescheid|Nachweis|Zeugnis|Vertrag|Vereinbarung|Bestätigung|Anschreiben|Brief|Schreiben|Kündigung|Anmeldung|Abmeldung|Antrag).*', re.IGNORECASE),
+    # Look for lines containing important document keywords (anywhere in line)
+    re.compile(r'.*(KÜNDIGUNG|VERTRAG|RECHNUNG|MAHNUNG|BESCHEID|NACHWEIS|BESTÄTIGUNG|ANMELDUNG|ABMELDUNG).*', re.IGNORECASE),
+    # Look for lines that are all caps and short (likely titles)
+    re.compile(r'^[A-ZÄÖÜ\s\-\.]{8,50}$', re.IGNORECASE),
+    # Look for lines with specific formatting (bold indicators)
+    re.compile(r'^\*\*.*\*\*$', re.IGNORECASE),
+    # Look for numbered documents
+    re.compile(r'^[\d\.\-\s]*(Rechnung|Dokument|Nachweis|Bescheid|Kündigung).*', re.IGNORECASE),
+]
+_TITLE_NOISE_RE = re.compile(r'[\d]{4,}|@|\.(com|de|org)')
+
+_TITLE_PREFIX_RE = re.compile(r'^(Rechnung|Invoice|Nr\.|Nummer|Document|Dokument)[\s\:\-]*', re.IGNORECASE)
+_TITLE_TRAILING_DATE_RE = re.compile(r'[\s\-]*\d{1,2}[\./]\d{1,2}[\./]\d{2,4}.*$')
+_TITLE_TRAILING_NUMBER_RE = re.compile(r'[\s\-]*\d{4,}.*$')
+_TITLE_SPECIAL_CHARS_RE = re.compile(r'[^\w\säöüÄÖÜß\-]')
+_COMPANY_SPECIAL_CHARS_RE = re.compile(r'[^\w\säöüÄÖÜß]')
+
+# Common company keywords and patterns - focusing on German companies and institutions
+COMPANY_PATTERNS = {
+    'victoria': re.compile(r'(victoria|victoria\s+versicherung)'),
+    'huk': re.compile(r'(huk|huk[-\s]*coburg|huk24)'),
+    'dkb': re.compile(r'(dkb|deutsche\s+kreditbank)'),
+    'deutsche_bahn': re.compile(r'(deutsche\s+bahn|db\s+ag|db\s+regio|db\s+fernverkehr)'),
+    'sparkasse': re.compile(r'(sparkasse|kreissparkasse|stadtsparkasse)'),
+    'volksbank': re.compile(r'(volksbank|vr[-\s]*bank|raiffeisenbank)'),
+    'commerzbank': re.compile(r'(commerzbank|comdirect)'),
+    'postbank': re.compile(r'(postbank|deutsche\s+post)'),
+    'ing': re.compile(r'(ing[-\s]*diba|ing\s+bank)'),
+    'santander': re.compile(r'(santander)'),
+    'targobank': re.compile(r'(targobank)'),
+    'allianz': re.compile(r'(allianz)'),
+    'axa': re.compile(r'(axa)'),
+    'ergo': re.compile(r'(ergo)'),
+    'signal_iduna': re.compile(r'(signal\s+iduna)'),
+    'generali': re.compile(r'(generali)'),
+    'zurich': re.compile(r'(zurich)'),
+    'aok': re.compile(r'(aok|allgemeine\s+ortskrankenkasse)'),
+    'barmer': re.compile(r'(barmer|barmer\s+gek)'),
+    'tk': re.compile(r'(techniker\s+krankenkasse|tk)'),
+    'dak': re.compile(r'(dak[-\s]*gesundheit)'),
+    'ikk': re.compile(r'(ikk|innungskrankenkasse)'),
+    'bkk': re.compile(r'(bkk|betriebskrankenkasse)'),
+    'knappschaft': re.compile(r'(knappschaft)'),
+    'telekom': re.compile(r'(deutsche\s+telekom|telekom|t[-\s]*mobile)'),
+    'vodafone': re.compile(r'(vodafone)'),
+    'o2': re.compile(r'(o2|telefónica)'),
+    'eon': re.compile(r'(e\.on|eon)'),
+    'rwe': re.compile(r'(rwe)'),
+    'vattenfall': re.compile(r'(vattenfall)'),
+    'stadtwerke': re.compile(r'(stadtwerke)'),
+    'enercity': re.compile(r'(enercity)'),
+    'swb': re.compile(r'(swb|wesernetz)'),
+    'amazon': re.compile(r'(amazon)'),
+    'ebay': re.compile(r'(ebay)'),
+    'paypal': re.compile(r'(paypal)'),
+    'klarna': re.compile(r'(klarna)'),
+    'check24': re.compile(r'(check24)'),
+    'verivox': re.compile(r'(verivox)'),
+    'immobilienscout24': re.compile(r'(immobilienscout24|is24)'),
+    'autoscout24': re.compile(r'(autoscout24)'),
+    'adac': re.compile(r'(adac)'),
+    'tuev': re.compile(r'(tüv|tuev)'),
+    'dekra': re.compile(r'(dekra)'),
+    'bmw': re.compile(r'(bmw)'),
+    'mercedes': re.compile(r'(mercedes[-\s]*benz|daimler)'),
+    'audi': re.compile(r'(audi)'),
+    'volkswagen': re.compile(r'(volkswagen|vw)'),
+    'porsche': re.compile(r'(porsche)'),
+    'lidl': re.compile(r'(lidl)'),
+    'aldi': re.compile(r'(aldi)'),
+    'rewe': re.compile(r'(rewe)'),
+    'edeka': re.compile(r'(edeka)'),
+    'netto': re.compile(r'(netto)'),
+    'penny': re.compile(r'(penny)'),
+    'dm': re.compile(r'(dm[-\s]*drogerie)'),
+    'rossmann': re.compile(r'(rossmann)'),
+    'media_markt': re.compile(r'(media\s+markt|mediamarkt)'),
+    'saturn': re.compile(r'(saturn)'),
+    'otto': re.compile(r'(otto\s+group|otto\.de)'),
+    'zalando': re.compile(r'(zalando)'),
+    'h_und_m': re.compile(r'(h&m|hennes)'),
+    'c_und_a': re.compile(r'(c&a)'),
+    'ikea': re.compile(r'(ikea)'),
+    'hornbach': re.compile(r'(hornbach)'),
+    'bauhaus': re.compile(r'(bauhaus)'),
+    'obi': re.compile(r'(obi)'),
+    'toom': re.compile(r'(toom)'),
+    'hagebau': re.compile(r'(hagebau)'),
+    'mcdonalds': re.compile(r'(mcdonald\'s|mcdonalds)'),
+    'burger_king': re.compile(r'(burger\s+king)'),
+    'kfc': re.compile(r'(kfc)'),
+    'subway': re.compile(r'(subway)'),
+    'starbucks': re.compile(r'(starbucks)'),
+    'deutsche_post': re.compile(r'(deutsche\s+post|dhl)'),
+    'ups': re.compile(r'(ups)'),
+    'fedex': re.compile(r'(fedex)'),
+    'hermes': re.compile(r'(hermes)'),
+    'dpd': re.compile(r'(dpd)'),
+    'gls': re.compile(r'(gls)'),
+    'lufthansa': re.compile(r'(lufthansa)'),
+    'eurowings': re.compile(r'(eurowings)'),
+    'ryanair': re.compile(r'(ryanair)'),
+    'easyjet': re.compile(r'(easyjet)'),
+    'booking': re.compile(r'(booking\.com)'),
+    'expedia': re.compile(r'(expedia)'),
+    'hrs': re.compile(r'(hrs)'),
+    'hotels': re.compile(r'(hotels\.com)'),
+    'airbnb': re.compile(r'(airbnb)'),
+    'flixbus': re.compile(r'(flixbus)'),
+    'bahn': re.compile(r'(deutsche\s+bahn|db)'),
+    'hvv': re.compile(r'(hvv|hamburger\s+verkehrsverbund)'),
+    'mvv': re.compile(r'(mvv|münchener\s+verkehrs)'),
+    'vvs': re.compile(r'(vvs|verkehrs.*stuttgart)'),
+    'vrr': re.compile(r'(vrr|verkehrsverbund.*rhein)'),
+    'vgn': re.compile(r'(vgn|verkehrsverbund.*nürnberg)'),
+    'kvb': re.compile(r'(kvb|kölner\s+verkehrs)'),
+    'bvg': re.compile(r'(bvg|berliner\s+verkehrs)'),
+}
+
+# Patterns that indicate company names in letterhead lines
+COMPANY_INDICATOR_PATTERNS = [
+    re.compile(r'\b[A-ZÄÖÜ]{3,}(?:\s+[A-ZÄÖÜ]{2,})*\b', re.IGNORECASE),  # All caps words
+    re.compile(r'.*(gmbh|ag|e\.v\.|ev|kg|ohg|gbr|ug).*', re.IGNORECASE),  # Legal forms
+    re.compile(r'.*(versicherung|bank|sparkasse|kasse).*', re.IGNORECASE),  # Financial institutions
+    re.compile(r'.*(stadtwerke|stadtsparkasse).*', re.IGNORECASE),  # Municipal companies
+    re.compile(r'.*(^|\s)[A-Z][a-zäöü]*\s+[A-Z][a-zäöü]*(\s+[A-Z][a-zäöü]*)*(\s+(GmbH|AG|e\.V\.))?.*', re.IGNORECASE),  # Title case names with legal form
+]
+
+# Common document types and their keywords - expanded
+SUBJECT_KEYWORD_PATTERNS = {
+    'gehaltsnachweise': re.compile(r'(gehalt|lohn|entgelt|vergütung|salary)'),
+    'rechnung': re.compile(r'(rechnung|invoice|betrag|zahlung|payment)'),
+    'vertrag': re.compile(r'(vertrag|contract|vereinbarung|agreement)'),
+    'mahnung': re.compile(r'(mahnung|reminder|zahlungsaufforderung)'),
+    'bescheid': re.compile(r'(bescheid|notice|mitteilung|information)'),
+    'nachweis': re.compile(r'(nachweis|bestätigung|confirmation|certificate)'),
+    'kündigung': re.compile(r'(kündigung|termination|beendigung|auflösung)'),
+    'bewerbung': re.compile(r'(bewerbung|application|lebenslauf|cv)'),
+    'anmeldung': re.compile(r'(anmeldung|registration|registrierung)'),
+    'abmeldung': re.compile(r'(abmeldung|deregistration|austritt)'),
+    'antrag': re.compile(r'(antrag|application|request|gesuch)'),
+    'mitteilung': re.compile(r'(mitteilung|notification|benachrichtigung)'),
+}
+
+
 class FileRenamingService:
     """Service for intelligent file renaming"""
 
@@ -26,6 +188,7 @@ class FileRenamingService:
             # DD.MM.YY or DD/MM/YY (only if no 4-digit year found)
             r'(\d{1,2})[./](\d{1,2})[./](\d{2})(?!\d)',
         ]
+        self._compiled_date_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in self.date_patterns]
 
         # Month name mapping
         self.month_names = {
@@ -39,16 +202,16 @@ class FileRenamingService:
         """Extract all valid dates from text content"""
         found_dates = []
 
-        for pattern in self.date_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for pattern_index, pattern in enumerate(self.date_patterns):
+            matches = self._compiled_date_patterns[pattern_index].finditer(text)
             for match in matches:
                 try:
                     if len(match.groups()) == 3:
-                        if pattern == self.date_patterns[0]:  # DD.MM.YYYY
+                        if pattern_index == 0:  # DD.MM.YYYY
                             day, month, year = map(int, match.groups())
-                        elif pattern == self.date_patterns[1]:  # YYYY-MM-DD
+                        elif pattern_index == 1:  # YYYY-MM-DD
                             year, month, day = map(int, match.groups())
-                        elif pattern == self.date_patterns[4]:  # DD.MM.YY (last pattern)
+                        elif pattern_index == 4:  # DD.MM.YY (last pattern)
                             day, month, year_short = map(int, match.groups())
                             year = 2000 + year_short if year_short < 50 else 1900 + year_short
                         elif 'januar' in pattern.lower() or 'jan' in pattern.lower():
@@ -97,15 +260,14 @@ class FileRenamingService:
         name = Path(filename).stem
 
         # Remove common scan artifacts
-        name = re.sub(r'[#_]*[Ss]canbot[#_]*', '', name)
-        name = re.sub(r'[#_]*[Gg]escanntes?\s*[Dd]okument[#_]*', '', name)
-        name = re.sub(r'[#_]*[Ss]can[#_]*', '', name)
+        for pattern in _SCAN_ARTIFACT_PATTERNS:
+            name = pattern.sub('', name)
 
         # Remove existing date patterns at the beginning
-        name = re.sub(r'^[\d\-\.\/]+[_\s]*', '', name)
+        name = _LEADING_DATE_RE.sub('', name)
 
         # Remove multiple underscores/spaces
-        name = re.sub(r'[_\s]+', '_', name)
+        name = _SEPARATORS_RE.sub('_', name)
 
         # Remove leading/trailing underscores
         name = name.strip('_')
@@ -119,20 +281,6 @@ class FileRenamingService:
 
         lines = text.split('\n')
 
-        # Common patterns for document titles - improved flexibility
-        title_patterns = [
-            # Look for lines starting with specific document type keywords
-            r'^(Rechnung|Invoice|Mahnung|Mitteilung|Bescheid|Nachweis|Zeugnis|Vertrag|Vereinbarung|Bestätigung|Anschreiben|Brief|Schreiben|Kündigung|Anmeldung|Abmeldung|Antrag).*',
-            # Look for lines containing important document keywords (anywhere in line)
-            r'.*(KÜNDIGUNG|VERTRAG|RECHNUNG|MAHNUNG|BESCHEID|NACHWEIS|BESTÄTIGUNG|ANMELDUNG|ABMELDUNG).*',
-            # Look for lines that are all caps and short (likely titles)
-            r'^[A-ZÄÖÜ\s\-\.]{8,50}$',
-            # Look for lines with specific formatting (bold indicators)
-            r'^\*\*.*\*\*$',
-            # Look for numbered documents
-            r'^[\d\.\-\s]*(Rechnung|Dokument|Nachweis|Bescheid|Kündigung).*',
-        ]
-
         potential_titles = []
 
         # Check first 10 lines for titles
@@ -146,15 +294,15 @@ class FileRenamingService:
                 continue
 
             # Check if line matches title patterns
-            for pattern in title_patterns:
-                if re.match(pattern, line, re.IGNORECASE):
+            for pattern in TITLE_PATTERNS:
+                if pattern.match(line):
                     potential_titles.append((line, i))
                     break
 
             # Also consider lines that are significantly shorter than surrounding text
             if 10 <= len(line) <= 60 and i < 5:
                 # Check if it's likely a title (not too many numbers, not email/url)
-                if not re.search(r'[\d]{4,}|@|\.(com|de|org)', line):
+                if not _TITLE_NOISE_RE.search(line):
                     word_count = len(line.split())
                     if 2 <= word_count <= 8:
                         potential_titles.append((line, i))
@@ -173,17 +321,17 @@ class FileRenamingService:
             return ""
 
         # Remove common prefixes/suffixes
-        title = re.sub(r'^(Rechnung|Invoice|Nr\.|Nummer|Document|Dokument)[\s\:\-]*', '', title, flags=re.IGNORECASE)
+        title = _TITLE_PREFIX_RE.sub('', title)
 
         # Remove dates and numbers at the end
-        title = re.sub(r'[\s\-]*\d{1,2}[\./]\d{1,2}[\./]\d{2,4}.*$', '', title)
-        title = re.sub(r'[\s\-]*\d{4,}.*$', '', title)
+        title = _TITLE_TRAILING_DATE_RE.sub('', title)
+        title = _TITLE_TRAILING_NUMBER_RE.sub('', title)
 
         # Clean special characters for filename
-        title = re.sub(r'[^\w\säöüÄÖÜß\-]', '', title)
+        title = _TITLE_SPECIAL_CHARS_RE.sub('', title)
 
         # Normalize whitespace and convert to underscores
-        title = re.sub(r'\s+', '_', title.strip())
+        title = _WHITESPACE_RE.sub('_', title.strip())
 
         # Limit length
         if len(title) > 40:
@@ -200,107 +348,6 @@ class FileRenamingService:
 
         lines = text.split('\n')
 
-        # Common company keywords and patterns - focusing on German companies and institutions
-        company_patterns = {
-            'victoria': r'(victoria|victoria\s+versicherung)',
-            'huk': r'(huk|huk[-\s]*coburg|huk24)',
-            'dkb': r'(dkb|deutsche\s+kreditbank)',
-            'deutsche_bahn': r'(deutsche\s+bahn|db\s+ag|db\s+regio|db\s+fernverkehr)',
-            'sparkasse': r'(sparkasse|kreissparkasse|stadtsparkasse)',
-            'volksbank': r'(volksbank|vr[-\s]*bank|raiffeisenbank)',
-            'commerzbank': r'(commerzbank|comdirect)',
-            'postbank': r'(postbank|deutsche\s+post)',
-            'ing': r'(ing[-\s]*diba|ing\s+bank)',
-            'santander': r'(santander)',
-            'targobank': r'(targobank)',
-            'allianz': r'(allianz)',
-            'axa': r'(axa)',
-            'ergo': r'(ergo)',
-            'signal_iduna': r'(signal\s+iduna)',
-            'generali': r'(generali)',
-            'zurich': r'(zurich)',
-            'aok': r'(aok|allgemeine\s+ortskrankenkasse)',
-            'barmer': r'(barmer|barmer\s+gek)',
-            'tk': r'(techniker\s+krankenkasse|tk)',
-            'dak': r'(dak[-\s]*gesundheit)',
-            'ikk': r'(ikk|innungskrankenkasse)',
-            'bkk': r'(bkk|betriebskrankenkasse)',
-            'knappschaft': r'(knappschaft)',
-            'telekom': r'(deutsche\s+telekom|telekom|t[-\s]*mobile)',
-            'vodafone': r'(vodafone)',
-            'o2': r'(o2|telefónica)',
-            'eon': r'(e\.on|eon)',
-            'rwe': r'(rwe)',
-            'vattenfall': r'(vattenfall)',
-            'stadtwerke': r'(stadtwerke)',
-            'enercity': r'(enercity)',
-            'swb': r'(swb|wesernetz)',
-            'amazon': r'(amazon)',
-            'ebay': r'(ebay)',
-            'paypal': r'(paypal)',
-            'klarna': r'(klarna)',
-            'check24': r'(check24)',
-            'verivox': r'(verivox)',
-            'immobilienscout24': r'(immobilienscout24|is24)',
-            'autoscout24': r'(autoscout24)',
-            'adac': r'(adac)',
-            'tuev': r'(tüv|tuev)',
-            'dekra': r'(dekra)',
-            'bmw': r'(bmw)',
-            'mercedes': r'(mercedes[-\s]*benz|daimler)',
-            'audi': r'(audi)',
-            'volkswagen': r'(volkswagen|vw)',
-            'porsche': r'(porsche)',
-            'lidl': r'(lidl)',
-            'aldi': r'(aldi)',
-            'rewe': r'(rewe)',
-            'edeka': r'(edeka)',
-            'netto': r'(netto)',
-            'penny': r'(penny)',
-            'dm': r'(dm[-\s]*drogerie)',
-            'rossmann': r'(rossmann)',
-            'media_markt': r'(media\s+markt|mediamarkt)',
-            'saturn': r'(saturn)',
-            'otto': r'(otto\s+group|otto\.de)',
-            'zalando': r'(zalando)',
-            'h_und_m': r'(h&m|hennes)',
-            'c_und_a': r'(c&a)',
-            'ikea': r'(ikea)',
-            'hornbach': r'(hornbach)',
-            'bauhaus': r'(bauhaus)',
-            'obi': r'(obi)',
-            'toom': r'(toom)',
-            'hagebau': r'(hagebau)',
-            'mcdonalds': r'(mcdonald\'s|mcdonalds)',
-            'burger_king': r'(burger\s+king)',
-            'kfc': r'(kfc)',
-            'subway': r'(subway)',
-            'starbucks': r'(starbucks)',
-            'deutsche_post': r'(deutsche\s+post|dhl)',
-            'ups': r'(ups)',
-            'fedex': r'(fedex)',
-            'hermes': r'(hermes)',
-            'dpd': r'(dpd)',
-            'gls': r'(gls)',
-            'lufthansa': r'(lufthansa)',
-            'eurowings': r'(eurowings)',
-            'ryanair': r'(ryanair)',
-            'easyjet': r'(easyjet)',
-            'booking': r'(booking\.com)',
-            'expedia': r'(expedia)',
-            'hrs': r'(hrs)',
-            'hotels': r'(hotels\.com)',
-            'airbnb': r'(airbnb)',
-            'flixbus': r'(flixbus)',
-            'bahn': r'(deutsche\s+bahn|db)',
-            'hvv': r'(hvv|hamburger\s+verkehrsverbund)',
-            'mvv': r'(mvv|münchener\s+verkehrs)',
-            'vvs': r'(vvs|verkehrs.*stuttgart)',
-            'vrr': r'(vrr|verkehrsverbund.*rhein)',
-            'vgn': r'(vgn|verkehrsverbund.*nürnberg)',
-            'kvb': r'(kvb|kölner\s+verkehrs)',
-            'bvg': r'(bvg|berliner\s+verkehrs)',
-        }
 
         # Check first 10 lines for company names (letterhead area)
         for i, line in enumerate(lines[:10]):
@@ -311,31 +358,23 @@ class FileRenamingService:
             line_lower = line.lower()
 
             # Check against company patterns
-            for company_key, pattern in company_patterns.items():
-                if re.search(pattern, line_lower):
+            for company_key, pattern in COMPANY_PATTERNS.items():
+                if pattern.search(line_lower):
                     companies.append(company_key)
 
             # Also look for patterns that indicate company names:
             # - All caps words (likely company names)
             # - Lines with GmbH, AG, e.V., etc.
             # - Lines with specific formatting
-            company_indicators = [
-                r'\b[A-ZÄÖÜ]{3,}(?:\s+[A-ZÄÖÜ]{2,})*\b',  # All caps words
-                r'.*(gmbh|ag|e\.v\.|ev|kg|ohg|gbr|ug).*',  # Legal forms
-                r'.*(versicherung|bank|sparkasse|kasse).*',  # Financial institutions
-                r'.*(stadtwerke|stadtsparkasse).*',  # Municipal companies
-                r'.*(^|\s)[A-Z][a-zäöü]*\s+[A-Z][a-zäöü]*(\s+[A-Z][a-zäöü]*)*(\s+(GmbH|AG|e\.V\.))?.*',  # Title case names with legal form
-            ]
-
-            for pattern in company_indicators:
-                matches = re.finditer(pattern, line, re.IGNORECASE)
+            for pattern in COMPANY_INDICATOR_PATTERNS:
+                matches = pattern.finditer(line)
                 for match in matches:
                     matched_text = match.group().strip()
                     # Clean up and add if it looks like a company name
                     if len(matched_text) > 3 and len(matched_text) < 50:
                         # Convert to filename-friendly format
-                        clean_name = re.sub(r'[^\w\säöüÄÖÜß]', '', matched_text)
-                        clean_name = re.sub(r'\s+', '_', clean_name.strip()).lower()
+                        clean_name = _COMPANY_SPECIAL_CHARS_RE.sub('', matched_text)
+                        clean_name = _WHITESPACE_RE.sub('_', clean_name.strip()).lower()
                         if clean_name and clean_name not in companies:
                             companies.append(clean_name)
 
@@ -345,25 +384,10 @@ class FileRenamingService:
         """Extract subject-specific keywords that could be useful for filename"""
         keywords = []
 
-        # Common document types and their keywords - expanded
-        keyword_patterns = {
-            'gehaltsnachweise': r'(gehalt|lohn|entgelt|vergütung|salary)',
-            'rechnung': r'(rechnung|invoice|betrag|zahlung|payment)',
-            'vertrag': r'(vertrag|contract|vereinbarung|agreement)',
-            'mahnung': r'(mahnung|reminder|zahlungsaufforderung)',
-            'bescheid': r'(bescheid|notice|mitteilung|information)',
-            'nachweis': r'(nachweis|bestätigung|confirmation|certificate)',
-            'kündigung': r'(kündigung|termination|beendigung|auflösung)',
-            'bewerbung': r'(bewerbung|application|lebenslauf|cv)',
-            'anmeldung': r'(anmeldung|registration|registrierung)',
-            'abmeldung': r'(abmeldung|deregistration|austritt)',
-            'antrag': r'(antrag|application|request|gesuch)',
-            'mitteilung': r'(mitteilung|notification|benachrichtigung)',
-        }
 
         text_lower = text.lower()
-        for keyword, pattern in keyword_patterns.items():
-            if re.search(pattern, text_lower):
+        for keyword, pattern in SUBJECT_KEYWORD_PATTERNS.items():
+            if pattern.search(text_lower):
                 keywords.append(keyword)
 
         return keywords
@@ -398,8 +422,8 @@ class FileRenamingService:
         date_str = target_date.strftime('%Y-%m-%d')
 
         # Create category component (remove numbers and clean up)
-        category_clean = re.sub(r'^\d+[_\s]*', '', category)  # Remove leading numbers
-        category_clean = re.sub(r'[_\s]+', '_', category_clean)  # Normalize separators
+        category_clean = _LEADING_NUMBER_RE.sub('', category)  # Remove leading numbers
+        category_clean = _SEPARATORS_RE.sub('_', category_clean)  # Normalize separators
         category_clean = category_clean.strip('_').lower()
 
         # Determine company component
@@ -434,8 +458,8 @@ class FileRenamingService:
         new_filename = '_'.join(components) + '.pdf'
 
         # Final cleanup
-        new_filename = re.sub(r'[_]{2,}', '_', new_filename)  # Remove multiple underscores
-        new_filename = re.sub(r'^_+|_+$', '', new_filename)  # Remove leading/trailing underscores
+        new_filename = _MULTI_UNDERSCORE_RE.sub('_', new_filename)  # Remove multiple underscores
+        new_filename = _EDGE_UNDERSCORE_RE.sub('', new_filename)  # Remove leading/trailing underscores
 
         return new_filename
 
@@ -445,7 +469,7 @@ class FileRenamingService:
             return text
 
         # Clean up the text first
-        text = re.sub(r'[_\s]+', '_', text)
+        text = _SEPARATORS_RE.sub('_', text)
         text = text.strip('_')
 
         if len(text) <= max_length:
@@ -4,10 +4,15 @@ Datei-Service für Document Sorter
 import os
 import shutil
 import random
+import time
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from ..config.config_manager import ConfigManager
+from ..directory.manager import scan_pdf_entries
+
+# Verzeichnislisten werden höchstens so lange (Sekunden) ohne erneutes Einlesen wiederverwendet
+DIRECTORY_CACHE_TTL = 5.0
 
 class FileService:
     """Service für Dateioperationen"""
@@ -23,6 +28,32 @@ class FileService:
             '.mp4', '.avi', '.mov',  # Videos
             '.mp3', '.wav', '.flac'  # Audio
         }
+        # (Art, Pfad) -> (Zeitpunkt, (Generation, mtime_ns), Ergebnis)
+        self._directory_cache: Dict[Tuple[str, str], Tuple[float, Tuple[int, Optional[int]], Any]] = {}
+        # Wird von move_document erhöht und verwirft damit alle Verzeichnislisten
+        self._generation = 0
+
+    def _cached_listing(self, kind: str, path: Path, build: Callable[[], Any]) -> Any:
+        """Liefert eine Verzeichnisliste aus dem Cache, solange TTL, mtime und Generation passen"""
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+
+        cache_key = (kind, str(path))
+        version = (self._generation, mtime)
+        now = time.monotonic()
+        cached = self._directory_cache.get(cache_key)
+        if cached is not None and cached[1] == version and now - cached[0] < DIRECTORY_CACHE_TTL:
+            return cached[2]
+
+        result = build()
+        self._directory_cache[cache_key] = (now, version, result)
+        return result
+
+    def invalidate_directory_cache(self) -> None:
+        """Verwirft gecachte Kategorien und Verzeichnisbäume"""
+        self._generation += 1
     
     def scan_directory(self) -> List[Dict[str, Any]]:
         """Scannt das Eingangsverzeichnis nach PDFs"""
@@ -31,30 +62,27 @@ class FileService:
         if not scan_dir.exists():
             return []
         
-        pdf_files = []
-        for pdf_file in scan_dir.glob('*.pdf'):
-            pdf_files.append({
-                'name': pdf_file.name,
-                'path': str(pdf_file),
-                'size': pdf_file.stat().st_size,
-                'modified': datetime.fromtimestamp(pdf_file.stat().st_mtime).isoformat()
-            })
-        
-        return pdf_files
+        return [self._pdf_file_info(entry) for entry in scan_pdf_entries(scan_dir)]
     
     def get_random_document(self) -> Optional[Dict[str, Any]]:
         """Wählt ein zufälliges PDF aus dem Scan-Verzeichnis"""
-        pdf_files = list(self.config.get_path('SCAN_DIR').glob('*.pdf'))
+        scan_dir = self.config.get_path('SCAN_DIR')
+        pdf_files = scan_pdf_entries(scan_dir) if scan_dir.exists() else []
         
         if not pdf_files:
             return None
         
-        random_file = random.choice(pdf_files)
+        return self._pdf_file_info(random.choice(pdf_files))
+
+    @staticmethod
+    def _pdf_file_info(entry: os.DirEntry) -> Dict[str, Any]:
+        """Dateiinfo aus einem DirEntry (ein stat-Aufruf für Größe und Änderungszeit)"""
+        file_stat = entry.stat()
         return {
-            'name': random_file.name,
-            'path': str(random_file),
-            'size': random_file.stat().st_size,
-            'modified': datetime.fromtimestamp(random_file.stat().st_mtime).isoformat()
+            'name': entry.name,
+            'path': entry.path,
+            'size': file_stat.st_size,
+            'modified': datetime.fromtimestamp(file_stat.st_mtime).isoformat()
         }
     
     def move_document(self, source_path: str, target_path: str) -> bool:
@@ -71,6 +99,7 @@ class FileService:
             
             # Datei verschieben
             shutil.move(str(source), str(target))
+            self.invalidate_directory_cache()
             return True
             
         except Exception as e:
@@ -78,7 +107,21 @@ class FileService:
             return False
     
     def get_directory_tree(self, base_path: Path, max_depth: int = 3, current_depth: int = 0) -> Dict[str, Any]:
-        """Erstellt einen Verzeichnisbaum mit Blacklist-Filter"""
+        """
+        Erstellt einen Verzeichnisbaum mit Blacklist-Filter
+
+        Der Baum ab der obersten Ebene wird zwischengespeichert (siehe
+        DIRECTORY_CACHE_TTL) und darf nicht verändert werden.
+        """
+        if current_depth > 0:
+            return self._build_directory_tree(base_path, max_depth, current_depth)
+        return self._cached_listing(
+            f'tree:{max_depth}', base_path,
+            lambda: self._build_directory_tree(base_path, max_depth, current_depth)
+        )
+
+    def _build_directory_tree(self, base_path: Path, max_depth: int, current_depth: int) -> Dict[str, Any]:
+        """Liest den Verzeichnisbaum rekursiv ein"""
         if current_depth >= max_depth:
             return {}
             
@@ -89,7 +132,7 @@ class FileService:
             
         for item in base_path.iterdir():
             if item.is_dir() and not self.config.is_blacklisted(item.name):
-                subtree = self.get_directory_tree(item, max_depth, current_depth + 1)
+                subtree = self._build_directory_tree(item, max_depth, current_depth + 1)
                 tree[item.name] = {
                     'path': str(item),
                     'children': subtree,
@@ -101,6 +144,10 @@ class FileService:
     def get_smart_categories(self) -> List[str]:
         """Generiert intelligente Kategorien basierend auf Documents-Struktur"""
         sorted_dir = self.config.get_path('SORTED_DIR')
+        return list(self._cached_listing('categories', sorted_dir, lambda: self._read_categories(sorted_dir)))
+
+    def _read_categories(self, sorted_dir: Path) -> List[str]:
+        """Liest die Kategorien aus dem Sortierverzeichnis"""
         categories = []
         
         if sorted_dir.exists():
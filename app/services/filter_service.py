@@ -7,8 +7,8 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime
-from difflib import SequenceMatcher
 from ..config.config_manager import ConfigManager
+from ..directory.similarity import filename_similarity
 
 
 @dataclass
@@ -148,12 +148,12 @@ class FilterService:
                 return 0.95
 
             # Ähnlichkeitsberechnung
-            similarity = SequenceMatcher(None, filename.lower(), pattern.lower()).ratio()
+            similarity = filename_similarity(filename, pattern)
             return similarity * 0.8  # Dämpfung für nicht-exakte Matches
 
         except re.error:
             # Fallback bei Regex-Fehlern
-            similarity = SequenceMatcher(None, filename.lower(), pattern.lower()).ratio()
+            similarity = filename_similarity(filename, pattern)
             return similarity * 0.6
 
     def _find_similar_files(self, filename: str, file_ext: str) -> List[FilterSuggestion]:
@@ -165,8 +165,9 @@ class FilterService:
             return suggestions
 
         # Suche nach ähnlichen Dateien in der Zielstruktur
+        filename_stem = Path(filename).stem
         for file_path in sorted_dir.rglob(f"*{file_ext}"):
-            similarity = SequenceMatcher(None, filename.lower(), file_path.name.lower()).ratio()
+            similarity = filename_similarity(filename_stem, file_path.stem, score_cutoff=0.6)
 
             if similarity > 0.6:  # Ähnlichkeitsschwelle
                 target_dir = str(file_path.parent)
@@ -1,16 +1,33 @@
 """
 LLM (Language Model) Service für die Dokumentenklassifizierung
 """
+import json
 import requests
+from requests.adapters import HTTPAdapter
 from typing import List, Optional
 from ..config.config_manager import ConfigManager
 
+
+def _create_session() -> requests.Session:
+    """Erstellt eine Keep-Alive-Session; ein Pool genügt, da nur LM Studio angesprochen wird"""
+    session = requests.Session()
+    session.headers.update({'Content-Type': 'application/json', 'Connection': 'keep-alive'})
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=8)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+# Gemeinsame Session: TCP-/TLS-Verbindungen werden über alle Aufrufe wiederverwendet
+llm_session = _create_session()
+
 class LLMService:
     """Service für die Interaktion mit dem Language Model"""
     
     def __init__(self):
         self.config = ConfigManager()
         self.llm_url = self.config.get('LM_STUDIO_URL')
+        self.session = llm_session
     
     def classify_document(self, text: str, categories: List[str]) -> str:
         """Klassifiziert ein Dokument basierend auf seinem Inhalt"""
@@ -25,19 +42,103 @@ Dokumententext:
 Antworte nur mit der Kategorie, nichts anderes. Falls unsicher, wähle 'Sonstiges'."""
         
         try:
-            response = self._call_llm(prompt)
-            if response:
-                category = response.strip()
-                return category if category in categories else 'Sonstiges'
+            category = self._stream_category(prompt, categories)
+            if category:
+                return category
         except Exception as e:
             print(f"Error in document classification: {e}")
         
         return 'Sonstiges'
     
+    @staticmethod
+    def _match_category(content: str, categories: List[str]) -> Optional[str]:
+        """
+        Prüft die bisher gestreamte Antwort gegen die Kategorien
+
+        Returns:
+            Kategorie bei eindeutiger Antwort, '' wenn keine Kategorie mehr passen
+            kann, None wenn weitere Tokens abgewartet werden müssen
+        """
+        # Reasoning-Modelle (DeepSeek-R1): erst der Text nach </think> ist die Antwort
+        if '<think>' in content:
+            if '</think>' not in content:
+                return None
+            content = content.rsplit('</think>', 1)[-1]
+
+        answer = content.strip()
+        if not answer:
+            return None
+
+        candidates = [category for category in categories if category.startswith(answer)]
+        if answer in categories and candidates == [answer]:
+            return answer
+        if not candidates:
+            # Längere Ausgabe, die mit einer Kategorie beginnt ("Steuern 2024")
+            for category in sorted(categories, key=len, reverse=True):
+                if answer.startswith(category) and answer[len(category)].isspace():
+                    return category
+            return ''
+        return None
+
+    def _stream_category(self, prompt: str, categories: List[str]) -> Optional[str]:
+        """
+        Streamt die Antwort und bricht ab, sobald die Kategorie feststeht
+
+        Das Schließen der Verbindung beendet die Generierung in LM Studio,
+        weitere Tokens werden weder erzeugt noch übertragen.
+
+        Returns:
+            Erkannte Kategorie, '' bei unbrauchbarer Antwort, None bei Fehler
+        """
+        try:
+            response = self.session.post(
+                self.llm_url,
+                json={
+                    "model": "deepseek-r1",
+                    "messages": [
+                        {"role": "user", "content": prompt}
+                    ],
+                    "temperature": 0.1,
+                    "max_tokens": 50,
+                    "stream": True
+                },
+                timeout=30,
+                stream=True
+            )
+        except Exception as e:
+            print(f"Error calling LM Studio: {e}")
+            return None
+
+        with response:
+            if response.status_code != 200:
+                print(f"LM Studio Error: {response.status_code}")
+                return None
+
+            content = ''
+            for line in response.iter_lines():
+                # Server-Sent Events: "data: {...}", Ende mit "data: [DONE]"
+                if not line.startswith(b'data: '):
+                    continue
+                data = line[6:]
+                if data == b'[DONE]':
+                    break
+                choices = json.loads(data).get('choices') or [{}]
+                content += choices[0].get('delta', {}).get('content') or ''
+
+                category = self._match_category(content, categories)
+                if category is not None:
+                    return category
+
+        # Stream beendet: vollständige Antwort wie bisher exakt vergleichen
+        if '</think>' in content:
+            content = content.rsplit('</think>', 1)[-1]
+        answer = content.strip()
+        return answer if answer in categories else ''
+
     def _call_llm(self, prompt: str) -> Optional[str]:
         """Sendet eine Anfrage an das Language Model"""
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.llm_url,
                 json={
                     "model": "deepseek-r1",
@@ -2,9 +2,16 @@
 PDF Verarbeitungsservice für Document Sorter
 """
 import base64
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from pathlib import Path
 import fitz  # PyMuPDF
 
+from ..executors import PDF_TASK_TIMEOUT, get_pdf_executor
+from ..pdf.preview import default_preview_generator
+# Weitere Seiten werden nicht mehr gelesen, sobald TEXT_EXTRACTION_BUDGET Zeichen vorliegen
+from ..pdf.processor import TEXT_EXTRACTION_BUDGET, TEXT_EXTRACTION_FLAGS
+
+
 class PDFService:
     """Service für PDF-bezogene Operationen"""
     
@@ -12,19 +19,21 @@ class PDFService:
     def create_preview(pdf_path: str) -> str:
         """Konvertiert erste Seite eines PDFs zu Base64-String für Preview"""
         try:
-            doc = fitz.open(pdf_path)
-            page = doc[0]
-            
-            # Render als PNG mit 150 DPI
-            mat = fitz.Matrix(1.5, 1.5)
-            pix = page.get_pixmap(matrix=mat)
-            img_data = pix.tobytes("png")
+            # Rendern im gemeinsamen PDF-Prozesspool statt im Request-Thread
+            # (pypdfium2 falls installiert, sonst PyMuPDF; wie /api/preview)
+            img_data = get_pdf_executor().submit(default_preview_generator.render_preview, pdf_path).result(
+                timeout=PDF_TASK_TIMEOUT
+            )
+            if img_data is None:
+                return None
             
             # Base64 encoding für HTML-Anzeige
             img_b64 = base64.b64encode(img_data).decode()
-            doc.close()
             
-            return f"data:image/png;base64,{img_b64}"
+            return f"data:{default_preview_generator.mimetype};base64,{img_b64}"
+        except FutureTimeoutError:
+            print(f"Preview rendering timed out after {PDF_TASK_TIMEOUT}s: {pdf_path}")
+            return None
         except Exception as e:
             print(f"Error creating preview: {e}")
             return None
@@ -33,16 +42,18 @@ class PDFService:
     def extract_text(pdf_path: str, max_pages: int = 3) -> str:
         """Extrahiert Text aus den ersten Seiten eines PDFs"""
         try:
-            doc = fitz.open(pdf_path)
-            text = ""
-            
-            # Maximal erste max_pages Seiten für Performance
-            for page_num in range(min(max_pages, len(doc))):
-                page = doc[page_num]
-                text += page.get_text()
-            
-            doc.close()
-            return text.strip()
+            parts = []
+            collected = 0
+            with fitz.open(pdf_path) as doc:
+                # Maximal erste max_pages Seiten für Performance
+                for page_num in range(min(max_pages, len(doc))):
+                    page_text = doc[page_num].get_text("text", flags=TEXT_EXTRACTION_FLAGS, sort=False)
+                    parts.append(page_text)
+                    collected += len(page_text)
+                    if collected >= TEXT_EXTRACTION_BUDGET:
+                        break
+
+            return "".join(parts).strip()
         except Exception as e:
             print(f"Error extracting text: {e}")
             return ""
\ No newline at end of file
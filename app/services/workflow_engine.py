@@ -117,19 +117,100 @@ class WorkflowEngine:
                             exception=e)
 
             processing_time = (datetime.now() - start_time).total_seconds()
-            return WorkflowResult(
-                success=False,
-                action_taken=WorkflowAction.MANUAL_REVIEW,
-                target_category=None,
-                target_path=None,
-                confidence=0.0,
-                template_result=template_result if 'template_result' in locals() else None,
-                ai_result=None,
-                applied_rules=[],
-                metadata={'error': str(e)},
-                processing_time=processing_time
+            return self._failed_result(
+                e, template_result if 'template_result' in locals() else None, processing_time
             )
 
+    def process_documents(self, file_paths: List[str], context: Dict[str, Any] = None,
+                          texts: Optional[List[str]] = None) -> List[WorkflowResult]:
+        """
+        Verarbeite mehrere Dokumente; alle AUTO_CLASSIFY-Dokumente teilen sich
+        einen einzigen LM Studio Request
+
+        Args:
+            file_paths: Pfade zu den Dateien
+            context: Zusätzlicher Kontext (z.B. Batch-Operation Info)
+            texts: Bereits extrahierte Texte (optional, gleiche Reihenfolge)
+
+        Returns:
+            Liste von WorkflowResults in der Reihenfolge von file_paths
+        """
+        start_time = datetime.now()
+        context = context or {}
+        results: List[Optional[WorkflowResult]] = [None] * len(file_paths)
+        prepared = []
+
+        # Step 1+2: Template-Erkennung und Regel-Auswertung pro Dokument
+        for index, file_path in enumerate(file_paths):
+            file_path_obj = Path(file_path)
+            template_result = None
+            try:
+                text = texts[index] if texts is not None else self._extract_text(file_path)
+                template_result = document_template_engine.recognize_document_type(text, file_path_obj.name)
+                applicable_rules = self._evaluate_rules(file_path_obj, template_result, context)
+                prepared.append((index, file_path_obj, text, template_result, applicable_rules))
+            except Exception as e:
+                self.logger.error("Workflow processing failed", file_path=file_path, exception=e)
+                results[index] = self._failed_result(e, template_result)
+
+        # Step 3: Gemeinsame AI-Klassifizierung für alle AUTO_CLASSIFY-Dokumente
+        auto_classify = [
+            item for item in prepared
+            if self._determine_action(item[4], item[3]) == WorkflowAction.AUTO_CLASSIFY
+        ]
+        ai_results = {}
+        if auto_classify:
+            try:
+                categories = self.category_manager.get_smart_categories()
+                category_info = self.category_manager.build_category_context_for_ai()
+                analyses = self.document_classifier.classify_with_analysis_batch(
+                    [(text, file_path_obj.name) for _, file_path_obj, text, _, _ in auto_classify],
+                    categories, category_info
+                )
+                ai_results = {item[0]: analysis for item, analysis in zip(auto_classify, analyses)}
+            except Exception as e:
+                # Einzelklassifizierung als Rückfall
+                self.logger.error("Batch classification failed", documents=len(auto_classify), exception=e)
+
+        # Step 4: Aktionen ausführen
+        for index, file_path_obj, text, template_result, applicable_rules in prepared:
+            try:
+                results[index] = self._execute_workflow(
+                    file_path_obj, text, template_result, applicable_rules, context,
+                    ai_result=ai_results.get(index)
+                )
+            except Exception as e:
+                self.logger.error("Workflow processing failed", file_path=str(file_path_obj), exception=e)
+                results[index] = self._failed_result(e, template_result)
+
+        # Verarbeitungszeit anteilig auf die Dokumente verteilen
+        processing_time = (datetime.now() - start_time).total_seconds()
+        for result in results:
+            result.processing_time = processing_time / len(results)
+
+        self.logger.info("Document batch workflow completed",
+                       documents=len(file_paths),
+                       classified=len(ai_results),
+                       processing_time=processing_time)
+
+        return results
+
+    def _failed_result(self, error: Exception, template_result: Optional[DocumentTypeResult],
+                       processing_time: float = 0.0) -> WorkflowResult:
+        """Erzeuge WorkflowResult für fehlgeschlagene Verarbeitung"""
+        return WorkflowResult(
+            success=False,
+            action_taken=WorkflowAction.MANUAL_REVIEW,
+            target_category=None,
+            target_path=None,
+            confidence=0.0,
+            template_result=template_result,
+            ai_result=None,
+            applied_rules=[],
+            metadata={'error': str(error)},
+            processing_time=processing_time
+        )
+
     def _evaluate_rules(self, file_path: Path, template_result: Optional[DocumentTypeResult],
                        context: Dict[str, Any]) -> List[WorkflowRule]:
         """Evaluiere welche Regeln auf das Dokument anwendbar sind"""
@@ -180,7 +261,8 @@ class WorkflowEngine:
     def _execute_workflow(self, file_path: Path, text: str,
                          template_result: Optional[DocumentTypeResult],
                          applicable_rules: List[WorkflowRule],
-                         context: Dict[str, Any]) -> WorkflowResult:
+                         context: Dict[str, Any],
+                         ai_result: Optional[Dict[str, Any]] = None) -> WorkflowResult:
         """Führe Workflow-Aktionen aus"""
 
         applied_rule_ids = [rule.id for rule in applicable_rules]
@@ -189,7 +271,7 @@ class WorkflowEngine:
         action = self._determine_action(applicable_rules, template_result)
 
         if action == WorkflowAction.AUTO_CLASSIFY:
-            return self._auto_classify_document(file_path, text, template_result, applied_rule_ids)
+            return self._auto_classify_document(file_path, text, template_result, applied_rule_ids, ai_result)
 
         elif action == WorkflowAction.FORCE_CATEGORY:
             # Hole erzwungene Kategorie aus Regeln
@@ -230,17 +312,19 @@ class WorkflowEngine:
 
     def _auto_classify_document(self, file_path: Path, text: str,
                               template_result: Optional[DocumentTypeResult],
-                              applied_rules: List[str]) -> WorkflowResult:
+                              applied_rules: List[str],
+                              ai_result: Optional[Dict[str, Any]] = None) -> WorkflowResult:
         """Automatische Klassifizierung mit AI + Templates"""
         try:
-            # Hole verfügbare Kategorien
-            categories = self.category_manager.get_smart_categories()
-            category_info = self.category_manager.build_category_context_for_ai()
+            if ai_result is None:
+                # Hole verfügbare Kategorien
+                categories = self.category_manager.get_smart_categories()
+                category_info = self.category_manager.build_category_context_for_ai()
 
-            # Klassifiziere mit Template-Integration
-            ai_result = self.document_classifier.classify_with_analysis(
-                text, file_path.name, categories, category_info
-            )
+                # Klassifiziere mit Template-Integration
+                ai_result = self.document_classifier.classify_with_analysis(
+                    text, file_path.name, categories, category_info
+                )
 
             target_category = ai_result['category']['category']
             suggested_subdirectory = ai_result['category'].get('subdirectory', '')
@@ -392,7 +476,8 @@ class WorkflowEngine:
         """Extrahiere Text aus PDF"""
         try:
             from ..pdf import PDFProcessor
-            pdf_processor = PDFProcessor(max_pages=3)
+            from ..pdf.processor import TEXT_EXTRACTION_BUDGET
+            pdf_processor = PDFProcessor(max_pages=3, max_chars=TEXT_EXTRACTION_BUDGET)
             return pdf_processor.extract_text(file_path)
         except Exception as e:
             self.logger.error("Text extraction failed", file_path=file_path, exception=e)
@@ -5,7 +5,7 @@ Centralized configuration handling with environment-specific settings
 
 import os
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, FrozenSet
 
 
 class Config:
@@ -18,6 +18,10 @@ class Config:
     DEFAULT_DEBUG_MODE = True
     DEFAULT_PORT = 5000
     DEFAULT_HOST = '127.0.0.1'
+    DEFAULT_PREVIEW_CACHE_DIR = './cache/previews'
+    DEFAULT_PREVIEW_CACHE_MAX_FILES = 2000
+    DEFAULT_DOCUMENT_CACHE_PATH = './cache/documents.sqlite3'
+    DEFAULT_SEM_CACHE_THRESHOLD = 0.9
 
     # Global blacklist directories (system-wide)
     GLOBAL_BLACKLIST_DIRS = [
@@ -35,6 +39,8 @@ class Config:
     def __init__(self):
         """Initialize configuration by loading from config_secret.py or using defaults"""
         self._load_configuration()
+        # Blacklist einmalig als frozenset für O(1)-Lookups beim Verzeichnisscan
+        self.blacklist_set: FrozenSet[str] = frozenset(self.blacklist_dirs)
         self._setup_paths()
         self._validate_configuration()
 
@@ -65,10 +71,29 @@ class Config:
             self.personal_blacklist_dirs = []
             self._config_source = "defaults"
 
+        # Vorschaubilder werden auf der Platte gecacht statt im RAM
+        self.preview_cache_dir = os.environ.get('PREVIEW_CACHE_DIR', self.DEFAULT_PREVIEW_CACHE_DIR)
+        # Ältere Vorschaubilder (verschobene oder geänderte PDFs) werden darüber hinaus gelöscht
+        self.preview_cache_max_files = int(
+            os.environ.get('PREVIEW_CACHE_MAX_FILES', self.DEFAULT_PREVIEW_CACHE_MAX_FILES)
+        )
+
+        # Verarbeitungsergebnisse überdauern Neustarts in einer SQLite-Datei
+        self.document_cache_path = os.environ.get('DOCUMENT_CACHE_PATH', self.DEFAULT_DOCUMENT_CACHE_PATH)
+
+        # Interner Nginx-Pfad für Vorschaubilder (leer: Auslieferung durch Flask)
+        self.preview_accel_redirect = os.environ.get('PREVIEW_ACCEL_REDIRECT', '')
+
+        # Mindestähnlichkeit, ab der eine Klassifizierung wiederverwendet wird
+        self.sem_cache_threshold = float(
+            os.environ.get('SEM_CACHE_THRESHOLD', self.DEFAULT_SEM_CACHE_THRESHOLD)
+        )
+
     def _setup_paths(self):
         """Setup and normalize paths"""
         self.scan_path = Path(self.scan_dir)
         self.sorted_path = Path(self.sorted_dir)
+        self.preview_cache_path = Path(self.preview_cache_dir)
 
     def _validate_configuration(self):
         """Validate configuration values"""
@@ -76,6 +101,10 @@ class Config:
         if not isinstance(self.port, int) or not (1 <= self.port <= 65535):
             raise ValueError(f"Invalid port: {self.port}")
 
+        # Validate semantic cache threshold
+        if not 0.0 < self.sem_cache_threshold <= 1.0:
+            raise ValueError(f"Invalid semantic cache threshold: {self.sem_cache_threshold}")
+
         # Validate URLs
         if not self.lm_studio_url.startswith(('http://', 'https://')):
             raise ValueError(f"Invalid LM Studio URL: {self.lm_studio_url}")
@@ -95,7 +124,12 @@ class Config:
             'BLACKLIST_DIRS': self.blacklist_dirs,
             'DEBUG_MODE': self.debug_mode,
             'PORT': self.port,
-            'HOST': self.host
+            'HOST': self.host,
+            'PREVIEW_CACHE_DIR': self.preview_cache_dir,
+            'PREVIEW_CACHE_MAX_FILES': self.preview_cache_max_files,
+            'DOCUMENT_CACHE_PATH': self.document_cache_path,
+            'PREVIEW_ACCEL_REDIRECT': self.preview_accel_redirect,
+            'SEM_CACHE_THRESHOLD': self.sem_cache_threshold
         }
 
     def get_summary(self) -> Dict[str, Any]:
@@ -108,6 +142,7 @@ class Config:
             'debug_mode': self.debug_mode,
             'port': self.port,
             'host': self.host,
+            'preview_cache_dir': self.preview_cache_dir,
             'blacklist_count': len(self.blacklist_dirs),
             'personal_blacklist_count': len(self.personal_blacklist_dirs),
             'paths_exist': {
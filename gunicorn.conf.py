@@ -0,0 +1,25 @@
+"""
+Gunicorn configuration for Document Sorter
+
+Threaded workers (gthread): PDF rendering runs in the shared process pool and
+LM Studio requests wait on the network, so request threads mostly block
+without holding the GIL. A few processes with many threads each serve
+concurrent requests without duplicating the in-memory caches per thread.
+
+Usage:
+    gunicorn -c gunicorn.conf.py wsgi:app
+"""
+
+import os
+
+bind = f"{os.getenv('FLASK_HOST', '0.0.0.0')}:{os.getenv('FLASK_PORT', '5000')}"
+worker_class = 'gthread'
+workers = int(os.getenv('WORKERS', '2'))
+threads = int(os.getenv('THREADS', '16'))
+timeout = int(os.getenv('TIMEOUT', '120'))
+graceful_timeout = 30
+keepalive = 5
+
+accesslog = None
+errorlog = '-'
+loglevel = os.getenv('LOG_LEVEL', 'INFO').lower()
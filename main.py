@@ -5,15 +5,16 @@ Integriert alle Services und stellt die Web-Oberfläche bereit
 TODO: Zukünftige Verbesserungen und Features
 
 """
-from flask import Flask, render_template, request, jsonify
+from flask import render_template, request, jsonify
 from pathlib import Path
 
 from app.config.config_manager import ConfigManager
 from app.services.file_service import FileService
 from app.services.llm_service import LLMService
+from app.factory import create_app
 
-# Flask App initialisieren
-app = Flask(__name__)
+# Flask App initialisieren (ohne Blueprints und Middleware der Haupt-App)
+app = create_app(__name__, extras=False)
 
 # Services initialisieren
 config = ConfigManager()
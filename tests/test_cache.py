@@ -0,0 +1,93 @@
+"""
+Tests for shared cache helpers
+"""
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.cache import LRUCache, SQLiteCache
+
+
+class TestLRUCache:
+    """Test cases for LRUCache"""
+
+    def test_evicts_least_recently_used(self):
+        """Test oldest untouched entry is evicted when full"""
+        cache = LRUCache(maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+
+        assert 'a' in cache
+        assert 'b' not in cache
+        assert len(cache) == 2
+
+    def test_stats(self):
+        """Test hit and miss counters"""
+        cache = LRUCache(maxsize=2)
+        cache.set('a', 1)
+        cache.get('a')
+        cache.get('missing')
+
+        stats = cache.get_stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['hit_rate'] == 0.5
+
+
+class TestSQLiteCache:
+    """Test cases for the persistent SQLite cache"""
+
+    def test_values_survive_new_instance(self, temp_dirs):
+        """Test entries are read back by a second instance on the same file"""
+        path = os.path.join(temp_dirs['scan_dir'], 'cache', 'documents.sqlite3')
+        key = ('/scan/a.pdf', 123, 456, ('Steuern',), '')
+        SQLiteCache(path).set(key, {'suggested_category': 'Steuern'})
+
+        cache = SQLiteCache(path)
+        assert cache.get(key) == {'suggested_category': 'Steuern'}
+        assert cache.get(('/scan/a.pdf', 124, 456, ('Steuern',), '')) is None
+
+        cache.clear()
+        assert cache.get(key) is None
+
+    def test_clear_increments_generation_for_all_instances(self, temp_dirs):
+        """Test a clear() through one instance is visible to another process' instance"""
+        path = os.path.join(temp_dirs['scan_dir'], 'documents.sqlite3')
+        first, second = SQLiteCache(path), SQLiteCache(path)
+        assert second.generation() == 0
+
+        first.clear()
+        first.clear()
+
+        assert second.generation() == 2
+
+    def test_evicts_oldest(self, temp_dirs):
+        """Test only the newest maxsize entries are kept"""
+        cache = SQLiteCache(os.path.join(temp_dirs['scan_dir'], 'documents.sqlite3'), maxsize=2)
+        for key in ('a', 'b', 'c'):
+            cache.set(key, key)
+
+        assert cache.get('a') is None
+        assert len(cache) == 2
+
+
+class TestPreviewCacheSweep:
+    """Test cases for bounding the preview image directory"""
+
+    def test_oldest_previews_removed(self, temp_dirs):
+        """Test only the most recently written max_files images are kept"""
+        from app.api.documents import sweep_preview_cache
+
+        preview_dir = temp_dirs['scan_dir']
+        for age, name in enumerate(('new.jpg', 'middle.jpg', 'old.jpg')):
+            path = os.path.join(preview_dir, name)
+            with open(path, 'wb') as f:
+                f.write(b'jpg')
+            os.utime(path, (1000 - age, 1000 - age))
+
+        assert sweep_preview_cache(preview_dir, 2) == 1
+        assert sorted(os.listdir(preview_dir)) == ['middle.jpg', 'new.jpg']
+        assert sweep_preview_cache(preview_dir, 2) == 0
@@ -0,0 +1,384 @@
+"""
+Tests for AI document classifier functionality
+"""
+import json
+import pytest
+from unittest.mock import patch, MagicMock
+import sys
+import os
+
+# Import the classifier to test
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.ai.classifier import DocumentClassifier
+from app.ai.semantic_cache import SemanticCache
+
+
+@pytest.fixture
+def classifier():
+    """Create DocumentClassifier instance with empty classification caches"""
+    classifier = DocumentClassifier(lm_studio_url="http://localhost:1234/v1/chat/completions")
+    classifier.clear_cache()
+    return classifier
+
+
+class TestBatchClassification:
+    """Test cases for batched LM Studio classification"""
+
+    def test_completions_url(self, classifier):
+        """Test completions URL is derived from chat URL"""
+        assert classifier.completions_url == "http://localhost:1234/v1/completions"
+
+    @patch('app.ai.classifier.lm_session.post')
+    def test_batch_single_request(self, mock_post, classifier):
+        """Test several documents are classified with one request, mapped by index"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            'choices': [
+                {'index': 1, 'text': 'Versicherung | KFZ'},
+                {'index': 0, 'text': 'Steuern | 2024'}
+            ]
+        }
+        mock_post.return_value = mock_response
+
+        results = classifier.classify_with_analysis_batch(
+            [("Lorem ipsum", "a.pdf"), ("Dolor sit amet", "b.pdf")],
+            ['Steuern', 'Versicherung'],
+            "Steuern, Versicherung"
+        )
+
+        mock_post.assert_called_once()
+        assert len(json.loads(mock_post.call_args.kwargs['data'])['prompt']) == 2
+        assert results[0]['category']['category'] == 'Steuern'
+        assert results[1]['category']['category'] == 'Versicherung'
+
+    @patch('app.ai.classifier.lm_session.post')
+    def test_large_batch_split_into_chunks(self, mock_post, classifier):
+        """Test large batches are sent concurrently in CLASSIFICATION_BATCH_SIZE chunks, order preserved"""
+        from app.ai.classifier import CLASSIFICATION_BATCH_SIZE
+
+        def respond(url, json, timeout):
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.json.return_value = {
+                'choices': [{'index': i, 'text': 'Steuern | 2024'} for i in range(len(json['prompt']))]
+            }
+            return mock_response
+
+        mock_post.side_effect = respond
+        documents = [(f"Lorem ipsum {i}", f"{i}.pdf") for i in range(3 * CLASSIFICATION_BATCH_SIZE + 2)]
+
+        results = classifier.classify_documents_batch(documents, ['Steuern', 'Versicherung'], "")
+
+        assert mock_post.call_count == 4
+        assert [r['filename'] for r in results] == [filename for _, filename in documents]
+
+    @patch('app.ai.classifier.lm_session.post')
+    def test_async_documents_classified_concurrently(self, mock_post, classifier):
+        """Test the async API returns results in input order"""
+        import asyncio
+
+        def respond(url, data, timeout):
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            content = 'Versicherung | KFZ' if 'Dolor' in json.loads(data)['messages'][1]['content'] else 'Steuern | 2024'
+            mock_response.json.return_value = {'choices': [{'message': {'content': content}}]}
+            return mock_response
+
+        mock_post.side_effect = respond
+        classifier.clear_cache()
+
+        results = asyncio.run(classifier.classify_documents_async(
+            [("Lorem ipsum async", "a.pdf"), ("Dolor sit amet async", "b.pdf")],
+            ['Steuern', 'Versicherung'], ""
+        ))
+
+        assert results == [
+            {'category': 'Steuern', 'subdirectory': '2024'},
+            {'category': 'Versicherung', 'subdirectory': 'KFZ'}
+        ]
+
+    @patch('app.ai.classifier.lm_session.post')
+    def test_batch_fallback_on_error(self, mock_post, classifier):
+        """Test batch falls back per document when LM Studio is unreachable"""
+        mock_post.side_effect = Exception("Connection refused")
+
+        results = classifier.classify_with_analysis_batch(
+            [("Lorem ipsum", "a.pdf")], ['Steuern', 'Versicherung'], ""
+        )
+
+        assert len(results) == 1
+        assert results[0]['category']['category'] in ['Steuern', 'Versicherung']
+
+
+class TestPromptPrefix:
+    """Test cases for the cache-friendly prompt layout"""
+
+    def test_documents_share_static_prefix(self):
+        """Test everything before the document context is identical across documents"""
+        from app.ai.prompts import PromptManager, build_classification_preamble
+
+        manager = PromptManager()
+        category_info = "- Steuern\n- Versicherung"
+        first = manager.build_classification_prompt("Lorem ipsum", "a.pdf", category_info)
+        second = manager.build_classification_prompt("Dolor sit amet", "b.pdf", category_info)
+        preamble = build_classification_preamble(category_info)
+
+        assert first.startswith(preamble) and second.startswith(preamble)
+        assert "a.pdf" not in preamble and category_info in preamble
+
+
+class TestKeywordClassification:
+    """Test cases for rule-based classification before the LLM"""
+
+    @patch('app.ai.classifier.lm_session.post')
+    def test_unique_keyword_skips_llm(self, mock_post, classifier):
+        """Test unambiguous keyword hit returns without calling LM Studio"""
+        result = classifier.classify_document(
+            "Ihr Kontoauszug Nr. 3 vom 01.02.2024", "scan.pdf",
+            ['Banken', 'Steuern'], ""
+        )
+
+        assert result == {'category': 'Banken', 'subdirectory': ''}
+        mock_post.assert_not_called()
+
+    @patch('app.ai.classifier.lm_session.post')
+    def test_filename_keyword_skips_llm(self, mock_post, classifier):
+        """Test a whole-word filename keyword for one category returns without LM Studio"""
+        result = classifier.classify_document(
+            "Lorem ipsum", "gehalt_2024_06.pdf", ['10_arbeit', 'Steuern'], ""
+        )
+
+        assert result == {'category': '10_arbeit', 'subdirectory': ''}
+        mock_post.assert_not_called()
+        assert classifier.get_filename_rule_stats()['hits'] == 1
+
+    def test_filename_keyword_inside_word_falls_through(self, classifier):
+        """Test keywords only found inside longer words are not trusted"""
+        assert classifier._classify_by_filename("haushaltsplan.pdf", ['Immobilien', 'Steuern']) is None
+
+    def test_ambiguous_keywords_fall_through(self, classifier):
+        """Test keywords pointing to several categories are not decided by rules"""
+        result = classifier._classify_by_keywords(
+            "Finanzamt Köln, Kontoauszug anbei", ['Banken', 'Steuern']
+        )
+
+        assert result is None
+
+    def test_fallback_boost_depends_on_found_keyword(self):
+        """Test the topic boost applies only if the found keyword itself shares the topic"""
+        from app.ai.classifier import FALLBACK_KEYWORD_MAPPINGS, fallback_score
+
+        keywords = FALLBACK_KEYWORD_MAPPINGS['schöffe']
+
+        assert fallback_score('schöffe', keywords, 'schöffin', 'amtsgericht') == 12
+        assert fallback_score('schöffe', keywords, 'laienrichter', 'amtsgericht') == 5
+        assert fallback_score('schöffe', keywords, 'schöffin', 'schöffe 2024') == 15
+
+    def test_fallback_keywords_found_with_overlaps(self):
+        """Test the single-pass matcher finds nested and prefix keywords like substring checks"""
+        from app.ai.classifier import FALLBACK_KEYWORD_MAPPINGS, find_fallback_keywords
+
+        filename = "landgericht_rechnungen.pdf"
+        text = "ihr arbeitsvertrag und die mietvertrag-unterlagen"
+        expected = {
+            keyword
+            for keywords in FALLBACK_KEYWORD_MAPPINGS.values() for keyword in keywords
+            if keyword in filename or keyword in text
+        }
+
+        assert find_fallback_keywords(filename, text) == expected
+        assert {'gericht', 'rechnung', 'arbeit', 'mietvertrag'} <= expected
+
+
+class TestClassificationCache:
+    """Test cases for caching LM Studio classification responses"""
+
+    @patch('app.ai.classifier.lm_session.post')
+    def test_repeated_text_served_from_cache(self, mock_post, classifier):
+        """Test identical text, filename and categories only call LM Studio once"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            'choices': [{'message': {'content': 'Versicherung | KFZ'}}]
+        }
+        mock_post.return_value = mock_response
+        text = "Lorem ipsum dolor sit amet, cache test document"
+
+        first = classifier.classify_document(text, "a.pdf", ['Steuern', 'Versicherung'], "")
+        second = classifier.classify_document(text, "a.pdf", ['Steuern', 'Versicherung'], "")
+
+        assert mock_post.call_count == 1
+        assert first == second == {'category': 'Versicherung', 'subdirectory': 'KFZ'}
+
+        classifier.classify_document(text, "b.pdf", ['Steuern', 'Versicherung'], "")
+        assert mock_post.call_count == 2
+
+    @patch('app.ai.classifier.lm_session.post')
+    def test_empty_text_not_cached(self, mock_post, classifier):
+        """Test scans without text layer are classified per document"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            'choices': [{'message': {'content': 'Steuern'}}]
+        }
+        mock_post.return_value = mock_response
+
+        classifier.classify_document("", "scan_001.pdf", ['Steuern', 'Versicherung'], "")
+        classifier.classify_document("", "scan_001.pdf", ['Steuern', 'Versicherung'], "")
+
+        assert mock_post.call_count == 2
+
+    @patch('app.ai.classifier.lm_session.post')
+    def test_methods_do_not_share_cache_entries(self, mock_post, classifier):
+        """Test the plain and enhanced paths cache separately, short texts not at all"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            'choices': [{'message': {'content': 'Steuern | 2024'}}]
+        }
+        mock_post.return_value = mock_response
+        text = "Lorem ipsum dolor sit amet, shared cache test"
+        categories = ['Steuern', 'Versicherung']
+
+        classifier.classify_document(text, "a.pdf", categories, "")
+        classifier.classify_document_enhanced(text, "a.pdf", categories, "")
+        assert mock_post.call_count == 2
+
+        classifier.classify_document_enhanced("", "scan.pdf", categories, "")
+        classifier.classify_document_enhanced("", "scan.pdf", categories, "")
+        assert mock_post.call_count == 4
+
+    @patch('app.ai.classifier.lm_session.post')
+    def test_enhanced_reprocessing_served_from_cache(self, mock_post, classifier):
+        """Test the enhanced path caches per text and filename until clear_cache()"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            'choices': [{'message': {'content': 'Steuern | 2024'}}]
+        }
+        mock_post.return_value = mock_response
+        text = "Lorem ipsum dolor sit amet, enhanced cache test"
+        categories = ['Steuern', 'Versicherung']
+
+        classifier.classify_document_enhanced(text, "a.pdf", categories, "")
+        classifier.classify_document_enhanced(text, "a.pdf", categories, "")
+        assert mock_post.call_count == 1
+
+        classifier.classify_document_enhanced(text, "b.pdf", categories, "")
+        assert mock_post.call_count == 2
+
+        classifier.clear_cache()
+        classifier.classify_document_enhanced(text, "a.pdf", categories, "")
+        assert mock_post.call_count == 3
+
+
+class TestSemanticCache:
+    """Test cases for the near-duplicate classification cache"""
+
+    LETTER = ("Sehr geehrte Kundin, anbei erhalten Sie Ihre Stromabrechnung für den Zeitraum "
+              "vom {start} bis {end}. Der Abschlag beträgt {amount} Euro und wird wie gewohnt "
+              "von Ihrem Konto eingezogen. Bei Fragen wenden Sie sich bitte an unseren Kundenservice. "
+              "Mit freundlichen Grüßen Ihre Stadtwerke")
+
+    def test_same_template_different_numbers_hits(self):
+        """Test letters differing only in dates and amounts share the result"""
+        cache = SemanticCache(threshold=0.9)
+        cache.set(self.LETTER.format(start="01.01.2023", end="31.12.2023", amount="120"),
+                  ['Wohnen'], {'category': 'Wohnen', 'subdirectory': 'Strom'})
+
+        result = cache.get(self.LETTER.format(start="01.01.2024", end="31.12.2024", amount="135"),
+                           ['Wohnen'])
+
+        assert result == {'category': 'Wohnen', 'subdirectory': 'Strom'}
+
+    @patch('app.ai.classifier.lm_session.post')
+    def test_enhanced_path_reuses_similar_letter(self, mock_post, classifier):
+        """Test the enhanced path answers a near-duplicate letter without LM Studio"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            'choices': [{'message': {'content': 'Wohnen | Strom'}}]
+        }
+        mock_post.return_value = mock_response
+        categories = ['Wohnen', 'Steuern']
+
+        first = classifier.classify_document_enhanced(
+            self.LETTER.format(start="01.01.2023", end="31.12.2023", amount="120"), "jan.pdf", categories, "")
+        second = classifier.classify_document_enhanced(
+            self.LETTER.format(start="01.01.2024", end="31.12.2024", amount="135"), "feb.pdf", categories, "")
+
+        assert mock_post.call_count == 1
+        assert first == second == {'category': 'Wohnen', 'subdirectory': 'Strom'}
+
+    def test_different_categories_or_text_miss(self):
+        """Test other category lists and unrelated texts are not matched"""
+        cache = SemanticCache(threshold=0.9)
+        letter = self.LETTER.format(start="01.01.2023", end="31.12.2023", amount="120")
+        cache.set(letter, ['Wohnen'], {'category': 'Wohnen', 'subdirectory': ''})
+
+        assert cache.get(letter, ['Wohnen', 'Steuern']) is None
+        assert cache.get(
+            "Finanzamt Köln Steuerbescheid Einkommensteuer festgesetzt Erstattung Betrag "
+            "Steuernummer Veranlagung Rechtsbehelfsbelehrung Einspruch innerhalb eines Monats "
+            "nach Bekanntgabe schriftlich einlegen Begründung Anlage Berechnung Zinsen Solidaritätszuschlag",
+            ['Wohnen']
+        ) is None
+
+
+class TestMicroBatching:
+    """Test cases for coalescing concurrent LM Studio requests"""
+
+    def test_concurrent_items_share_one_batch(self):
+        """Test items submitted within the window are processed together"""
+        from app.ai.batching import MicroBatcher
+
+        batches = []
+
+        def process_batch(items):
+            batches.append(list(items))
+            return [item * 2 for item in items]
+
+        batcher = MicroBatcher(process_batch, max_batch_size=3, max_wait=1.0)
+        futures = [batcher.submit(value) for value in (1, 2, 3)]
+
+        assert [future.result(timeout=5) for future in futures] == [2, 4, 6]
+        assert batches == [[1, 2, 3]]
+
+    @patch('app.ai.classifier.lm_session.post')
+    def test_single_request_uses_chat_endpoint(self, mock_post, classifier):
+        """Test a lone request is sent to the chat endpoint unchanged"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            'choices': [{'message': {'content': 'Steuern | 2024'}}]
+        }
+        mock_post.return_value = mock_response
+
+        result = classifier.classify_document_enhanced(
+            "Lorem ipsum batching", "a.pdf", ['Steuern', 'Versicherung'], ""
+        )
+
+        assert result == {'category': 'Steuern', 'subdirectory': '2024'}
+        assert mock_post.call_args.args[0] == "http://localhost:1234/v1/chat/completions"
+
+    @patch('app.ai.classifier.lm_session.post')
+    def test_batch_shares_one_multi_document_prompt(self, mock_post, classifier):
+        """Test batched documents with the same categories are sent as one chat prompt"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            'choices': [{'message': {'content': '<think>...</think>["Steuern|2024", "Versicherung|KFZ"]'}}]
+        }
+        mock_post.return_value = mock_response
+
+        raw_responses = classifier._request_chat_batch([
+            ("Lorem ipsum", "a.pdf", "Steuern, Versicherung", None),
+            ("Dolor sit amet", "b.pdf", "Steuern, Versicherung", None),
+        ])
+
+        mock_post.assert_called_once()
+        prompt = json.loads(mock_post.call_args.kwargs['data'])['messages'][1]['content']
+        assert prompt.count("Steuern, Versicherung") == 1
+        assert raw_responses == ["Steuern|2024", "Versicherung|KFZ"]
@@ -0,0 +1,155 @@
+"""
+Tests for directory and category management
+"""
+import os
+import sys
+
+# Import the modules to test
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.directory.categories import CategoryManager
+from app.directory.similarity import calculate_similarity
+
+
+class TestCategoryCaching:
+    """Test cases for mtime-invalidated category caches"""
+
+    def test_categories_refresh_on_new_directory(self, temp_dirs):
+        """Test cached categories are rebuilt when a category is added"""
+        sorted_dir = temp_dirs['sorted_dir']
+        os.makedirs(os.path.join(sorted_dir, 'Steuern'))
+        manager = CategoryManager(sorted_dir, [])
+
+        assert manager.get_smart_categories() == ['Steuern']
+
+        os.makedirs(os.path.join(sorted_dir, 'Banken'))
+        assert manager.get_smart_categories() == ['Banken', 'Steuern']
+
+    def test_directory_tree_refresh_on_new_subdirectory(self, temp_dirs):
+        """Test cached tree is rebuilt when a nested directory changes"""
+        sorted_dir = temp_dirs['sorted_dir']
+        os.makedirs(os.path.join(sorted_dir, 'Steuern', '2023'))
+        manager = CategoryManager(sorted_dir, [])
+
+        tree = manager.get_directory_tree()
+        assert manager.get_directory_tree() is tree
+
+        os.makedirs(os.path.join(sorted_dir, 'Steuern', '2024'))
+        children = manager.get_directory_tree()['Steuern']['children']
+        assert sorted(children) == ['2023', '2024']
+
+    def test_subdirectories_refresh_on_change(self, temp_dirs):
+        """Test cached subdirectories and AI context follow directory changes"""
+        sorted_dir = temp_dirs['sorted_dir']
+        os.makedirs(os.path.join(sorted_dir, 'Steuern', '2023'))
+        manager = CategoryManager(sorted_dir, [])
+
+        assert manager.get_subdirectories('Steuern') == ['2023']
+        context = manager.build_category_context_for_ai()
+        assert manager.build_category_context_for_ai() is context
+
+        os.makedirs(os.path.join(sorted_dir, 'Steuern', '2024'))
+        assert manager.get_subdirectories('Steuern') == ['2023', '2024']
+        assert '2024' in manager.build_category_context_for_ai()
+
+    def test_ttl_skips_mtime_checks_until_invalidated(self, temp_dirs):
+        """Test results within the TTL are served unchecked until invalidate()"""
+        sorted_dir = temp_dirs['sorted_dir']
+        os.makedirs(os.path.join(sorted_dir, 'Steuern'))
+        manager = CategoryManager(sorted_dir, [], cache_ttl=60)
+
+        assert manager.get_smart_categories() == ['Steuern']
+
+        os.makedirs(os.path.join(sorted_dir, 'Banken'))
+        assert manager.get_smart_categories() == ['Steuern']
+
+        manager.invalidate()
+        assert manager.get_smart_categories() == ['Banken', 'Steuern']
+
+    def test_directory_paths_flattened_from_tree(self, temp_dirs):
+        """Test flat path list contains relative paths without blacklisted dirs"""
+        sorted_dir = temp_dirs['sorted_dir']
+        os.makedirs(os.path.join(sorted_dir, 'Steuern', '2023'))
+        os.makedirs(os.path.join(sorted_dir, '.git'))
+        manager = CategoryManager(sorted_dir, ['.git'])
+
+        paths = manager.get_directory_paths()
+        assert sorted(paths) == ['Steuern', os.path.join('Steuern', '2023')]
+        assert manager.get_directory_paths() is paths
+
+
+class TestSimilarity:
+    """Test cases for token-set similarity"""
+
+    def test_identical_tokens_ignore_order_and_separators(self):
+        """Test token order, case and separators do not matter"""
+        assert calculate_similarity('Rechnung_Telekom', 'telekom-rechnung') == 1.0
+
+    def test_partial_overlap(self):
+        """Test Jaccard ratio for partially overlapping names"""
+        assert calculate_similarity('Rechnung Telekom 2024', 'Rechnung Telekom 2023') == 0.5
+
+    def test_empty_input(self):
+        """Test empty strings have no similarity"""
+        assert calculate_similarity('', 'Steuern') == 0.0
+
+    def test_similar_files_with_date_stamps(self, temp_dirs):
+        """Test names differing only in a date or month still count as similar files"""
+        from unittest.mock import MagicMock
+        from pathlib import Path
+        from app.services.filter_service import FilterService
+
+        sorted_dir = temp_dirs['sorted_dir']
+        for relative in ('Telekom/Rechnung_Telekom_2024_02.pdf', 'Scans/Scan_20240302_1.pdf',
+                         'Banken/Kontoauszug_April.pdf', 'Urlaub/Fotos_Italien.pdf'):
+            os.makedirs(os.path.dirname(os.path.join(sorted_dir, relative)), exist_ok=True)
+            Path(sorted_dir, relative).touch()
+        service = FilterService()
+        service.config = MagicMock()
+        service.config.get_path.return_value = Path(sorted_dir)
+
+        for filename, directory in (('Rechnung_Telekom_2024_03.pdf', 'Telekom'),
+                                    ('Scan_20240301_1.pdf', 'Scans'),
+                                    ('Kontoauszug_Maerz.pdf', 'Banken')):
+            suggestions = service._find_similar_files(filename, '.pdf')
+            assert [Path(s.target_path).name for s in suggestions] == [directory]
+
+
+class TestPathCombinations:
+    """Test cases for combination suggestions in the directories API"""
+
+    def test_best_pairs_match_exhaustive_search(self):
+        """Test candidate pruning returns the same pairs as checking all pairs"""
+        import heapq
+        from app.api.directories import best_category_pairs
+
+        similarities = [0.2, 1.0, 0.5, 0.2, 0.5, 1.0, 0.2, 0.5]
+        all_pairs = (
+            (i, j) for i in range(len(similarities)) for j in range(i + 1, len(similarities))
+        )
+        expected = heapq.nlargest(3, all_pairs, key=lambda p: similarities[p[0]] + similarities[p[1]])
+
+        assert best_category_pairs(similarities, 3) == expected
+
+
+class TestCleanupEmptyDirectories:
+    """Test cases for removing empty directories"""
+
+    def test_nested_empty_directories_removed(self, temp_dirs):
+        """Test empty chains are removed while files and blacklisted dirs are kept"""
+        from app.directory.manager import DirectoryManager
+
+        sorted_dir = temp_dirs['sorted_dir']
+        os.makedirs(os.path.join(sorted_dir, 'Leer', 'A', 'B'))
+        os.makedirs(os.path.join(sorted_dir, 'Steuern'))
+        with open(os.path.join(sorted_dir, 'Steuern', 'a.pdf'), 'wb') as f:
+            f.write(b'%PDF-1.4')
+        os.makedirs(os.path.join(sorted_dir, '.git', 'objects'))
+        manager = DirectoryManager(temp_dirs['scan_dir'], sorted_dir, ['.git'])
+
+        result = manager.cleanup_empty_directories()
+
+        assert result['success']
+        assert result['removed_count'] == 3
+        assert sorted(os.listdir(sorted_dir)) == ['.git', 'Steuern']
+        assert os.path.isdir(os.path.join(sorted_dir, '.git', 'objects'))
@@ -0,0 +1,30 @@
+"""
+Tests for the shared worker pools
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from concurrent.futures.process import BrokenProcessPool
+
+from app.executors import get_pdf_executor, shutdown_executors
+
+
+class TestPDFExecutor:
+    """Test cases for the shared PDF process pool"""
+
+    def test_broken_pool_replaced(self):
+        """Test a crashed worker only fails its own task, later calls get a new pool"""
+        pool = get_pdf_executor()
+        try:
+            with pytest.raises(BrokenProcessPool):
+                pool.submit(os._exit, 1).result(timeout=30)
+
+            replacement = get_pdf_executor()
+            assert replacement is not pool
+            assert replacement.submit(abs, -3).result(timeout=30) == 3
+        finally:
+            shutdown_executors(wait=True)
@@ -150,6 +150,42 @@ class TestLLMService:
         with pytest.raises(requests.exceptions.ConnectionError):
             llm_service.categorize_text("Test content")
 
+
+class TestStreamingClassification:
+    """Test cases for streamed classification in the keep-alive LLMService"""
+
+    @staticmethod
+    def _stream_response(*deltas):
+        """Build a streamed chat completion response yielding the given deltas"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.__enter__.return_value = mock_response
+        mock_response.iter_lines.return_value = [
+            b'data: ' + json.dumps({'choices': [{'delta': {'content': delta}}]}).encode()
+            for delta in deltas
+        ] + [b'data: [DONE]']
+        return mock_response
+
+    @patch('app.services.llm_service.llm_session.post')
+    def test_stops_after_category_following_reasoning(self, mock_post):
+        """Test reasoning is skipped and the stream is left once the category is clear"""
+        mock_response = self._stream_response('<think>Steuern oder', ' Banken?</think>', 'Ban', 'ken', '\n', 'never read')
+        mock_post.return_value = mock_response
+
+        category = LLMService().classify_document("Kontoauszug", ['Banken', 'Steuern'])
+
+        assert category == 'Banken'
+        assert mock_post.call_args.kwargs['json']['stream'] is True
+        mock_response.__exit__.assert_called_once()
+
+    @patch('app.services.llm_service.llm_session.post')
+    def test_unknown_answer_returns_sonstiges(self, mock_post):
+        """Test answers that cannot become a category fall back to Sonstiges"""
+        mock_post.return_value = self._stream_response('Weiß', ' nicht')
+
+        assert LLMService().classify_document("Text", ['Banken', 'Steuern']) == 'Sonstiges'
+
+
 class TestAsyncLLMService:
     """Test cases for AsyncLLMService if available"""
 
@@ -117,6 +117,30 @@ class TestPerformanceTracker:
         assert current_metrics['response_times']['/api/test']['count'] == 2
         assert current_metrics['request_counts']['/api/test'] == 2
 
+    def test_average_response_time_running_totals(self, tracker):
+        """Test overall average follows the sliding window of recorded times"""
+        assert tracker.get_average_response_time() == 0
+
+        for _ in range(1000):
+            tracker.record_response_time('/api/a', 1.0)
+        tracker.record_response_time('/api/a', 3.0)
+        tracker.record_response_time('/api/b', 2.0)
+
+        # Oldest 1.0 was evicted from the /api/a window
+        assert tracker.get_average_response_time() == pytest.approx((999 * 1.0 + 3.0 + 2.0) / 1001)
+        assert tracker.get_current_metrics()['response_times']['/api/a']['avg'] == pytest.approx(1002.0 / 1000)
+
+    def test_buffered_requests_visible_after_flush(self, tracker):
+        """Test buffered request metrics are applied in bulk before reads"""
+        tracker.record_request('/api/test', 0.5, False)
+        tracker.record_request('/api/test', 1.5, True)
+
+        current_metrics = tracker.get_current_metrics()
+        assert current_metrics['response_times']['/api/test']['count'] == 2
+        assert current_metrics['response_times']['/api/test']['avg'] == pytest.approx(1.0)
+        assert current_metrics['error_rates']['/api/test']['error_count'] == 1
+        assert not tracker._pending_requests
+
     def test_record_error_rate(self, tracker):
         """Test recording error rates"""
         tracker.record_error_rate('/api/test', False)
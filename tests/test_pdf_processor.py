@@ -0,0 +1,45 @@
+"""
+Tests for PDF text extraction
+"""
+import os
+import sys
+
+import fitz
+import pytest
+
+# Import the modules to test
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.pdf.processor import PDFProcessor
+
+
+class TestPDFProcessor:
+    """Test cases for PDFProcessor"""
+
+    @pytest.fixture
+    def multi_page_pdf(self, temp_dirs):
+        """Create a three page PDF with one line of text per page"""
+        pdf_path = os.path.join(temp_dirs['scan_dir'], 'pages.pdf')
+        doc = fitz.open()
+        for page_num in range(3):
+            doc.new_page().insert_text((72, 72), f"Seite {page_num + 1}")
+        doc.save(pdf_path)
+        doc.close()
+        return pdf_path
+
+    def test_extract_text_all_pages(self, multi_page_pdf):
+        """Test text of all pages up to max_pages is joined"""
+        text = PDFProcessor(max_pages=3).extract_text(multi_page_pdf)
+
+        assert "Seite 1" in text
+        assert "Seite 3" in text
+
+    def test_extract_text_stops_at_max_chars(self, multi_page_pdf):
+        """Test later pages are skipped once the character budget is reached"""
+        text = PDFProcessor(max_pages=3).extract_text(multi_page_pdf, max_chars=5)
+
+        assert text == "Seite"
+
+    def test_extract_text_missing_file(self):
+        """Test missing files return empty text"""
+        assert PDFProcessor().extract_text("/nonexistent/file.pdf") == ""
@@ -190,6 +190,18 @@ class TestRateLimiter:
         limiter.cleanup_old_entries()
         assert len(limiter.buckets) == 0
 
+    def test_rate_limiter_sweeps_idle_buckets_periodically(self):
+        """Test idle buckets are removed by is_allowed once the interval passed"""
+        limiter = RateLimiter()
+        limiter.is_allowed("idle")
+        limiter.buckets["idle"]['last_update'] = time.time() - 7200
+        limiter._next_cleanup = 0
+
+        limiter.is_allowed("active")
+        limiter.get_rate_limit_info("unknown")
+
+        assert set(limiter.buckets) == {"active"}
+
 
 class TestPerformanceMonitor:
     """Test performance monitoring functionality"""
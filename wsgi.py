@@ -0,0 +1,21 @@
+"""
+WSGI entry point for production servers
+
+The root app.py module is shadowed by the app/ package, so `gunicorn app:app`
+cannot import it. This module loads app.py from its file path instead:
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+_spec = importlib.util.spec_from_file_location(
+    'document_sorter_main', Path(__file__).with_name('app.py')
+)
+_module = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = _module
+_spec.loader.exec_module(_module)
+
+app = _module.app